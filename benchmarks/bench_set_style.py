@@ -0,0 +1,160 @@
+import os
+import re
+import sys
+import time
+import argparse
+import statistics
+from typing import Any, Callable, List, Tuple
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from PySide2.QtWidgets import QApplication, QMainWindow, QWidget, QScrollArea, QGridLayout, QLabel, \
+    QPushButton, QLineEdit, QCheckBox, QComboBox  # noqa: E402
+from PySide2.QtGui import QPalette, QColor  # noqa: E402
+from qtmodernredux import QtModernRedux  # noqa: E402
+from qtmodernredux.apl_style import Style  # noqa: E402
+from qtmodernredux.qss import scope_stylesheet  # noqa: E402
+from qtmodernredux.windowstyle import QSS_CLASS  # noqa: E402
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Measures a full-application dark/light style switch on a UI with thousands of widgets:
+* 'set_style': QtModernRedux.set_style(), which only applies what changed and updates all ModernWindows
+* 'apply_theme': calling the style's apply_theme() again and re-adding the window-chrome QSS (previous behaviour,
+  which leaves the ModernWindow frames in the old colors)
+The light style is the APL style with all grey colors inverted.
+Run: python benchmarks/bench_set_style.py [--widgets N] [--count N]
+"""
+
+
+def invert_greys(qss: str) -> str:
+    """Inverts all grey '#rrggbb' colors in a string"""
+    def invert(match: Any) -> str:
+        color = QColor(match.group(0))
+        if color.red() == color.green() == color.blue():
+            return QColor(255 - color.red(), 255 - color.green(), 255 - color.blue()).name()
+        return str(match.group(0))
+    return re.sub(r'#[0-9a-fA-F]{6}\b', invert, qss)
+
+
+class LightWindowConstants(Style.window):  # type: ignore
+    """Inverted APL window constants"""
+    TITLE_BAR_COLOR_RGB: str = invert_greys(Style.window.TITLE_BAR_COLOR_RGB)
+    TITLE_BAR_NOFOCUS_COLOR_RGB: str = invert_greys(Style.window.TITLE_BAR_NOFOCUS_COLOR_RGB)
+    TITLE_BAR_FONT_COLOR_RGB: str = invert_greys(Style.window.TITLE_BAR_FONT_COLOR_RGB)
+    WINDOW_BACKGROUND_RGB: str = invert_greys(Style.window.WINDOW_BACKGROUND_RGB)
+
+
+class LightStyle:
+    """The APL style with inverted greys"""
+    window = LightWindowConstants
+    widget = Style.widget
+    __window_qss = invert_greys(Style.get_window_stylesheet())
+    __title_tabwidget_qss = invert_greys(Style.get_title_tabwidget_stylesheet())
+    __fragments = [(class_names, invert_greys(qss)) for class_names, qss in Style.get_widget_stylesheet_fragments()]
+
+    @staticmethod
+    def get_window_stylesheet() -> str:
+        """Returns the window-chrome QSS"""
+        return LightStyle.__window_qss
+
+    @staticmethod
+    def get_title_tabwidget_stylesheet() -> str:
+        """Returns the title-bar tab widget QSS"""
+        return LightStyle.__title_tabwidget_qss
+
+    @staticmethod
+    def get_widget_stylesheet_fragments() -> List[Tuple[Tuple[str, ...], str]]:
+        """Returns the widget QSS fragments"""
+        return LightStyle.__fragments
+
+    @staticmethod
+    def get_widget_stylesheet() -> str:
+        """Returns the widget QSS"""
+        return ''.join([qss for _, qss in LightStyle.__fragments])
+
+    @staticmethod
+    def get_palette() -> QPalette:
+        """Returns the APL palette with inverted greys"""
+        palette = Style.get_palette()
+        for group in [QPalette.Active, QPalette.Inactive, QPalette.Disabled]:
+            for role in range(QPalette.NColorRoles):
+                color = palette.color(group, QPalette.ColorRole(role))
+                palette.setColor(group, QPalette.ColorRole(role), QColor(invert_greys(color.name())))
+        return palette
+
+    @staticmethod
+    def apply_theme(app: Any) -> None:
+        """Applies the style to the application"""
+        app.setStyle('Fusion')
+        app.setPalette(LightStyle.get_palette())
+        app.setStyleSheet(LightStyle.get_widget_stylesheet())
+
+
+def make_window(widget_count: int) -> Any:
+    """Returns a wrapped main window with (roughly) the given number of widgets"""
+    content = QWidget()
+    layout = QGridLayout(content)
+    factories: List[Callable[[], QWidget]] = [lambda: QLabel('Label'), lambda: QPushButton('Button'),
+                                              lambda: QLineEdit('Text'), lambda: QCheckBox('Check'), QComboBox]
+    count = 0
+    while count < widget_count:  # count internal child widgets too, e.g. the line edit of a combo-box
+        widget = factories[layout.count() % len(factories)]()
+        layout.addWidget(widget, layout.count() // len(factories), layout.count() % len(factories))
+        count += 1 + len(widget.findChildren(QWidget))
+    scroll_area = QScrollArea()
+    scroll_area.setWidget(content)
+    main_window = QMainWindow()
+    main_window.setCentralWidget(scroll_area)
+    window = QtModernRedux.wrap(main_window)
+    window.resize(1024, 768)
+    window.show()
+    return window
+
+
+def apply_theme(style: Any) -> None:
+    """Previous behaviour: re-applies the whole style"""
+    app = QApplication.instance()
+    style.apply_theme(app)
+    window_qss = scope_stylesheet(style.get_window_stylesheet(), '.%s' % QSS_CLASS)
+    app.setStyleSheet('%s\n%s' % (app.styleSheet(), window_qss))
+
+
+def measure(switch: Callable[[Any], None], style: Any, window: Any) -> float:
+    """Returns the time in milliseconds it takes to switch to a style and repaint the window"""
+    app = QApplication.instance()
+    start = time.perf_counter()
+    switch(style)
+    app.processEvents()
+    window.grab()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results"""
+    parser = argparse.ArgumentParser(description='Measures a full-application style switch')
+    parser.add_argument('--widgets', type=int, default=5000, help='number of widgets in the window')
+    parser.add_argument('--count', type=int, default=3, help='number of dark/light round trips')
+    args = parser.parse_args()
+    app = QtModernRedux.QApplication(sys.argv[:1])
+    window = make_window(args.widgets)
+    app.processEvents()
+    window.grab()
+    print('%d widgets' % len(window.findChildren(QWidget)))  # includes the window frame's widgets
+    for label, switch in [('set_style', QtModernRedux.set_style), ('apply_theme', apply_theme)]:
+        dark: List[float] = []
+        light: List[float] = []
+        for _ in range(args.count):
+            light.append(measure(switch, LightStyle, window))
+            dark.append(measure(switch, Style, window))
+        print('%-12s dark -> light %8.1f ms   light -> dark %8.1f ms' % (label, statistics.median(light),
+                                                                         statistics.median(dark)))
+        if switch == QtModernRedux.set_style:
+            unchanged = [measure(switch, Style, window) for _ in range(args.count)]
+            print('%-12s unchanged     %8.1f ms' % (label, statistics.median(unchanged)))
+
+
+if __name__ == '__main__':
+    main()
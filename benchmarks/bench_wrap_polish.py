@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import argparse
+from typing import Any, Callable, List
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from PySide2.QtWidgets import QMainWindow, QMessageBox, QWidget  # noqa: E402
+from qtmodernredux import QtModernRedux  # noqa: E402
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Measures the time it takes to wrap and polish a window:
+* 'app-scoped': window-chrome QSS is part of the application style-sheet (current behaviour)
+* 'per-window': additionally sets the window-chrome QSS on each ModernWindow (previous behaviour)
+Run: python benchmarks/bench_wrap_polish.py [--count N]
+"""
+
+
+def wrap_and_polish(factory: Callable[[], QWidget], per_window_qss: bool) -> Any:
+    """Wraps a window and polishes the wrapper and all of its children"""
+    window = QtModernRedux.wrap(factory())
+    if per_window_qss:
+        window.setStyleSheet(window.get_style().get_window_stylesheet())
+    window.ensurePolished()
+    for child in window.findChildren(QWidget):
+        child.ensurePolished()
+    return window
+
+
+def measure(factory: Callable[[], QWidget], per_window_qss: bool, count: int) -> float:
+    """Returns the average time per wrap in milliseconds"""
+    windows: List[Any] = []
+    start = time.perf_counter()
+    for _ in range(count):
+        windows.append(wrap_and_polish(factory, per_window_qss))
+    elapsed = time.perf_counter() - start
+    for window in windows:
+        window.deleteLater()
+    return elapsed * 1000.0 / count
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results"""
+    parser = argparse.ArgumentParser(description='Measures wrap and polish time per window')
+    parser.add_argument('--count', type=int, default=200, help='number of wraps per measurement')
+    args = parser.parse_args()
+    app = QtModernRedux.QApplication(sys.argv[:1])
+    measure(QMainWindow, False, 10)  # warm-up
+    app.processEvents()
+    for name, factory in [('QMainWindow', QMainWindow), ('QMessageBox', QMessageBox)]:
+        for label, per_window_qss in [('per-window (before)', True), ('app-scoped (after)', False)]:
+            ms = measure(factory, per_window_qss, args.count)
+            app.processEvents()
+            print('%-12s %-20s %8.3f ms/wrap' % (name, label, ms))
+
+
+if __name__ == '__main__':
+    main()
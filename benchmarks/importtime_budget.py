@@ -0,0 +1,105 @@
+import os
+import re
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Set, Tuple
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Import-time budget test. Runs import statements with 'python -X importtime' in fresh processes and fails if a module
+is imported which the statement must not import, e.g. Qt for 'import qtmodernredux'.
+Import times depend on the machine, so budgets are multiples of a reference import measured in the same run, e.g.
+'import typing'. Exceeding a budget (best of --repeat runs, scaled by --scale) is reported as SLOW, but only fails the
+test with --strict.
+Run: python benchmarks/importtime_budget.py [--repeat N] [--scale FACTOR] [--strict]
+"""
+
+
+SRC_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+QT_MODULES: List[str] = ['PySide2', 'shiboken2']
+WINDOW_MODULES: List[str] = ['PySide2.QtSvg', 'qtmodernredux.windowstyle.modernwindow',
+                             'qtmodernredux.windowstyle.windowresizer', 'qtmodernredux.windowstyle.windowtitlelabel',
+                             'qtmodernredux.windowstyle.windowframe', 'qtmodernredux.windowstyle.windowshadow',
+                             'qtmodernredux.windowstyle.tabfilter', 'qtmodernredux.windowstyle.dialogpool',
+                             'qtmodernredux.svgcache']
+REFERENCE_PYTHON: str = 'import typing'  # imported by every qtmodernredux module
+REFERENCE_QT: str = 'from PySide2 import QtCore, QtGui, QtWidgets'
+# (import statement, modules which must not be imported (including their sub-modules), reference import statement,
+#  budget as a multiple of the reference's import time)
+BUDGETS: List[Tuple[str, List[str], str, float]] = [
+    ('import qtmodernredux', QT_MODULES, REFERENCE_PYTHON, 3.0),
+    ('from qtmodernredux.styles import StyleRegistry', QT_MODULES + ['importlib.metadata'], REFERENCE_PYTHON, 3.0),
+    ('from qtmodernredux.apl_style.windowstyle import Constants', QT_MODULES, REFERENCE_PYTHON, 3.0),
+    ('from qtmodernredux.apl_style.widgetstyle import Constants', QT_MODULES, REFERENCE_PYTHON, 3.0),
+    ('import qtmodernredux.qss', QT_MODULES, REFERENCE_PYTHON, 3.0),
+    ('from qtmodernredux import QtModernRedux',
+     WINDOW_MODULES + ['qtmodernredux.apl_style.style', 'qtmodernredux.apl_style.proxystyle',
+                       'qtmodernredux.resources.qt_resources', 'importlib.metadata'], REFERENCE_QT, 2.0),
+]
+
+
+def measure(statement: str, startup_modules: Set[str]) -> Tuple[float, Set[str]]:
+    """
+    Runs a statement in a fresh process. Returns its total import time in milliseconds and the names of the modules
+    it imported, without the interpreter's own start-up imports (startup_modules), e.g. 'site'
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_PATH)
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], check=True, env=env,
+                            stderr=subprocess.PIPE, universal_newlines=True).stderr
+    modules: Set[str] = set()
+    total_ms = 0.0
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match is None or match.group(4) in startup_modules:
+            continue
+        modules.add(match.group(4))
+        if len(match.group(3)) == 1:  # top-level import
+            total_ms += int(match.group(2)) / 1000.0
+    return total_ms, modules
+
+
+def is_forbidden(module: str, forbidden: List[str]) -> bool:
+    """Returns True if the module or one of its parent packages is forbidden"""
+    return any(module == name or module.startswith(name + '.') for name in forbidden)
+
+
+def measure_best(statement: str, startup_modules: Set[str], repeat: int) -> Tuple[float, Set[str]]:
+    """Runs a statement repeat times. Returns the fastest import time and the modules imported by the first run"""
+    runs = [measure(statement, startup_modules) for _ in range(repeat)]
+    return min(total for total, _ in runs), runs[0][1]
+
+
+def main() -> None:
+    """Checks all budgets and exits with 1 if a forbidden module is imported, or with --strict, a budget is exceeded"""
+    parser = argparse.ArgumentParser(description='Checks the import time of qtmodernredux')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per statement; the fastest run is used')
+    parser.add_argument('--scale', type=float, default=1.0, help='factor applied to all budgets')
+    parser.add_argument('--strict', action='store_true', help='fail if an import exceeds its budget')
+    args = parser.parse_args()
+    failed = False
+    startup_modules = measure('pass', set())[1]
+    references: Dict[str, float] = {}
+    for statement, forbidden, reference, factor in BUDGETS:
+        if reference not in references:
+            references[reference] = measure_best(reference, startup_modules, args.repeat)[0]
+        budget_ms = references[reference] * factor * args.scale
+        total_ms, modules = measure_best(statement, startup_modules, args.repeat)
+        imported = sorted(name for name in modules if is_forbidden(name, forbidden))
+        slow = total_ms > budget_ms
+        failed = failed or bool(imported) or (slow and args.strict)
+        status = 'FAIL' if imported else 'SLOW' if slow else 'OK'
+        print('%-4s %-58s %8.1f ms (budget %6.1f ms = %.1fx %s)' % (status, statement, total_ms, budget_ms,
+                                                                    factor * args.scale, reference))
+        if imported:
+            print('     must not import: %s' % ', '.join(imported))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+import argparse
+from typing import Callable, Dict, List, Tuple
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from PySide2.QtCore import Qt  # noqa: E402
+from PySide2.QtGui import QImage  # noqa: E402
+from PySide2.QtWidgets import QApplication, QWidget, QPushButton, QComboBox, QScrollBar, QSlider, QTabWidget, \
+    QSpinBox, QCheckBox, QRadioButton, QLineEdit, QMainWindow  # noqa: E402
+from qtmodernredux import QtModernRedux  # noqa: E402
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Compares the QSS engine with the native (QProxyStyle) engine of the APL style:
+* visual parity: renders the same widgets with both engines and reports the size difference and the mean
+  per-pixel color difference (0 = identical, 255 = inverted)
+* speed: time to polish and paint the widgetgallery example's main window
+Run: python benchmarks/parity_native_engine.py [--save DIR]
+"""
+
+
+def make_widgets() -> List[Tuple[str, QWidget]]:
+    """Returns the widgets which are compared"""
+    def configure(widget: QWidget, setup: Callable[[QWidget], None]) -> QWidget:
+        setup(widget)
+        return widget
+
+    tabs = QTabWidget()
+    tabs.addTab(QWidget(), 'First')
+    tabs.addTab(QWidget(), 'Second')
+    combo = QComboBox()
+    combo.addItems(['Item 1', 'Item 2'])
+    editable_combo = QComboBox()
+    editable_combo.setEditable(True)
+    editable_combo.addItems(['Item 1', 'Item 2'])
+    return [
+        ('QPushButton', QPushButton('Button')),
+        ('QPushButton:checked', configure(QPushButton('Button'), lambda w: (w.setCheckable(True), w.setChecked(True)))),
+        ('QPushButton:disabled', configure(QPushButton('Button'), lambda w: w.setEnabled(False))),
+        ('QPushButton:flat', configure(QPushButton('Button'), lambda w: w.setFlat(True))),
+        ('QComboBox', combo),
+        ('QComboBox:editable', editable_combo),
+        ('QLineEdit', QLineEdit('Text')),
+        ('QSpinBox', QSpinBox()),
+        ('QScrollBar:horizontal', configure(QScrollBar(Qt.Horizontal), lambda w: w.setRange(0, 100))),
+        ('QScrollBar:vertical', configure(QScrollBar(Qt.Vertical), lambda w: w.setRange(0, 100))),
+        ('QSlider', configure(QSlider(Qt.Horizontal), lambda w: w.setValue(50))),
+        ('QCheckBox', QCheckBox('Check')),
+        ('QCheckBox:checked', configure(QCheckBox('Check'), lambda w: w.setChecked(True))),
+        ('QRadioButton', QRadioButton('Radio')),
+        ('QRadioButton:checked', configure(QRadioButton('Radio'), lambda w: w.setChecked(True))),
+        ('QTabWidget', tabs),
+    ]
+
+
+def render_widgets() -> Dict[str, QImage]:
+    """Renders all widgets at a fixed width using the currently active engine"""
+    images: Dict[str, QImage] = {}
+    for name, widget in make_widgets():
+        if isinstance(widget, QScrollBar) and widget.orientation() == Qt.Vertical:
+            widget.resize(widget.sizeHint().width(), 160)
+        else:
+            widget.resize(160, widget.sizeHint().height())
+        widget.ensurePolished()
+        images[name] = widget.grab().toImage().convertToFormat(QImage.Format_ARGB32)
+        widget.deleteLater()
+    return images
+
+
+def compare(image_a: QImage, image_b: QImage) -> float:
+    """Returns the mean per-channel difference of the overlapping area of two images"""
+    width = min(image_a.width(), image_b.width())
+    height = min(image_a.height(), image_b.height())
+    total = 0
+    for y in range(height):
+        for x in range(width):
+            a = image_a.pixelColor(x, y)
+            b = image_b.pixelColor(x, y)
+            total += abs(a.red() - b.red()) + abs(a.green() - b.green()) + abs(a.blue() - b.blue())
+    return total / float(max(1, width * height * 3))
+
+
+def time_gallery() -> float:
+    """Returns the time in milliseconds it takes to polish and paint the widgetgallery main window"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'examples',
+                                    'widgetgallery'))
+    from mainwindow_ui import Ui_MainWindow  # pylint: disable=import-outside-toplevel,import-error
+    start = time.perf_counter()
+    window = QMainWindow()
+    Ui_MainWindow().setupUi(window)
+    window.resize(1024, 768)
+    window.grab()
+    elapsed = time.perf_counter() - start
+    window.deleteLater()
+    return elapsed * 1000.0
+
+
+def main() -> None:
+    """Renders the widgets with both engines and prints the results"""
+    parser = argparse.ArgumentParser(description='Compares the QSS and native engines of the APL style')
+    parser.add_argument('--save', help='directory to save the rendered widgets to')
+    args = parser.parse_args()
+    app = QtModernRedux.QApplication(sys.argv[:1], engine=QtModernRedux.ENGINE_QSS)
+    qss_images = render_widgets()
+    qss_ms = time_gallery()
+    app.setStyleSheet('')
+    QtModernRedux.get_style('APL').apply_native_theme(app)  # type: ignore
+    native_images = render_widgets()
+    native_ms = time_gallery()
+    print('%-24s %-16s %-16s %s' % ('widget', 'size (qss)', 'size (native)', 'mean diff'))
+    for name, qss_image in qss_images.items():
+        native_image = native_images[name]
+        print('%-24s %-16s %-16s %6.2f' % (name,
+                                           '%dx%d' % (qss_image.width(), qss_image.height()),
+                                           '%dx%d' % (native_image.width(), native_image.height()),
+                                           compare(qss_image, native_image)))
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            file_name = name.replace(':', '_')
+            qss_image.save(os.path.join(args.save, '%s.qss.png' % file_name))
+            native_image.save(os.path.join(args.save, '%s.native.png' % file_name))
+    print('widgetgallery polish + paint: qss %.1f ms, native %.1f ms' % (qss_ms, native_ms))
+    QApplication.processEvents()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Headless benchmark suite. Every sample runs in a fresh process (QT_QPA_PLATFORM=offscreen), so each case starts
+from a cold QApplication and cases can't influence each other. Cases:
+* startup:              QtModernRedux.QApplication()
+* apply_theme_gallery:  the style's apply_theme() with the widgetgallery example's main window shown, until the
+                        window is re-polished and painted
+* wrap_qmainwindow:     QtModernRedux.wrap() + polish of a QMainWindow, average per wrap
+* wrap_qmessagebox:     QtModernRedux.wrap() + polish of a QMessageBox, average per wrap
+* wrap_sequential_1000: 1000 sequential wrap, show, close and delete cycles of a QMainWindow, in total
+* drag_move:            title-bar drag of a wrapped QMainWindow with a 1000 Hz mouse, average time per mouse-move
+                        event until the window has its final geometry; 1 ms if the window keeps up with the mouse
+* drag_resize:          the same for dragging the right window edge. The geometry updates (layout passes) and the
+                        frames painted during the gesture are printed to stderr
+* drag_resize_draft:    the same with the lowest rendering quality during the gesture (set_interaction_mode(): no
+                        drop-shadow, draft frame, frozen content)
+* repaint_window:       synchronous repaint of a shown, wrapped QMainWindow of 1024x768, including its drop-shadow
+* repaint_child:        synchronous repaint of a QLineEdit in that window, e.g. for a key press
+The drag cases measure the Python move/resize path. With wrap(system_move_resize=True), the window manager moves and
+resizes the window instead, which synthesized mouse events can't drive, and no Python code runs per mouse event.
+Results are written as JSON (--output). With --compare, results are compared with a stored baseline file and the
+exit code is 1 if any case is slower than the baseline by more than the threshold.
+Run: python benchmarks/suite.py [--repeat N] [--case NAME ...] [--output FILE] [--compare BASELINE]
+"""
+
+
+RESULTS_VERSION: int = 1
+DEFAULT_REPEAT: int = 5
+DEFAULT_THRESHOLD: float = 0.15  # relative slow-down of the median which counts as a regression
+WRAP_COUNT: int = 50  # wraps per sample of the wrap_* cases
+SEQUENTIAL_WRAP_COUNT: int = 1000
+DRAG_EVENT_COUNT: int = 500  # mouse-move events per sample of the drag_* cases
+DRAG_EVENT_INTERVAL_S: float = 0.001  # a 1000 Hz mouse
+REPAINT_COUNT: int = 200  # repaints per sample of the repaint_* cases
+GALLERY_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'examples', 'widgetgallery')
+
+
+def create_app() -> Any:
+    """Returns a new QtModernRedux application"""
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    return QtModernRedux.QApplication(sys.argv[:1])
+
+
+def measure_wraps(factory_name: str, count: int) -> float:
+    """Returns the average time in milliseconds to wrap and polish a window"""
+    from PySide2.QtCore import QCoreApplication, QEvent  # pylint: disable=import-outside-toplevel
+    from PySide2.QtWidgets import QWidget, QMainWindow, QMessageBox  # pylint: disable=import-outside-toplevel
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    factory: Callable[[], QWidget] = {'QMainWindow': QMainWindow, 'QMessageBox': QMessageBox}[factory_name]
+    app = create_app()
+    windows: List[Any] = [QtModernRedux.wrap(factory())]  # warm-up: first polish of each widget class
+    windows[0].ensurePolished()
+    app.processEvents()
+    start = time.perf_counter()
+    for _ in range(count):
+        window = QtModernRedux.wrap(factory())
+        window.ensurePolished()
+        for child in window.findChildren(QWidget):
+            child.ensurePolished()
+        windows.append(window)
+    elapsed = time.perf_counter() - start
+    for window in windows:
+        window.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return elapsed * 1000.0 / count
+
+
+def measure_drag(resize: bool, count: int, draft: bool = False) -> float:
+    """
+    Returns the average time in milliseconds per mouse-move event of a drag gesture, from the first event until the
+    window has the geometry of the release position. Events are sent every DRAG_EVENT_INTERVAL_S, or right away if
+    the window lags behind, like queued events of the window system.
+    """
+    from PySide2.QtCore import QEvent, QPoint, QPointF  # pylint: disable=import-outside-toplevel
+    from PySide2.QtGui import Qt, QMouseEvent  # pylint: disable=import-outside-toplevel
+    from PySide2.QtWidgets import QApplication, QMainWindow  # pylint: disable=import-outside-toplevel
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    from qtmodernredux.windowstyle import WindowResizer  # pylint: disable=import-outside-toplevel
+    app = create_app()
+    window = QtModernRedux.wrap(QMainWindow(), system_move_resize=False)
+    if draft:
+        window.set_interaction_mode(suspend_shadow=True, draft_frame=True, freeze_content=True)
+    window.resize(800, 600)
+    window.show()
+    app.processEvents()
+    handle = window.windowHandle()
+    radius = window.get_style().window.SHADOW_RADIUS_PX if window.use_shadow else 0
+    if resize:
+        pos = QPoint(window.width() - radius - 1, window.height() // 2)  # right window edge
+    else:
+        pos = QPoint(window.width() // 2, radius + window.titlebar_height // 2)  # title-bar
+    global_pos = window.mapToGlobal(pos)
+
+    def send(event_type: Any, delta: QPoint, button: Any, buttons: Any) -> None:
+        """Sends a mouse event to the window, like the window system does"""
+        event = QMouseEvent(event_type, QPointF(pos + delta), QPointF(pos + delta), QPointF(global_pos + delta),
+                            button, buttons, Qt.NoModifier)
+        QApplication.sendEvent(handle, event)
+
+    send(QEvent.MouseButtonPress, QPoint(0, 0), Qt.LeftButton, Qt.LeftButton)
+    geometry = window.geometry()
+    start = time.perf_counter()
+    next_event = start
+    for i in range(count):
+        send(QEvent.MouseMove, QPoint(i * 100 // count + 1, 0), Qt.NoButton, Qt.LeftButton)
+        next_event += DRAG_EVENT_INTERVAL_S
+        app.processEvents()  # delivers the resulting move / resize events
+        while time.perf_counter() < next_event:
+            app.processEvents()
+    send(QEvent.MouseButtonRelease, QPoint(100, 0), Qt.LeftButton, Qt.NoButton)
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    expected = geometry.adjusted(0, 0, 100, 0) if resize else geometry.translated(100, 0)
+    assert window.geometry() == expected, "ERROR: wrong final geometry %s" % window.geometry()
+    if resize:
+        resizer = window.findChildren(WindowResizer)[0]
+        print('%d mouse-move events, %d layout passes, %d frames' %
+              (resizer.get_gesture_stats() + (window.get_interaction_frame_count(),)), file=sys.stderr)
+    return elapsed * 1000.0 / count
+
+
+def measure_repaint(child: bool, count: int) -> float:
+    """Returns the average time in milliseconds of a synchronous repaint of a wrapped window, or of a child widget"""
+    from PySide2.QtWidgets import QMainWindow, QLineEdit  # pylint: disable=import-outside-toplevel
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    app = create_app()
+    main_window = QMainWindow()
+    line_edit = QLineEdit('text')
+    main_window.setCentralWidget(line_edit)
+    window = QtModernRedux.wrap(main_window)
+    window.resize(1024, 768)
+    window.show()
+    app.processEvents()
+    widget = line_edit if child else window
+    widget.repaint()  # warm-up: pixmap caches
+    start = time.perf_counter()
+    for _ in range(count):
+        widget.repaint()
+    return (time.perf_counter() - start) * 1000.0 / count
+
+
+def case_startup() -> float:
+    """QtModernRedux.QApplication() startup"""
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    start = time.perf_counter()
+    QtModernRedux.QApplication(sys.argv[:1])
+    return (time.perf_counter() - start) * 1000.0
+
+
+def case_apply_theme_gallery() -> float:
+    """apply_theme() with the widgetgallery main window shown"""
+    sys.path.insert(0, GALLERY_PATH)
+    from PySide2.QtWidgets import QMainWindow  # pylint: disable=import-outside-toplevel
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    from mainwindow_ui import Ui_MainWindow  # pylint: disable=import-outside-toplevel,import-error
+    app = create_app()
+    window = QMainWindow()
+    Ui_MainWindow().setupUi(window)
+    window.resize(1024, 768)
+    window.show()
+    app.processEvents()
+    window.grab()
+    style = QtModernRedux.get_style('APL')
+    start = time.perf_counter()
+    style.apply_theme(app)  # type: ignore
+    app.processEvents()
+    window.grab()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def case_wrap_qmainwindow() -> float:
+    """QtModernRedux.wrap() + polish of a QMainWindow"""
+    return measure_wraps('QMainWindow', WRAP_COUNT)
+
+
+def case_wrap_qmessagebox() -> float:
+    """QtModernRedux.wrap() + polish of a QMessageBox"""
+    return measure_wraps('QMessageBox', WRAP_COUNT)
+
+
+def case_wrap_sequential_1000() -> float:
+    """1000 sequential wrap, show, close and delete cycles"""
+    from PySide2.QtCore import QCoreApplication, QEvent  # pylint: disable=import-outside-toplevel
+    from PySide2.QtWidgets import QMainWindow  # pylint: disable=import-outside-toplevel
+    from qtmodernredux import QtModernRedux  # pylint: disable=import-outside-toplevel
+    app = create_app()
+    start = time.perf_counter()
+    for _ in range(SEQUENTIAL_WRAP_COUNT):
+        window = QtModernRedux.wrap(QMainWindow())
+        window.show()
+        app.processEvents()
+        window.close()
+        window.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def case_drag_move() -> float:
+    """Title-bar drag, average time per mouse-move event"""
+    return measure_drag(False, DRAG_EVENT_COUNT)
+
+
+def case_drag_resize() -> float:
+    """Window edge drag, average time per mouse-move event"""
+    return measure_drag(True, DRAG_EVENT_COUNT)
+
+
+def case_drag_resize_draft() -> float:
+    """Window edge drag in draft quality, average time per mouse-move event"""
+    return measure_drag(True, DRAG_EVENT_COUNT, draft=True)
+
+
+def case_repaint_window() -> float:
+    """Repaint of a wrapped window, average per repaint"""
+    return measure_repaint(False, REPAINT_COUNT)
+
+
+def case_repaint_child() -> float:
+    """Repaint of a line edit in a wrapped window, average per repaint"""
+    return measure_repaint(True, REPAINT_COUNT)
+
+
+CASES: Dict[str, Callable[[], float]] = {
+    'startup': case_startup,
+    'apply_theme_gallery': case_apply_theme_gallery,
+    'wrap_qmainwindow': case_wrap_qmainwindow,
+    'wrap_qmessagebox': case_wrap_qmessagebox,
+    'wrap_sequential_1000': case_wrap_sequential_1000,
+    'drag_move': case_drag_move,
+    'drag_resize': case_drag_resize,
+    'drag_resize_draft': case_drag_resize_draft,
+    'repaint_window': case_repaint_window,
+    'repaint_child': case_repaint_child,
+}
+
+
+def run_sample(case: str) -> float:
+    """Runs a single sample of a case in a fresh process and returns its time in milliseconds"""
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--sample', case],
+                            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return float(json.loads(output.strip().splitlines()[-1])['ms'])
+
+
+def get_environment() -> Dict[str, str]:
+    """Returns the versions the results were measured with"""
+    import PySide2  # pylint: disable=import-outside-toplevel
+    from PySide2 import QtCore  # pylint: disable=import-outside-toplevel
+    return {
+        'python': platform.python_version(),
+        'pyside2': PySide2.__version__,
+        'qt': str(QtCore.qVersion()),
+        'platform': platform.platform(),
+        'qpa_platform': os.environ.get('QT_QPA_PLATFORM', ''),
+    }
+
+
+def run_suite(cases: List[str], repeat: int) -> Dict[str, Any]:
+    """Runs all cases and returns the results"""
+    results: Dict[str, Any] = {}
+    for case in cases:
+        samples = [run_sample(case) for _ in range(repeat)]
+        results[case] = {
+            'median_ms': statistics.median(samples),
+            'min_ms': min(samples),
+            'max_ms': max(samples),
+            'samples_ms': samples,
+        }
+        print('%-24s median %10.3f ms   min %10.3f ms' % (case, results[case]['median_ms'], results[case]['min_ms']),
+              file=sys.stderr)
+    return {'version': RESULTS_VERSION, 'environment': get_environment(), 'repeat': repeat, 'results': results}
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Prints a comparison of two result sets and returns the names of the cases which regressed"""
+    assert baseline.get('version') == RESULTS_VERSION, "ERROR: unsupported baseline version"
+    regressions: List[str] = []
+    print('%-24s %14s %14s %9s' % ('case', 'baseline ms', 'current ms', 'change'))
+    for case, result in current['results'].items():
+        base: Optional[Dict[str, Any]] = baseline['results'].get(case)
+        if base is None:
+            print('%-24s %14s %14.3f %9s' % (case, '-', result['median_ms'], 'new'))
+            continue
+        change = result['median_ms'] / base['median_ms'] - 1.0 if base['median_ms'] > 0 else 0.0
+        regressed = change > threshold
+        if regressed:
+            regressions.append(case)
+        print('%-24s %14.3f %14.3f %+8.1f%%%s' % (case, base['median_ms'], result['median_ms'], change * 100.0,
+                                                  '  REGRESSION' if regressed else ''))
+    if baseline.get('environment') != current.get('environment'):
+        print('NOTE: the baseline was measured in a different environment: %s' % baseline.get('environment'))
+    return regressions
+
+
+def main() -> None:
+    """Runs the suite, writes and compares the results"""
+    parser = argparse.ArgumentParser(description='Headless QtModernRedux benchmark suite')
+    parser.add_argument('--case', action='append', choices=list(CASES.keys()), help='case to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='samples per case')
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON results to compare with')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slow-down which counts as a regression, e.g. 0.15 for 15%%')
+    parser.add_argument('--sample', choices=list(CASES.keys()), help=argparse.SUPPRESS)  # internal: one sample
+    args = parser.parse_args()
+    if args.sample:
+        print(json.dumps({'case': args.sample, 'ms': CASES[args.sample]()}))
+        return
+    results = run_suite(args.case or list(CASES.keys()), args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    elif not args.compare:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,18 +2,18 @@ from PySide2.QtWidgets import QApplication
 from PySide2.QtGui import QPalette, QColor
 import wow_style.widgetstyle as wgs
 import wow_style.windowstyle as wds
+from qtmodernredux.qss import QssTemplate, get_constants, minify
 
 
 class Style:
     window = wds.Constants
+    __window_template = QssTemplate(''.join([wds.frame_style, wds.buttons_style]))
 
     @staticmethod
     def get_window_stylesheet() -> str:
-        qss = ''.join([wds.frame_style, wds.buttons_style])
-        for var in vars(wds.Constants)['__annotations__']:
-            qss = qss.replace('{%s}' % var, str(getattr(wds.Constants, var)))
-        qss = qss.replace('{BUTTON_DIAMETER_HALF_PX}', str(wds.Constants.TITLE_BAR_BUTTON_DIAMETER_PX / 2))
-        return qss
+        values = get_constants(wds.Constants)
+        values['BUTTON_DIAMETER_HALF_PX'] = wds.Constants.TITLE_BAR_BUTTON_DIAMETER_PX / 2
+        return Style.__window_template.render(values)
 
     @staticmethod
     def get_title_tabwidget_style() -> str:
@@ -63,4 +63,4 @@ class Style:
         # apple theme
         app.setStyle('Fusion')  # type: ignore
         app.setPalette(palette)
-        app.setStyleSheet(style)
+        app.setStyleSheet(minify(style))
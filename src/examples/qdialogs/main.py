@@ -8,7 +8,8 @@ from mainwindow_ui import Ui_MainWindow
 """
 This example demonstates various styled QMessageBox dialogs, using enhanced notification icons,
 suitable for HighDPI and Retina displays. 
-This example also demonstrates setting an icon for the application.
+This example also demonstrates setting an icon for the application, and the dialog pool, which builds the message
+boxes in advance and recycles them after they are closed.
 """
 
 
@@ -44,7 +45,7 @@ class MainWindow(QMainWindow):
         self.show_msg_box(QMessageBox.NoIcon)
 
     def show_msg_box(self, icon):
-        msg = QtModernRedux.wrap(QMessageBox(self), parent=self, window_buttons_position=QtModernRedux.WINDOW_BUTTONS_RIGHT)
+        msg = QtModernRedux.message_box(parent=self, window_buttons_position=QtModernRedux.WINDOW_BUTTONS_RIGHT)
         msg.setIcon(icon)
         msg.setText("This is a message box")
         msg.setInformativeText("This is additional information")
@@ -60,4 +61,5 @@ if __name__ == "__main__":
                             window_buttons_position=QtModernRedux.WINDOW_BUTTONS_RIGHT)
     mw.setWindowIcon(QIcon("../example_data/sample.png"))
     mw.show()
+    QtModernRedux.enable_dialog_pool(size=1, window_buttons_position=QtModernRedux.WINDOW_BUTTONS_RIGHT)
     sys.exit(app.exec_())
@@ -1 +1,31 @@
-from .qtmodernredux import QtModernRedux
+import time
+from typing import TYPE_CHECKING, Any, Dict, List
+from qtmodernredux.lazyimport import get_lazy_attribute, get_lazy_dir
+
+if TYPE_CHECKING:
+    from qtmodernredux.qtmodernredux import QtModernRedux
+    from qtmodernredux.profiler import StartupProfiler
+    from qtmodernredux.svgcache import SvgPixmapCache
+
+
+# start of 'import qtmodernredux', the origin of the start-up profiler's times (see profiler.py)
+IMPORT_STARTED: float = time.perf_counter()
+
+# public classes, imported on first access (see lazyimport.py)
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    'QtModernRedux': 'qtmodernredux.qtmodernredux',
+    'StartupProfiler': 'qtmodernredux.profiler',
+    'SvgPixmapCache': 'qtmodernredux.svgcache',
+}
+
+__all__ = ['QtModernRedux', 'StartupProfiler', 'SvgPixmapCache']
+
+
+def __getattr__(name: str) -> Any:
+    """Imports public classes on first access"""
+    return get_lazy_attribute(__name__, LAZY_ATTRIBUTES, name)
+
+
+def __dir__() -> List[str]:
+    """Lists public classes which haven't been imported yet, too"""
+    return get_lazy_dir(__name__, LAZY_ATTRIBUTES)
@@ -1,3 +1,26 @@
-from qtmodernredux.apl_style.style import Style
+from typing import TYPE_CHECKING, Any, Dict, List
+from qtmodernredux.lazyimport import get_lazy_attribute, get_lazy_dir
 
-__all__ = ['Style']
+if TYPE_CHECKING:
+    from qtmodernredux.apl_style.style import Style
+    from qtmodernredux.apl_style.proxystyle import APLProxyStyle
+
+
+# public classes, imported on first access (see lazyimport.py). The constants and QSS of the windowstyle and
+# widgetstyle sub-packages don't require Qt.
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    'Style': 'qtmodernredux.apl_style.style',
+    'APLProxyStyle': 'qtmodernredux.apl_style.proxystyle',
+}
+
+__all__ = ['Style', 'APLProxyStyle']
+
+
+def __getattr__(name: str) -> Any:
+    """Imports public classes on first access"""
+    return get_lazy_attribute(__name__, LAZY_ATTRIBUTES, name)
+
+
+def __dir__() -> List[str]:
+    """Lists public classes which haven't been imported yet, too"""
+    return get_lazy_dir(__name__, LAZY_ATTRIBUTES)
@@ -0,0 +1,382 @@
+from typing import Any, Dict, Optional
+from PySide2.QtCore import QRect, QRectF, QSize
+import shiboken2
+from PySide2.QtWidgets import QProxyStyle, QStyle, QStyleOption, QStyleOptionButton, QStyleOptionComplex, \
+    QStyleOptionTab, QStyleOptionComboBox, QStyleOptionSpinBox, QStyleOptionSlider, QStyleOptionFrame, \
+    QStyleOptionToolButton, QTabBar
+from PySide2.QtGui import Qt, QColor, QPainter, QIcon, QPalette
+import qtmodernredux.apl_style.widgetstyle as wgs
+import qtmodernredux.apl_style.windowstyle as wds
+
+
+__author__ = "Robert Kist"
+
+
+"""
+QSS-free implementation of the APL widget look.
+APLProxyStyle paints the most common widgets directly, based on the application palette (see Style.get_palette())
+and the style's constants (the same ones the style-sheet templates use), instead of going through Qt's style-sheet
+engine. Widgets that are not covered
+(e.g. group boxes, header views, progress bars) use the palette-colored Fusion look.
+Select it with QtModernRedux.QApplication(..., engine=QtModernRedux.ENGINE_NATIVE).
+"""
+
+
+ARROW_ICON_SIZE_PX: int = 10
+ICON_ARROW_DOWN: str = ':/third_party/icons/arrow-down.svg'
+ICON_ARROW_UP: str = ':/third_party/icons/arrow-up.svg'
+WINDOW_BUTTONS = ('btnClose', 'btnMinimize', 'btnMaximize', 'btnRestore')
+# PySide2 passes style options to Python overrides as their base class; these are the sub-classes used here
+OPTION_TYPES: Dict[Any, Any] = {
+    QStyleOption.SO_Button: QStyleOptionButton,
+    QStyleOption.SO_Tab: QStyleOptionTab,
+    QStyleOption.SO_ComboBox: QStyleOptionComboBox,
+    QStyleOption.SO_SpinBox: QStyleOptionSpinBox,
+    QStyleOption.SO_Slider: QStyleOptionSlider,
+    QStyleOption.SO_Frame: QStyleOptionFrame,
+    QStyleOption.SO_ToolButton: QStyleOptionToolButton,
+}
+
+
+def cast_option(option: Any) -> Any:
+    """Returns the style option as its actual sub-class, e.g. QStyleOptionTab, so its specific fields are accessible"""
+    option_type = OPTION_TYPES.get(option.type)
+    if option_type is None or isinstance(option, option_type):
+        return option
+    return shiboken2.wrapInstance(shiboken2.getCppPointer(option)[0], option_type)
+
+
+class APLProxyStyle(QProxyStyle):
+    """Paints the APL widget look natively on top of Qt's Fusion style"""
+
+    def __init__(self, widget_constants: Any = wgs.Constants, window_constants: Any = wds.Constants) -> None:
+        """Constructor: sizes and colors are read from the style's widget and window Constants"""
+        super().__init__('Fusion')
+        self.__widget: Any = widget_constants
+        self.__window: Any = window_constants
+        self.__icons: Dict[str, QIcon] = {}
+        # outer sizes, including the borders and margins of the style-sheet templates
+        self.__field_height: int = widget_constants.FIELD_HEIGHT_PX + widget_constants.FOCUS_BORDER_PX * 2
+        self.__indicator_size: int = widget_constants.INDICATOR_SIZE_PX + widget_constants.INDICATOR_BORDER_PX * 2
+        self.__tab_height: int = widget_constants.TAB_HEIGHT_PX + widget_constants.TAB_MARGIN_TOP_PX + \
+            widget_constants.TAB_BORDER_TOP_PX + widget_constants.TAB_INDICATOR_PX
+
+    # ############################################################
+    # Overloaded Qt methods
+    # ############################################################
+
+    def pixelMetric(self, metric: Any, option: Optional[QStyleOption] = None, widget: Any = None) -> int:
+        """Qt pixelMetric: sizes of indicators, scroll-bars and sliders"""
+        if metric in (QStyle.PM_IndicatorWidth, QStyle.PM_IndicatorHeight,
+                      QStyle.PM_ExclusiveIndicatorWidth, QStyle.PM_ExclusiveIndicatorHeight):
+            return self.__indicator_size
+        if metric == QStyle.PM_ScrollBarExtent:
+            return int(self.__widget.SCROLLBAR_EXTENT_PX)
+        if metric == QStyle.PM_ScrollBarSliderMin:
+            return int(self.__widget.SCROLLBAR_SLIDER_MIN_PX)
+        if metric in (QStyle.PM_SliderLength, QStyle.PM_SliderControlThickness, QStyle.PM_SliderThickness):
+            return int(self.__widget.SLIDER_HANDLE_PX)
+        if metric in (QStyle.PM_TabBarBaseOverlap, QStyle.PM_TabBarBaseHeight):
+            return 0
+        return int(super().pixelMetric(metric, option, widget))
+
+    def sizeFromContents(self, contents_type: Any, option: QStyleOption, size: QSize,
+                         widget: Any = None) -> QSize:
+        """Qt sizeFromContents: buttons, combo-boxes, spin-boxes and line-edits share the same height"""
+        option = cast_option(option)
+        new_size: QSize = super().sizeFromContents(contents_type, option, size, widget)
+        if contents_type in (QStyle.CT_PushButton, QStyle.CT_ComboBox, QStyle.CT_SpinBox, QStyle.CT_LineEdit):
+            new_size.setHeight(self.__field_height)
+        elif contents_type == QStyle.CT_TabBarTab and option.shape in (QTabBar.RoundedNorth,
+                                                                       QTabBar.RoundedSouth):
+            new_size = QSize(size.width() + self.__widget.TAB_PADDING_PX * 2, self.__tab_height)
+        return new_size
+
+    def subControlRect(self, control: Any, option: QStyleOptionComplex, sub_control: Any,
+                       widget: Any = None) -> QRect:
+        """Qt subControlRect: scroll-bars have no arrow buttons"""
+        option = cast_option(option)
+        if control == QStyle.CC_ScrollBar:
+            return self.__get_scrollbar_rect(option, sub_control)
+        return super().subControlRect(control, option, sub_control, widget)
+
+    def drawPrimitive(self, element: Any, option: QStyleOption, painter: QPainter,
+                      widget: Any = None) -> None:
+        """Qt drawPrimitive: push-button panels, line-edits, check-box and radio-button indicators"""
+        option = cast_option(option)
+        if element == QStyle.PE_PanelButtonCommand:
+            self.__draw_button_panel(option, painter)
+        elif element == QStyle.PE_PanelLineEdit:
+            if option.lineWidth > 0:  # frame-less line-edits are part of a combo-box or spin-box
+                self.__draw_field(option, painter, option.palette.color(QPalette.Dark),
+                                  bool(option.state & QStyle.State_HasFocus))
+        elif element == QStyle.PE_IndicatorCheckBox:
+            self.__draw_indicator(option, painter, 0)
+        elif element == QStyle.PE_IndicatorRadioButton:
+            self.__draw_indicator(option, painter, self.__indicator_size / 2.0)
+        elif element in (QStyle.PE_FrameFocusRect, QStyle.PE_FrameLineEdit, QStyle.PE_FrameTabBarBase):
+            pass  # no focus rectangles; line-edit frames are drawn by PE_PanelLineEdit
+        elif element == QStyle.PE_FrameTabWidget:
+            painter.fillRect(QRect(option.rect.x(), option.rect.y(), option.rect.width(), 1),
+                             option.palette.color(QPalette.Dark))
+        else:
+            super().drawPrimitive(element, option, painter, widget)
+
+    def drawControl(self, element: Any, option: QStyleOption, painter: QPainter,
+                    widget: Any = None) -> None:
+        """Qt drawControl: push-button bevels and tab-bar tabs"""
+        option = cast_option(option)
+        if element == QStyle.CE_PushButtonBevel and isinstance(option, QStyleOptionButton) \
+                and option.features & QStyleOptionButton.Flat:
+            # the style-sheet draws flat buttons like regular ones
+            bevel_option = QStyleOptionButton(option)
+            bevel_option.features &= ~QStyleOptionButton.Flat
+            super().drawControl(element, bevel_option, painter, widget)
+        elif element == QStyle.CE_TabBarTabShape:
+            self.__draw_tab_shape(option, painter)
+        elif element == QStyle.CE_TabBarTabLabel:
+            label_option = QStyleOptionTab(option)
+            label_option.palette.setColor(QPalette.WindowText, self.__get_tab_text_color(option))
+            super().drawControl(element, label_option, painter, widget)
+        else:
+            super().drawControl(element, option, painter, widget)
+
+    def drawComplexControl(self, control: Any, option: QStyleOptionComplex, painter: QPainter,
+                           widget: Any = None) -> None:
+        """Qt drawComplexControl: combo-boxes, spin-boxes, scroll-bars, sliders and the window buttons"""
+        option = cast_option(option)
+        if control == QStyle.CC_ComboBox:
+            self.__draw_combobox(option, painter, widget)
+        elif control == QStyle.CC_SpinBox:
+            self.__draw_spinbox(option, painter, widget)
+        elif control == QStyle.CC_ScrollBar:
+            self.__draw_scrollbar(option, painter)
+        elif control == QStyle.CC_Slider:
+            self.__draw_slider(option, painter, widget)
+        elif control == QStyle.CC_ToolButton and widget is not None and widget.objectName() in WINDOW_BUTTONS:
+            self.__draw_window_button(option, painter, widget.objectName())
+        else:
+            super().drawComplexControl(control, option, painter, widget)
+
+    # ############################################################
+    # PRIVATE Custom methods
+    # ############################################################
+
+    def __get_icon(self, resource: str) -> QIcon:
+        """Returns a (cached) icon; icons are created on first use, after Qt resources have been registered"""
+        icon = self.__icons.get(resource)
+        if icon is None:
+            icon = QIcon(resource)
+            self.__icons[resource] = icon
+        return icon
+
+    def __draw_icon(self, painter: QPainter, rect: QRect, resource: str) -> None:
+        """Draws an icon centered in the given rectangle"""
+        size = min(ARROW_ICON_SIZE_PX, rect.width(), rect.height())
+        icon_rect = QRect(0, 0, size, size)
+        icon_rect.moveCenter(rect.center())
+        self.__get_icon(resource).paint(painter, icon_rect)
+
+    @staticmethod
+    def __draw_rounded_rect(painter: QPainter, rect: QRect, radius: float, color: QColor,
+                            border_color: Optional[QColor] = None, border_width: int = 0) -> None:
+        """Draws an anti-aliased, optionally bordered, rounded rectangle"""
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        if border_color is not None and border_width > 0:
+            painter.setBrush(border_color)
+            painter.drawRoundedRect(QRectF(rect), radius, radius)
+            rect = rect.adjusted(border_width, border_width, -border_width, -border_width)
+            radius = max(0.0, radius - border_width)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(rect), radius, radius)
+        painter.restore()
+
+    def __draw_field(self, option: QStyleOption, painter: QPainter, background: QColor, focus: bool) -> None:
+        """Draws the rounded background of buttons, combo-boxes, spin-boxes and line-edits"""
+        rect = option.rect.adjusted(0, 0, -1, 0)
+        radius: int = self.__widget.CORNER_RADIUS_PX
+        if not option.state & QStyle.State_Enabled:
+            self.__draw_rounded_rect(painter, rect.adjusted(1, 1, -1, -1), radius, QColor(Qt.transparent),
+                                     option.palette.color(QPalette.Midlight), 1)
+        elif focus:
+            self.__draw_rounded_rect(painter, rect, radius, background,
+                                     option.palette.color(QPalette.Highlight), self.__widget.FOCUS_BORDER_PX)
+        else:
+            self.__draw_rounded_rect(painter, rect, radius, background)
+
+    def __draw_button_panel(self, option: QStyleOption, painter: QPainter) -> None:
+        """Draws a push-button: pressed, checked and disabled states"""
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        palette = option.palette
+        if option.state & QStyle.State_Sunken and option.state & QStyle.State_Enabled:
+            background = palette.color(QPalette.Highlight)
+            border = None
+        elif not option.state & QStyle.State_Enabled:
+            background = QColor(Qt.transparent)
+            border = palette.color(QPalette.Midlight)
+        elif option.state & QStyle.State_On:
+            background = palette.color(QPalette.Base)
+            border = None
+        else:
+            background = palette.color(QPalette.Button)
+            border = None
+        self.__draw_rounded_rect(painter, rect, self.__widget.CORNER_RADIUS_PX, background, border, 1)
+
+    def __draw_indicator(self, option: QStyleOption, painter: QPainter, radius: float) -> None:
+        """Draws check-box (radius 0) and radio-button indicators"""
+        palette = option.palette
+        enabled = bool(option.state & QStyle.State_Enabled)
+        dark = palette.color(QPalette.Dark)
+        if option.state & QStyle.State_NoChange:
+            fill = palette.color(QPalette.Midlight) if enabled else palette.color(QPalette.Disabled, QPalette.Window)
+        elif option.state & QStyle.State_On:
+            fill = palette.color(QPalette.Highlight) if enabled else palette.color(QPalette.Midlight)
+        else:
+            fill = dark
+        rect = QRect(0, 0, self.__indicator_size, self.__indicator_size)
+        rect.moveCenter(option.rect.center())
+        self.__draw_rounded_rect(painter, rect, radius, fill, dark, self.__widget.INDICATOR_BORDER_PX)
+
+    def __get_tab_text_color(self, option: QStyleOption) -> QColor:
+        """Returns the text color of a tab"""
+        if not option.state & QStyle.State_Enabled:
+            return QColor(option.palette.color(QPalette.Midlight))
+        if option.state & QStyle.State_Selected:
+            return QColor(option.palette.color(QPalette.Light))
+        return QColor(self.__widget.TAB_TEXT_RGB)
+
+    def __draw_tab_shape(self, option: QStyleOption, painter: QPainter) -> None:
+        """Draws the bottom indicator line of the selected tab"""
+        if not option.state & QStyle.State_Selected:
+            return
+        if option.state & QStyle.State_Enabled:
+            color = option.palette.color(QPalette.Highlight)
+        else:
+            color = option.palette.color(QPalette.Midlight)
+        rect = option.rect
+        indicator: int = self.__widget.TAB_INDICATOR_PX
+        if option.shape in (QTabBar.RoundedSouth, QTabBar.TriangularSouth):
+            painter.fillRect(QRect(rect.x(), rect.y(), rect.width(), indicator), color)
+        else:
+            painter.fillRect(QRect(rect.x(), rect.bottom() - indicator + 1, rect.width(), indicator), color)
+
+    def __draw_combobox(self, option: QStyleOptionComplex, painter: QPainter, widget: Any) -> None:
+        """Draws a combo-box with its drop-down button"""
+        palette = option.palette
+        enabled = bool(option.state & QStyle.State_Enabled)
+        background = palette.color(QPalette.Dark) if option.editable else palette.color(QPalette.Button)
+        focus = option.editable and bool(option.state & QStyle.State_HasFocus)
+        self.__draw_field(option, painter, background, focus)
+        arrow_rect = super().subControlRect(QStyle.CC_ComboBox, option, QStyle.SC_ComboBoxArrow, widget)
+        if enabled and (option.editable or option.state & QStyle.State_On):
+            color = palette.color(QPalette.Highlight) if option.state & QStyle.State_On \
+                else palette.color(QPalette.Button)
+            button_rect = QRect(arrow_rect.x(), option.rect.y(), option.rect.right() - arrow_rect.x(),
+                                option.rect.height())
+            if focus:
+                border: int = self.__widget.FOCUS_BORDER_PX
+                button_rect.adjust(0, border, -border + 1, -border)
+            self.__draw_rounded_rect(painter, button_rect, self.__widget.CORNER_RADIUS_PX, color)
+        self.__draw_icon(painter, arrow_rect, ICON_ARROW_DOWN)
+
+    def __draw_spinbox(self, option: QStyleOptionComplex, painter: QPainter, widget: Any) -> None:
+        """Draws a spin-box with its up/down buttons"""
+        palette = option.palette
+        self.__draw_field(option, painter, palette.color(QPalette.Button), False)
+        for sub_control, icon in ((QStyle.SC_SpinBoxUp, ICON_ARROW_UP), (QStyle.SC_SpinBoxDown, ICON_ARROW_DOWN)):
+            rect = super().subControlRect(QStyle.CC_SpinBox, option, sub_control, widget)
+            if option.activeSubControls & sub_control and option.state & QStyle.State_Sunken:
+                self.__draw_rounded_rect(painter, rect.adjusted(1, 1, -1, -1), 2, palette.color(QPalette.Highlight))
+            self.__draw_icon(painter, rect, icon)
+
+    def __get_scrollbar_rect(self, option: QStyleOptionComplex, sub_control: Any) -> QRect:
+        """Calculates the scroll-bar sub-control rectangles; scroll-bars have no arrow buttons"""
+        rect: QRect = option.rect
+        horizontal = option.orientation == Qt.Horizontal
+        length = rect.width() if horizontal else rect.height()
+        value_range = option.maximum - option.minimum
+        if value_range > 0:
+            slider_length = int(length * option.pageStep / float(value_range + option.pageStep))
+        else:
+            slider_length = length
+        slider_length = min(length, max(self.__widget.SCROLLBAR_SLIDER_MIN_PX, slider_length))
+        slider_start = QStyle.sliderPositionFromValue(option.minimum, option.maximum, option.sliderPosition,
+                                                      length - slider_length, option.upsideDown)
+        if sub_control == QStyle.SC_ScrollBarSlider:
+            start, end = slider_start, slider_start + slider_length
+        elif sub_control == QStyle.SC_ScrollBarSubPage:
+            start, end = 0, slider_start
+        elif sub_control == QStyle.SC_ScrollBarAddPage:
+            start, end = slider_start + slider_length, length
+        elif sub_control == QStyle.SC_ScrollBarGroove:
+            start, end = 0, length
+        else:  # SC_ScrollBarAddLine, SC_ScrollBarSubLine, SC_ScrollBarFirst, SC_ScrollBarLast
+            return QRect()
+        if horizontal:
+            return QRect(rect.x() + start, rect.y(), end - start, rect.height())
+        return QRect(rect.x(), rect.y() + start, rect.width(), end - start)
+
+    def __draw_scrollbar(self, option: QStyleOptionComplex, painter: QPainter) -> None:
+        """Draws a scroll-bar: groove and handle"""
+        painter.fillRect(option.rect, option.palette.color(QPalette.Base))
+        if option.maximum == option.minimum:
+            return
+        handle = self.__get_scrollbar_rect(option, QStyle.SC_ScrollBarSlider)
+        if option.orientation == Qt.Horizontal:
+            handle.adjust(2, 4, -2, -4)
+        else:
+            handle.adjust(4, 2, -4, -2)
+        self.__draw_rounded_rect(painter, handle, 3, option.palette.color(QPalette.Midlight))
+
+    def __draw_slider(self, option: QStyleOptionComplex, painter: QPainter, widget: Any) -> None:
+        """Draws a slider: groove, filled groove and handle"""
+        palette = option.palette
+        enabled = bool(option.state & QStyle.State_Enabled)
+        groove = super().subControlRect(QStyle.CC_Slider, option, QStyle.SC_SliderGroove, widget)
+        handle = super().subControlRect(QStyle.CC_Slider, option, QStyle.SC_SliderHandle, widget)
+        filled = palette.color(QPalette.Highlight) if enabled else palette.color(QPalette.Midlight)
+        groove_size: int = self.__widget.SLIDER_GROOVE_PX
+        handle_size: int = self.__widget.SLIDER_HANDLE_PX
+        if option.orientation == Qt.Horizontal:
+            groove = QRect(groove.x(), groove.center().y() - groove_size // 2 + 1,
+                           groove.width(), groove_size)
+            sub_page = QRect(groove.x(), groove.y(), handle.center().x() - groove.x(), groove.height())
+        else:
+            groove = QRect(groove.center().x() - groove_size // 2 + 1, groove.y(),
+                           groove_size, groove.height())
+            sub_page = QRect(groove.x(), handle.center().y(), groove.width(), groove.bottom() - handle.center().y())
+        self.__draw_rounded_rect(painter, groove, 3, palette.color(QPalette.Base))
+        self.__draw_rounded_rect(painter, sub_page, 3, filled)
+        handle_rect = QRect(0, 0, handle_size, handle_size)
+        handle_rect.moveCenter(handle.center())
+        handle_color = palette.color(QPalette.Light) if enabled else palette.color(QPalette.Disabled, QPalette.Text)
+        self.__draw_rounded_rect(painter, handle_rect, handle_size / 2.0, handle_color)
+
+    def __draw_window_button(self, option: QStyleOptionComplex, painter: QPainter, name: str) -> None:
+        """Draws the close, minimize, maximize and restore buttons in the window title-bar"""
+        colors = {
+            'btnClose': (self.__window.BTN_CLOSE_COLOR_DEFAULT_RGB,
+                         self.__window.BTN_CLOSE_COLOR_HOVER_RGB,
+                         self.__window.BTN_CLOSE_COLOR_PRESSED_RGB),
+            'btnMinimize': (self.__window.BTN_MINIMIZE_COLOR_DEFAULT_RGB,
+                            self.__window.BTN_MINIMIZE_COLOR_HOVER_RGB,
+                            self.__window.BTN_MINIMIZE_COLOR_PRESSED_RGB),
+            'btnMaximize': (self.__window.BTN_MAXIMIZE_COLOR_DEFAULT_RGB,
+                            self.__window.BTN_MAXIMIZE_COLOR_HOVER_RGB,
+                            self.__window.BTN_MAXIMIZE_COLOR_PRESSED_RGB),
+        }
+        default, hover, pressed = colors.get(name, colors['btnMaximize'])  # restore uses the maximize colors
+        if option.state & QStyle.State_Sunken:
+            color = pressed
+        elif option.state & QStyle.State_MouseOver:
+            color = hover
+        else:
+            color = default
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(QRectF(option.rect))
+        painter.restore()
@@ -1,7 +1,11 @@
+from typing import Any, Dict, List, Tuple
 from PySide2.QtWidgets import QApplication
 from PySide2.QtGui import QPalette, QColor
 import qtmodernredux.apl_style.widgetstyle as wgs
 import qtmodernredux.apl_style.windowstyle as wds
+from qtmodernredux.apl_style.proxystyle import APLProxyStyle
+from qtmodernredux.qss import QssTemplate, LazyStyleSheetStyle, get_constants
+from qtmodernredux.theme import get_theme
 
 
 __author__ = "Robert Kist"
@@ -14,38 +18,76 @@ class Style:
     2) a style for the widgets inside the window (widgetstyle)
     """
     window = wds.Constants
+    widget = wgs.Constants
+    __window_template = QssTemplate(''.join([wds.frame_style, wds.buttons_style]), minify=True)
+    # widget style-sheet fragments in cascade order, with the widget classes that activate them (see apply_lazy_theme).
+    # Fragments of widgets found in almost every dialog are always active: activating them later would re-polish
+    # all existing widgets.
+    __widget_fragments: List[Tuple[Tuple[str, ...], QssTemplate]] = [
+        ((), QssTemplate(wgs.base_style, minify=True)),
+        ((), QssTemplate(wgs.combobox_style, minify=True)),
+        (('QGroupBox',), QssTemplate(wgs.groupbox_style, minify=True)),
+        (('QHeaderView', 'QTableView', 'QTreeView'), QssTemplate(wgs.headerview_style, minify=True)),
+        ((), QssTemplate(wgs.lineedit_style, minify=True)),
+        (('QProgressBar',), QssTemplate(wgs.progressbar_style, minify=True)),
+        ((), QssTemplate(wgs.qpushbutton_style, minify=True)),
+        (('QScrollArea',), QssTemplate(wgs.scrollarea_style, minify=True)),
+        ((), QssTemplate(wgs.scrollbar_style, minify=True)),
+        (('QSlider',), QssTemplate(wgs.slider_style, minify=True)),
+        (('QSpinBox', 'QDateTimeEdit'), QssTemplate(wgs.spinbox_style, minify=True)),
+        (('QSplitter',), QssTemplate(wgs.splitter_style, minify=True)),
+        (('QTableView',), QssTemplate(wgs.tableview_style, minify=True)),
+        (('QTabWidget', 'QTabBar'), QssTemplate(wgs.tabwidget_style, minify=True)),
+        (('QToolBar',), QssTemplate(wgs.toolbar_style, minify=True)),
+        (('QTreeView',), QssTemplate(wgs.treeview_style, minify=True)),
+        ((), QssTemplate(wgs.radiobutton_style, minify=True)),
+        ((), QssTemplate(wgs.checkbox_style, minify=True)),
+    ]
+    __title_tabwidget_template = QssTemplate(wgs.tabwidget_titlebar_style)
+
+    @staticmethod
+    def get_stylesheet_templates() -> Dict[str, Tuple[QssTemplate, Dict[str, Any]]]:
+        """Returns all style-sheet templates of this style together with the constants they are rendered with"""
+        window_values = get_constants(wds.Constants)
+        window_values['BUTTON_DIAMETER_HALF_PX'] = wds.Constants.TITLE_BAR_BUTTON_DIAMETER_PX / 2
+        widget_values = get_constants(wgs.Constants)
+        templates = {
+            'window': (Style.__window_template, window_values),
+            'title_tabwidget': (Style.__title_tabwidget_template, widget_values),
+        }
+        for index, (_, template) in enumerate(Style.__widget_fragments):
+            templates['widget.%02d' % index] = (template, widget_values)
+        return templates
 
     @staticmethod
     def get_window_stylesheet() -> str:
         """Returns the QSS style-sheet for the window frame"""
-        qss = ''.join([wds.frame_style, wds.buttons_style])
-        for var in vars(wds.Constants)['__annotations__']:
-            qss = qss.replace('{%s}' % var, str(getattr(wds.Constants, var)))
-        qss = qss.replace('{BUTTON_DIAMETER_HALF_PX}', str(wds.Constants.TITLE_BAR_BUTTON_DIAMETER_PX / 2))
-        return qss
+        template, values = Style.get_stylesheet_templates()['window']
+        return template.render(values)
 
     @staticmethod
-    def get_title_tabwidget_stylesheet() -> str:
-        """Returns the QSS style-sheet for a tabwidget inside the title-bar"""
-        return wgs.tabwidget_titlebar_style
+    def get_widget_stylesheet_fragments() -> List[Tuple[Tuple[str, ...], str]]:
+        """Returns the widget QSS fragments in cascade order, each with the widget classes it styles"""
+        values = get_constants(wgs.Constants)
+        return [(class_names, template.render(values)) for class_names, template in Style.__widget_fragments]
 
     @staticmethod
-    def apply_theme(app: QApplication) -> None:
+    def get_widget_stylesheet() -> str:
+        """Returns the application-wide QSS style-sheet for widgets"""
+        return ''.join([qss for _, qss in Style.get_widget_stylesheet_fragments()])
+
+    @staticmethod
+    def get_title_tabwidget_stylesheet() -> str:
         """
-        Applies the 'APL' style to the current Application and its Windows.
-        This automatically styles widgets and sets the application global color palette.
-        NOTE: To feature QtModernRedux window frames windows will still have to be wrapped using the
-              QtModernRedux.wrap() method.
+        Returns the QSS style-sheet for a tabwidget inside the title-bar.
+        Window specific placeholders, e.g. {TITLEBAR_HEIGHT}, are left for the window to fill in.
         """
-        # get stylesheet
-        style = ''.join(
-            [wgs.base_style, wgs.combobox_style, wgs.groupbox_style, wgs.headerview_style, wgs.lineedit_style,
-             wgs.progressbar_style, wgs.qpushbutton_style, wgs.scrollarea_style, wgs.scrollbar_style, wgs.slider_style,
-             wgs.spinbox_style, wgs.splitter_style, wgs.tableview_style, wgs.tabwidget_style, wgs.toolbar_style,
-             wgs.treeview_style, wgs.radiobutton_style, wgs.checkbox_style])
-        style = style.replace('{GREY_127_RGB}', wgs.Constants.GREY_127_RGB)
-        style = style.replace('{WINDOW_BACKGROUND_RGB}', wgs.Constants.WINDOW_BACKGROUND_RGB)
-        # apply palette Constants.
+        template, values = Style.get_stylesheet_templates()['title_tabwidget']
+        return template.render(values)
+
+    @staticmethod
+    def get_palette() -> QPalette:
+        """Returns the application-wide color palette. Use get_theme(Style).palette for the precompiled palette"""
         palette = QPalette()
         # highlight color
         palette.setColor(QPalette.Highlight, QColor(wgs.Constants.HIGHLIGHT_RGB))
@@ -75,7 +117,44 @@ class Style:
         palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(wgs.Constants.GREY_127_RGB))
         palette.setColor(QPalette.Disabled, QPalette.HighlightedText, QColor(wgs.Constants.GREY_127_RGB))
         palette.setColor(QPalette.Disabled, QPalette.Highlight, QColor(wgs.Constants.GREY_80_RGB))
-        # apple theme
+        return palette
+
+    @staticmethod
+    def apply_theme(app: QApplication) -> None:
+        """
+        Applies the 'APL' style to the current Application and its Windows.
+        This automatically styles widgets and sets the application global color palette.
+        NOTE: To feature QtModernRedux window frames windows will still have to be wrapped using the
+              QtModernRedux.wrap() method.
+        """
+        palette = get_theme(Style).palette
+        assert palette is not None
         app.setStyle('Fusion')  # type: ignore
         app.setPalette(palette)
-        app.setStyleSheet(style)
+        app.setStyleSheet(Style.get_widget_stylesheet())
+
+    @staticmethod
+    def apply_lazy_theme(app: QApplication) -> LazyStyleSheetStyle:
+        """
+        Same as apply_theme(), but the QSS fragment of a widget class is only added to the application style-sheet
+        once the first widget of that class is polished. Returns the installed QStyle.
+        """
+        palette = get_theme(Style).palette
+        assert palette is not None
+        style = LazyStyleSheetStyle('Fusion', Style.get_widget_stylesheet_fragments())
+        app.setStyle(style)
+        app.setPalette(palette)
+        app.setStyleSheet(style.get_stylesheet())
+        return style
+
+    @staticmethod
+    def apply_native_theme(app: QApplication) -> None:
+        """
+        Applies the 'APL' style without a style-sheet: widgets are painted by APLProxyStyle.
+        This avoids the overhead of Qt's style-sheet engine for polishing and painting widgets.
+        """
+        theme = get_theme(Style)
+        assert theme.palette is not None and theme.font is not None
+        app.setStyle(APLProxyStyle(Style.widget, Style.window))
+        app.setPalette(theme.palette)
+        app.setFont(theme.font)
@@ -10,8 +10,8 @@ Note: QSizegrip must remain disabled as it causes excessive flickering on the Wi
 
 base_style = '''
 * {
-      font-family: Roboto;
-      font-size: 12px;
+      font-family: {FONT_FAMILY};
+      font-size: {FONT_SIZE_PX}px;
       font-weight: Normal;
       outline: none;
 }
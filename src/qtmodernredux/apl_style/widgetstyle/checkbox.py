@@ -5,9 +5,9 @@ __author__ = "Robert Kist"
 checkbox_style = '''
 QCheckBox::indicator {
     background: palette(dark);
-    width: 8px;
-    height: 8px;
-    border: 3px solid palette(dark);
+    width: {INDICATOR_SIZE_PX}px;
+    height: {INDICATOR_SIZE_PX}px;
+    border: {INDICATOR_BORDER_PX}px solid palette(dark);
 }
 
 QCheckBox::indicator:checked {
@@ -5,14 +5,14 @@ __author__ = "Robert Kist"
 combobox_style = '''
 QComboBox {
     background: palette(button);
-    border-radius: 5px;
-    height: 22px;
-    min-height: 22px;
-    max-height: 22px;
+    border-radius: {CORNER_RADIUS_PX}px;
+    height: {FIELD_HEIGHT_PX}px;
+    min-height: {FIELD_HEIGHT_PX}px;
+    max-height: {FIELD_HEIGHT_PX}px;
     padding-left: 5px;
     padding-right: 10px;
     selection-background-color: palette(highlight);
-    border: 2px solid transparent;
+    border: {FOCUS_BORDER_PX}px solid transparent;
     margin-left: 0px;
     margin-right: 1px;
 }
@@ -25,26 +25,26 @@ QComboBox:disabled {
 
 QComboBox:editable:disabled {
      background: palette(dark);
-     height: 22px;
-     min-height: 22px;
-     max-height: 22px;
+     height: {FIELD_HEIGHT_PX}px;
+     min-height: {FIELD_HEIGHT_PX}px;
+     max-height: {FIELD_HEIGHT_PX}px;
      border: 1px solid palette(dark);;
 }
 
 QComboBox:editable {
      background: palette(dark);
-     height: 22px;
-     min-height: 22px;
-     max-height: 22px;
-     border: 2px solid transparent;
+     height: {FIELD_HEIGHT_PX}px;
+     min-height: {FIELD_HEIGHT_PX}px;
+     max-height: {FIELD_HEIGHT_PX}px;
+     border: {FOCUS_BORDER_PX}px solid transparent;
 }
 
 QComboBox:editable:focus {
-    border-radius: 5px;
-    height: 22px;
-    min-height: 22px;
-    max-height: 22px;
-    border: 2px solid palette(highlight);
+    border-radius: {CORNER_RADIUS_PX}px;
+    height: {FIELD_HEIGHT_PX}px;
+    min-height: {FIELD_HEIGHT_PX}px;
+    max-height: {FIELD_HEIGHT_PX}px;
+    border: {FOCUS_BORDER_PX}px solid palette(highlight);
 }
 
 QComboBox:drop-down, QComboBox::drop-down:editable {
@@ -52,20 +52,20 @@ QComboBox:drop-down, QComboBox::drop-down:editable {
     subcontrol-origin: margin;
     subcontrol-position: center right;
     background: palette(button);
-    border-top-right-radius: 5px;
-    border-bottom-right-radius: 5px;
+    border-top-right-radius: {CORNER_RADIUS_PX}px;
+    border-bottom-right-radius: {CORNER_RADIUS_PX}px;
     border: 0px solid transparent;
     margin-right: 1px;
 }
 
 QComboBox::drop-down:editable:focus {
-    height: 22px;
+    height: {FIELD_HEIGHT_PX}px;
     subcontrol-origin: margin;
     subcontrol-position: center right;
     background: palette(button);
-    border-top-right-radius: 5px;
-    border-bottom-right-radius: 5px;
-    border: 2px solid palette(highlight);
+    border-top-right-radius: {CORNER_RADIUS_PX}px;
+    border-bottom-right-radius: {CORNER_RADIUS_PX}px;
+    border: {FOCUS_BORDER_PX}px solid palette(highlight);
     border-left: 0px;
     padding-left: 1px;
 }
@@ -75,8 +75,8 @@ QComboBox::drop-down:disabled {
     subcontrol-origin: margin;
     subcontrol-position: center right;
     background: transparent;
-    border-top-right-radius: 5px;
-    border-bottom-right-radius: 5px;
+    border-top-right-radius: {CORNER_RADIUS_PX}px;
+    border-bottom-right-radius: {CORNER_RADIUS_PX}px;
     border: 0px solid transparent;
     margin-right: 1px;
 }
@@ -86,8 +86,8 @@ QComboBox::drop-down:pressed {
     subcontrol-origin: margin;
     subcontrol-position: center right;
     background: palette(highlight);
-    border-top-right-radius: 5px;
-    border-bottom-right-radius: 5px;
+    border-top-right-radius: {CORNER_RADIUS_PX}px;
+    border-bottom-right-radius: {CORNER_RADIUS_PX}px;
     border: 0px solid transparent;
     margin-right: 1px;
 }
@@ -16,3 +16,20 @@ class Constants:
     GREY_20_RGB: str = '#141414'  # 20,  20,  20  shadow
     HIGHLIGHT_RGB: str = '#2a82da'  # 42, 130, 218  highlight
     HYPERLINK_RGB: str = '#2a82da'  # 42, 130, 218  hyperlink
+    TAB_TEXT_RGB: str = '#a0a0a0'  # text of unselected tabs
+    CORNER_RADIUS_PX: int = 5  # buttons, combo-boxes, spin-boxes and line-edits
+    FIELD_HEIGHT_PX: int = 22  # combo-boxes, spin-boxes and line-edits, without border
+    FOCUS_BORDER_PX: int = 2
+    INDICATOR_SIZE_PX: int = 8  # check-box and radio-button indicators, without border
+    INDICATOR_BORDER_PX: int = 3
+    SCROLLBAR_EXTENT_PX: int = 16
+    SCROLLBAR_SLIDER_MIN_PX: int = 20
+    SLIDER_HANDLE_PX: int = 14
+    SLIDER_GROOVE_PX: int = 6
+    TAB_HEIGHT_PX: int = 28  # without borders and margin
+    TAB_PADDING_PX: int = 15
+    TAB_MARGIN_TOP_PX: int = 4
+    TAB_BORDER_TOP_PX: int = 2
+    TAB_INDICATOR_PX: int = 4  # bottom border of the selected tab
+    FONT_FAMILY: str = 'Roboto'
+    FONT_SIZE_PX: int = 12
@@ -5,19 +5,19 @@ __author__ = "Robert Kist"
 lineedit_style = '''
 QLineEdit {
     background: palette(dark);
-    border-radius: 5px;
-    height: 22px;
-    min-height: 22px;
-    max-height: 22px;
+    border-radius: {CORNER_RADIUS_PX}px;
+    height: {FIELD_HEIGHT_PX}px;
+    min-height: {FIELD_HEIGHT_PX}px;
+    max-height: {FIELD_HEIGHT_PX}px;
     margin-top: 0px;
     margin-bottom: 0px;
     margin-left: 0px;
     margin-right: 0px;
-    border: 2px solid transparent;
+    border: {FOCUS_BORDER_PX}px solid transparent;
 }
 
 QLineEdit:focus {
-    border-radius: 5px;
-    border: 2px solid palette(highlight);
+    border-radius: {CORNER_RADIUS_PX}px;
+    border: {FOCUS_BORDER_PX}px solid palette(highlight);
 }
 '''
@@ -5,7 +5,7 @@ __author__ = "Robert Kist"
 qpushbutton_style = '''
 QPushButton {
     background: palette(button);
-    border-radius: 5px;
+    border-radius: {CORNER_RADIUS_PX}px;
 
     height: 24px;
     min-height: 24px;
@@ -26,7 +26,7 @@ QPushButton:flat {
 
 QPushButton:checked {
     background: palette(base);
-    border-radius: 5px;
+    border-radius: {CORNER_RADIUS_PX}px;
 
     height: 24px;
     min-height: 24px;
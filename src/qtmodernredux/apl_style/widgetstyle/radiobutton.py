@@ -9,9 +9,9 @@ QRadioButton:disabled {
 
 QRadioButton::indicator {
     background: palette(dark);
-    width: 8px;
-    height: 8px;
-    border: 3px solid palette(dark);
+    width: {INDICATOR_SIZE_PX}px;
+    height: {INDICATOR_SIZE_PX}px;
+    border: {INDICATOR_BORDER_PX}px solid palette(dark);
     border-radius: 7px;
 }
 
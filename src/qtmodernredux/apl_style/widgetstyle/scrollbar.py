@@ -7,18 +7,18 @@ QScrollBar:vertical {
     background: palette(base);
     border-top-right-radius: 2px;
     border-bottom-right-radius: 2px;
-    width: 16px;
-    min-width: 16px;
-    max-width: 16px;
+    width: {SCROLLBAR_EXTENT_PX}px;
+    min-width: {SCROLLBAR_EXTENT_PX}px;
+    max-width: {SCROLLBAR_EXTENT_PX}px;
     margin: 0px;
 }
 
 QScrollBar::handle:vertical {
     background-color: palette(midlight);
     border-radius: 3px;
-    min-height: 20px;
-    min-height: 20px;
-    max-height: 20px;
+    min-height: {SCROLLBAR_SLIDER_MIN_PX}px;
+    min-height: {SCROLLBAR_SLIDER_MIN_PX}px;
+    max-height: {SCROLLBAR_SLIDER_MIN_PX}px;
     margin: 2px 4px 2px 4px;
 }
 
@@ -38,16 +38,16 @@ QScrollBar::sub-line:vertical {
 
 QScrollBar:horizontal {
     background: palette(base);
-    height: 16px;
-    min-height: 16px;
-    max-height: 16px;
+    height: {SCROLLBAR_EXTENT_PX}px;
+    min-height: {SCROLLBAR_EXTENT_PX}px;
+    max-height: {SCROLLBAR_EXTENT_PX}px;
     margin: 0px;
 }
 
 QScrollBar::handle:horizontal {
     background-color: palette(midlight);
     border-radius: 3px;
-    min-width: 20px;
+    min-width: {SCROLLBAR_SLIDER_MIN_PX}px;
     margin: 4px 2px 4px 2px;
 }
 
@@ -5,20 +5,20 @@ __author__ = "Robert Kist"
 spinbox_style = '''
 QSpinBox, QDateTimeEdit {
     background: palette(button);
-    border-radius: 5px;
-    height: 22px;
-    min-height: 22px;
-    max-height: 22px;
+    border-radius: {CORNER_RADIUS_PX}px;
+    height: {FIELD_HEIGHT_PX}px;
+    min-height: {FIELD_HEIGHT_PX}px;
+    max-height: {FIELD_HEIGHT_PX}px;
     padding-left: 10px;
     padding-right: 10px;
     selection-background-color: palette(highlight);
-    border: 2px solid transparent;
+    border: {FOCUS_BORDER_PX}px solid transparent;
     margin-left: 0px;
     margin-right: 0px;
 }
 
 QSpinBox:disabled, QDateTimeEdit:disabled {
-    border-radius: 5px;
+    border-radius: {CORNER_RADIUS_PX}px;
     margin-top: 1px;
     margin-bottom: 1px;
     margin-right: 1px;
@@ -55,7 +55,7 @@ QSpinBox::up-button:pressed, QDateTimeEdit::up-button:pressed {
     margin: 1px;
     subcontrol-origin: margin;
     subcontrol-position: top right;
-    border-top-right-radius: 5px;
+    border-top-right-radius: {CORNER_RADIUS_PX}px;
     background-color: palette(highlight);
 }
 
@@ -63,7 +63,7 @@ QSpinBox::down-button:pressed, QDateTimeEdit::down-button:pressed {
     margin: 1px;
     subcontrol-origin: margin;
     subcontrol-position: bottom right;
-    border-bottom-right-radius: 5px;
+    border-bottom-right-radius: {CORNER_RADIUS_PX}px;
     background-color: palette(highlight);
 }
 '''
@@ -23,28 +23,28 @@ QTabBar::tear {
 }
 
 QTabBar::tab{
-    margin-top: 4px;
-    padding-left: 15px;
-    padding-right: 15px;
-    height: 28px;
-    border-top: 2px solid transparent;
+    margin-top: {TAB_MARGIN_TOP_PX}px;
+    padding-left: {TAB_PADDING_PX}px;
+    padding-right: {TAB_PADDING_PX}px;
+    height: {TAB_HEIGHT_PX}px;
+    border-top: {TAB_BORDER_TOP_PX}px solid transparent;
     background-color: transparent;
-    border-bottom: 4px solid transparent;
-    color: #a0a0a0;
+    border-bottom: {TAB_INDICATOR_PX}px solid transparent;
+    color: {TAB_TEXT_RGB};
 }
 
 QTabBar::tab:selected {
-    border-bottom: 4px solid palette(highlight);
+    border-bottom: {TAB_INDICATOR_PX}px solid palette(highlight);
     color: palette(light);
 }
 
 QTabBar::tab:disabled {
-    border-bottom: 4px solid transparent;
+    border-bottom: {TAB_INDICATOR_PX}px solid transparent;
     color: palette(midlight);
 }
 
 QTabBar::tab:selected:disabled {
-    border-bottom: 4px solid palette(midlight);
+    border-bottom: {TAB_INDICATOR_PX}px solid palette(midlight);
     color: palette(midlight);
 }
 
@@ -0,0 +1,87 @@
+from typing import Dict, List, Set, Tuple
+from PySide2.QtCore import QTimer
+from PySide2.QtGui import QFont, QFontDatabase
+
+
+__author__ = "Robert Kist"
+
+
+"""
+On-demand loading of the bundled Roboto font family.
+Only Roboto Regular and Bold are used by the built-in style (widgets and window titles), so only these two are loaded
+when the application starts. Which of the other weights are loaded, and when, depends on the font mode:
+* FONTS_MINIMAL: the other weights are only loaded on request, see FontLoader.require()
+* FONTS_IDLE: the other weights are loaded one by one whenever the event loop is idle
+* FONTS_ALL: all weights are loaded right away (previous behaviour)
+"""
+
+
+FONTS_MINIMAL: str = 'minimal'
+FONTS_IDLE: str = 'idle'
+FONTS_ALL: str = 'all'
+FONT_DIR: str = ':/third_party/fonts/Roboto/'
+FONT_FILES: Dict[Tuple[int, bool], str] = {  # (QFont weight, italic) -> font file
+    (QFont.Normal, False): 'Roboto-Regular.ttf',
+    (QFont.Bold, False): 'Roboto-Bold.ttf',
+    (QFont.Thin, False): 'Roboto-Thin.ttf',
+    (QFont.Thin, True): 'Roboto-ThinItalic.ttf',
+    (QFont.Light, False): 'Roboto-Light.ttf',
+    (QFont.Light, True): 'Roboto-LightItalic.ttf',
+    (QFont.Normal, True): 'Roboto-Italic.ttf',
+    (QFont.Medium, False): 'Roboto-Medium.ttf',
+    (QFont.Medium, True): 'Roboto-MediumItalic.ttf',
+    (QFont.Bold, True): 'Roboto-BoldItalic.ttf',
+    (QFont.Black, False): 'Roboto-Black.ttf',
+    (QFont.Black, True): 'Roboto-BlackItalic.ttf',
+}
+STARTUP_FONTS: List[Tuple[int, bool]] = [(QFont.Normal, False), (QFont.Bold, False)]
+
+
+class FontLoader:
+    """Registers the bundled fonts with Qt's font database, each at most once"""
+    __loaded: Set[Tuple[int, bool]] = set()
+    __queue: List[Tuple[int, bool]] = []  # fonts waiting to be loaded when the event loop is idle
+
+    @classmethod
+    def load_startup_fonts(cls, mode: str) -> None:
+        """Loads Regular and Bold, and the other fonts according to the mode. Must be called after QApplication()"""
+        assert mode in [FONTS_MINIMAL, FONTS_IDLE, FONTS_ALL], "ERROR: unknown font mode %s" % mode
+        for key in STARTUP_FONTS:
+            cls.__load(key)
+        others = [key for key in FONT_FILES if key not in STARTUP_FONTS]
+        if mode == FONTS_ALL:
+            for key in others:
+                cls.__load(key)
+        elif mode == FONTS_IDLE:
+            cls.__queue = [key for key in others if key not in cls.__loaded]
+            QTimer.singleShot(0, cls.__load_next)
+
+    @classmethod
+    def require(cls, weight: int = QFont.Normal, italic: bool = False) -> None:
+        """Loads the font file closest to the given QFont weight, e.g. QFont.Light, unless it was loaded already"""
+        key = min([key for key in FONT_FILES if key[1] == italic], key=lambda k: abs(k[0] - weight))
+        if key in cls.__queue:
+            cls.__queue.remove(key)
+        cls.__load(key)
+
+    @classmethod
+    def get_loaded_fonts(cls) -> List[str]:
+        """Returns the file names of all loaded fonts"""
+        return [file_name for key, file_name in FONT_FILES.items() if key in cls.__loaded]
+
+    @classmethod
+    def __load_next(cls) -> None:
+        """Loads the next queued font and schedules the one after it, so that the event loop stays responsive"""
+        if cls.__queue:
+            cls.__load(cls.__queue.pop(0))
+        if cls.__queue:
+            QTimer.singleShot(0, cls.__load_next)
+
+    @classmethod
+    def __load(cls, key: Tuple[int, bool]) -> None:
+        """Adds a font file to the application's font database"""
+        if key in cls.__loaded:
+            return
+        font = FONT_DIR + FONT_FILES[key]
+        assert QFontDatabase.addApplicationFont(font) != -1, "ERROR: could not load font: %s" % font
+        cls.__loaded.add(key)
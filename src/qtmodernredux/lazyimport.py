@@ -0,0 +1,28 @@
+import sys
+import importlib
+from typing import Any, Dict, List
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Lazy attributes for packages.
+A package lists its public classes as {attribute name: module name} and forwards its module-level __getattr__() and
+__dir__() to the functions below. The module which defines a class is only imported when the class is first
+accessed, e.g. 'from qtmodernredux import QtModernRedux', so importing a package doesn't import Qt.
+"""
+
+
+def get_lazy_attribute(package_name: str, attributes: Dict[str, str], name: str) -> Any:
+    """Imports and returns a lazy attribute of a package. The attribute is stored in the package afterwards"""
+    if name not in attributes:
+        raise AttributeError("module '%s' has no attribute '%s'" % (package_name, name))
+    value = getattr(importlib.import_module(attributes[name]), name)
+    setattr(sys.modules[package_name], name, value)  # later accesses don't go through __getattr__()
+    return value
+
+
+def get_lazy_dir(package_name: str, attributes: Dict[str, str]) -> List[str]:
+    """Returns the names of a package including its lazy attributes which haven't been imported yet"""
+    return sorted(set(vars(sys.modules[package_name])).union(attributes))
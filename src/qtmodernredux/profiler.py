@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from PySide2.QtCore import QObject, QEvent, QTimer
+from PySide2.QtWidgets import QApplication, QWidget
+from qtmodernredux import IMPORT_STARTED
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Opt-in time-to-first-frame profiler.
+Enabled by QtModernRedux.QApplication(profile=True) or by setting the QTMODERNREDUX_PROFILE environment variable
+(to anything but '' or '0'). Records the start-up phases - importing qtmodernredux, loading the style, constructing
+the QApplication, registering resources, loading fonts, applying the theme, every wrap() - and the first show event
+and first completed paint of every ModernWindow. All times are relative to the start of 'import qtmodernredux'.
+Once the first window has finished painting, the report is printed to stderr as a table and, if the
+QTMODERNREDUX_PROFILE_OUTPUT environment variable names a file, written to that file as JSON. When the application
+quits, a final report is emitted if anything was recorded since, e.g. the first paint of windows shown later.
+"""
+
+
+PROFILE_ENV_VAR: str = 'QTMODERNREDUX_PROFILE'
+PROFILE_OUTPUT_ENV_VAR: str = 'QTMODERNREDUX_PROFILE_OUTPUT'
+REPORT_VERSION: int = 1
+
+
+class FirstFrameWatcher(QObject):
+    """Event filter which records the first show event and the first completed paint of a window"""
+
+    def __init__(self, window: QWidget, name: str) -> None:
+        """Constructor: watches the window and its 'windowFrame' child, which paints the window"""
+        super().__init__(window)
+        self.__name: str = name
+        self.__shown: bool = False
+        self.__painted: bool = False
+        self.__watched: List[QWidget] = [window] + list(window.findChildren(QWidget, 'windowFrame'))
+        for widget in self.__watched:
+            widget.installEventFilter(self)
+
+    def eventFilter(self, target: QObject, event: QEvent) -> bool:  # pylint: disable=invalid-name
+        """Records the first Show and Paint events"""
+        if event.type() == QEvent.Show and not self.__shown:
+            self.__shown = True
+            StartupProfiler.mark('first show: %s' % self.__name)
+        elif event.type() == QEvent.Paint and not self.__painted:
+            self.__painted = True
+            QTimer.singleShot(0, self.__paint_completed)  # runs once the whole window has been painted and flushed
+        return False
+
+    def __paint_completed(self) -> None:
+        """Records the first completed paint and stops watching the window"""
+        for widget in self.__watched:
+            widget.removeEventFilter(self)
+        StartupProfiler.mark('first paint: %s' % self.__name)
+        StartupProfiler.first_frame_completed()
+
+
+class StartupProfiler:
+    """Records start-up phases. All methods are no-ops unless the profiler is enabled"""
+    __enabled: bool = os.environ.get(PROFILE_ENV_VAR, '') not in ['', '0']
+    __origin: float = IMPORT_STARTED
+    __phases: List[Dict[str, Any]] = []
+    __counts: Dict[str, int] = {}
+    __first_frame_ms: Optional[float] = None
+    __reported_count: int = 0  # number of phases in the last emitted report
+    __quit_connected: bool = False
+
+    @classmethod
+    def enable(cls) -> None:
+        """Enables the profiler"""
+        cls.__enabled = True
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Returns True if the profiler is enabled"""
+        return cls.__enabled
+
+    @classmethod
+    def record(cls, name: str, start: float, end: float) -> None:
+        """Records a phase, given as time.perf_counter() values"""
+        if cls.__enabled:
+            cls.__phases.append({'name': name,
+                                 'start_ms': (start - cls.__origin) * 1000.0,
+                                 'duration_ms': (end - start) * 1000.0})
+
+    @classmethod
+    def mark(cls, name: str) -> None:
+        """Records a point in time, e.g. the first show event of a window"""
+        now = time.perf_counter()
+        cls.record(name, now, now)
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        """Context manager which records the time its block takes as a phase"""
+        start = time.perf_counter()
+        yield
+        cls.record(name, start, time.perf_counter())
+
+    @classmethod
+    def get_numbered_name(cls, name: str) -> str:
+        """Returns the name with a running number, e.g. 'wrap #2 QMessageBox' for repeated phases"""
+        cls.__counts[name] = cls.__counts.get(name, 0) + 1
+        return '%s #%d' % (name, cls.__counts[name])
+
+    @classmethod
+    def watch_window(cls, window: QWidget, name: str) -> None:
+        """Records the first show event and the first completed paint of a window"""
+        if cls.__enabled:
+            FirstFrameWatcher(window, name)
+            if not cls.__quit_connected:  # final report, including windows painted after the first one
+                cls.__quit_connected = True
+                QApplication.instance().aboutToQuit.connect(cls.emit_report)
+
+    @classmethod
+    def first_frame_completed(cls) -> None:
+        """Called when a window has completed its first paint. The first call emits the report"""
+        if cls.__first_frame_ms is None:
+            cls.__first_frame_ms = (time.perf_counter() - cls.__origin) * 1000.0
+            cls.emit_report()
+
+    @classmethod
+    def get_report(cls) -> Dict[str, Any]:
+        """Returns the recorded phases, in the order they started"""
+        return {
+            'version': REPORT_VERSION,
+            'time_to_first_frame_ms': cls.__first_frame_ms,
+            'phases': sorted(cls.__phases, key=lambda p: p['start_ms']),
+        }
+
+    @classmethod
+    def get_table(cls) -> str:
+        """Returns the report as a human-readable table"""
+        report = cls.get_report()
+        lines = ['%-48s %10s %10s' % ('phase', 'start ms', 'duration')]
+        for phase in report['phases']:
+            duration = '%10.1f' % phase['duration_ms'] if phase['duration_ms'] > 0 else '%10s' % '-'
+            lines.append('%-48s %10.1f %s' % (phase['name'][:48], phase['start_ms'], duration))
+        if report['time_to_first_frame_ms'] is not None:
+            lines.append('%-48s %10.1f' % ('time to first frame', report['time_to_first_frame_ms']))
+        return '\n'.join(lines)
+
+    @classmethod
+    def emit_report(cls) -> None:
+        """Prints the table to stderr and writes the JSON report, unless nothing was recorded since the last report"""
+        if not cls.__enabled or len(cls.__phases) == cls.__reported_count:
+            return
+        cls.__reported_count = len(cls.__phases)
+        print(cls.get_table(), file=sys.stderr)
+        path = os.environ.get(PROFILE_OUTPUT_ENV_VAR, '')
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(cls.get_report(), f, indent=2)
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING, Any, Dict, List
+from qtmodernredux.lazyimport import get_lazy_attribute, get_lazy_dir
+from qtmodernredux.qss.template import QssTemplate, get_constants
+from qtmodernredux.qss.rules import parse_rules, scope_stylesheet
+
+if TYPE_CHECKING:
+    from qtmodernredux.qss.lazy import LazyStyleSheetStyle
+    from qtmodernredux.qss.minifier import minify
+
+
+# imported on first access (see lazyimport.py), so that importing the QSS tools doesn't import Qt
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    'LazyStyleSheetStyle': 'qtmodernredux.qss.lazy',
+    'minify': 'qtmodernredux.qss.minifier',
+}
+
+__all__ = ['QssTemplate', 'get_constants', 'parse_rules', 'scope_stylesheet', 'LazyStyleSheetStyle', 'minify']
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the lazy attributes on first access"""
+    return get_lazy_attribute(__name__, LAZY_ATTRIBUTES, name)
+
+
+def __dir__() -> List[str]:
+    """Lists the lazy attributes which haven't been imported yet, too"""
+    return get_lazy_dir(__name__, LAZY_ATTRIBUTES)
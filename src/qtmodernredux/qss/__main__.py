@@ -0,0 +1,29 @@
+import sys
+from qtmodernredux.qtmodernredux import QtModernRedux, STYLES_LIST
+from qtmodernredux.qss.bundle import check_bundle, get_bundle_path, write_bundle
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Build step: writes the pre-rendered style-sheet bundles for all built-in styles.
+With --check, verifies instead that the bundles match the current templates and constants, and exits with 1 if not.
+Run: python -m qtmodernredux.qss [--check]
+"""
+
+
+if __name__ == '__main__':
+    if '--check' in sys.argv[1:]:
+        failed = False
+        for style_name in STYLES_LIST:
+            stale = check_bundle(QtModernRedux.get_style(style_name), get_bundle_path(style_name))
+            if stale:
+                failed = True
+                print("stale style-sheet bundle %s: %s" % (get_bundle_path(style_name), ', '.join(stale)))
+            else:
+                print("style-sheet bundle %s is up to date" % get_bundle_path(style_name))
+        sys.exit(1 if failed else 0)
+    for style_name in STYLES_LIST:
+        write_bundle(QtModernRedux.get_style(style_name), get_bundle_path(style_name))
+        print("wrote style-sheet bundle %s" % get_bundle_path(style_name))
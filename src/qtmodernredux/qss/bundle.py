@@ -0,0 +1,81 @@
+import os
+import json
+from typing import Any, Dict, List
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Pre-rendered style-sheet bundles.
+A bundle stores the fully rendered QSS of every style-sheet template of a style, together with the constants it was
+rendered with. Bundles are created at build time (see 'make resources') and loaded by QtModernRedux.QApplication().
+Loading a bundle primes the style's template caches; if a style's constants have been overridden the primed entries
+simply don't match and the style-sheets are rendered live instead.
+check_bundle() finds bundle entries which no longer match the templates, e.g. because a template was changed after
+the bundle was written ('python -m qtmodernredux.qss --check').
+"""
+
+
+BUNDLE_FORMAT: int = 1  # increase when the bundle layout changes; bundles of other formats are ignored
+BUNDLE_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'stylesheets')
+
+
+def get_bundle_path(style_name: str) -> str:
+    """Returns the path of the bundle file for the given built-in style name"""
+    return os.path.join(BUNDLE_DIR, '%s.v%d.json' % (style_name.lower(), BUNDLE_FORMAT))
+
+
+def write_bundle(style: Any, path: str) -> None:
+    """Renders all style-sheet templates of a style and writes them into a bundle file"""
+    stylesheets: Dict[str, Any] = {}
+    for name, (template, values) in style.get_stylesheet_templates().items():
+        stylesheets[name] = {
+            'source': template.source_hash,
+            'values': template.get_values(values),
+            'qss': template.render(values),
+        }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'format': BUNDLE_FORMAT, 'stylesheets': stylesheets}, f, indent=1, sort_keys=True)
+
+
+def load_bundle(style: Any, path: str) -> bool:
+    """
+    Loads a bundle file and primes the style's template caches with its pre-rendered style-sheets.
+    Returns False if the bundle doesn't exist or was written in a different format.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if bundle.get('format') != BUNDLE_FORMAT:
+        return False
+    templates = style.get_stylesheet_templates()
+    for name, entry in bundle['stylesheets'].items():
+        if name in templates:
+            template = templates[name][0]
+            if entry['source'] == template.source_hash:  # skip bundles rendered from a different template
+                template.prime(entry['values'], entry['qss'])
+    return True
+
+
+def check_bundle(style: Any, path: str) -> List[str]:
+    """
+    Returns the names of the style's templates which the bundle file doesn't cover: entries which are missing, were
+    rendered from a different template source or with different constants. Returns ['*'] if the bundle can't be loaded
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        return ['*']
+    if bundle.get('format') != BUNDLE_FORMAT:
+        return ['*']
+    stale: List[str] = []
+    for name, (template, values) in sorted(style.get_stylesheet_templates().items()):
+        entry = bundle['stylesheets'].get(name)
+        if entry is None or entry['source'] != template.source_hash or entry['values'] != template.get_values(values):
+            stale.append(name)
+    return stale
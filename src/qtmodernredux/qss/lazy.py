@@ -0,0 +1,112 @@
+from typing import Any, Dict, List, Sequence, Set, Tuple
+from PySide2.QtCore import QTimer
+from PySide2.QtWidgets import QApplication, QProxyStyle, QWidget
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Lazy per-widget-class style-sheet activation.
+A style-sheet is split into fragments, each of which styles one or more widget classes. Only the fragments of
+widget classes which have actually been polished are part of the application style-sheet - Qt's style-sheet
+engine doesn't have to parse and cascade rules for widgets the application never creates.
+Fragments activated while widgets are polished are applied together once the event loop is idle: setting the
+application style-sheet re-polishes every widget, which must not happen from within a polish call.
+"""
+
+
+class LazyStyleSheetStyle(QProxyStyle):
+    """
+    QProxyStyle which activates style-sheet fragments when the first widget of a matching class is polished.
+    Fragments are given as (class names, qss) tuples in cascade order; fragments without class names are always
+    active. QSS that was appended to the application style-sheet after this style's fragments is kept.
+    """
+
+    def __init__(self, base_style: str, fragments: Sequence[Tuple[Sequence[str], str]]) -> None:
+        super().__init__(base_style)
+        self.__seen_classes: Set[str] = set()  # class names of polished widgets
+        self.__seen_base_classes: Set[str] = set()  # class names of polished widgets and all their base classes
+        self.__fragments: List[Tuple[Sequence[str], str]] = []
+        self.__active: List[bool] = []
+        self.__fragment_classes: Dict[str, List[int]] = {}  # widget class name -> fragment indices
+        self.__stylesheet: str = ''
+        self.__enabled: bool = False
+        self.__apply_scheduled: bool = False
+        self.set_fragments(fragments)
+
+    def set_fragments(self, fragments: Sequence[Tuple[Sequence[str], str]]) -> str:
+        """
+        Replaces the fragments, e.g. when switching styles. Fragments of already polished widget classes are active
+        right away. Returns the new style-sheet; applying it is up to the caller.
+        """
+        self.__fragments = list(fragments)
+        self.__active = [len(class_names) == 0 or any([name in self.__seen_base_classes for name in class_names])
+                         for class_names, _ in self.__fragments]
+        self.__fragment_classes = {}
+        for index, (class_names, _) in enumerate(self.__fragments):
+            for class_name in class_names:
+                self.__fragment_classes.setdefault(class_name, []).append(index)
+        self.__stylesheet = self.__build_stylesheet()
+        self.__enabled = not all(self.__active)
+        return self.__stylesheet
+
+    def get_stylesheet(self) -> str:
+        """Returns the style-sheet made up of the active fragments, as last applied"""
+        return self.__stylesheet
+
+    def get_active_fragment_count(self) -> int:
+        """Returns the number of active fragments"""
+        return sum(self.__active)
+
+    def polish(self, widget: Any) -> None:  # pylint: disable=arguments-differ
+        """
+        Qt polish: activates the fragments of unseen widget classes in the widget's window. They are applied when the
+        event loop is idle, together with the fragments activated by other windows in the meantime
+        """
+        super().polish(widget)
+        if not self.__enabled or not isinstance(widget, QWidget):
+            return
+        class_name: Any = widget.metaObject().className()
+        if class_name in self.__seen_classes:
+            return
+        window = widget.window()
+        activated = False
+        for child in [window] + list(window.findChildren(QWidget)):
+            activated = self.__activate(child) or activated
+        if activated and not self.__apply_scheduled:
+            self.__apply_scheduled = True
+            QTimer.singleShot(0, self.__apply)
+
+    def __activate(self, widget: QWidget) -> bool:
+        """Activates the fragments of the widget's class and its base classes. Returns True if any were activated"""
+        meta_object: Any = widget.metaObject()
+        if meta_object.className() in self.__seen_classes:
+            return False
+        self.__seen_classes.add(meta_object.className())
+        activated = False
+        while meta_object is not None:
+            self.__seen_base_classes.add(meta_object.className())
+            for index in self.__fragment_classes.get(meta_object.className(), []):
+                if not self.__active[index]:
+                    self.__active[index] = True
+                    activated = True
+            meta_object = meta_object.superClass()
+        return activated
+
+    def __apply(self) -> None:
+        """Re-applies the application style-sheet with all active fragments"""
+        self.__apply_scheduled = False
+        app = QApplication.instance()
+        current = app.styleSheet()
+        if not current.startswith(self.__stylesheet):  # the style-sheet was replaced, stop managing it
+            self.__enabled = False
+            return
+        extra = current[len(self.__stylesheet):]
+        self.__stylesheet = self.__build_stylesheet()
+        self.__enabled = not all(self.__active)
+        app.setStyleSheet(self.__stylesheet + extra)
+
+    def __build_stylesheet(self) -> str:
+        """Returns the active fragments in cascade order"""
+        return ''.join([qss for (_, qss), active in zip(self.__fragments, self.__active) if active])
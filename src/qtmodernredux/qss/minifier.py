@@ -0,0 +1,146 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from qtmodernredux.qss.rules import parse_rules
+
+
+__author__ = "Robert Kist"
+
+
+"""
+QSS minifier.
+Reduces the amount of QSS Qt has to parse and match, without changing which declarations apply to a widget:
+* comments and redundant whitespace are removed
+* a property declared more than once in a block only keeps its last declaration
+* a declaration is dropped if a later rule with the same selector declares the same property
+* rules with identical declaration blocks, or identical selectors, are merged - but only if no rule in between could
+  style the same widget (or sub-control) with a property of the same family, e.g. 'border' and 'border-left'
+"""
+
+
+WHITESPACE_RE = re.compile(r'\s+')
+CHILD_COMBINATOR_RE = re.compile(r'\s*>\s*')
+COMPOUND_SELECTOR_RE = re.compile(r'[^\s>]+$')  # last compound selector, i.e. the styled element
+TYPE_SELECTOR_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)')
+SUB_CONTROL_RE = re.compile(r'::([A-Za-z-]+)')
+MINIFY_CACHE_SIZE: int = 64
+
+
+Declaration = Tuple[str, str]  # (property, value)
+
+
+class Rule:
+    """A QSS rule: a list of selectors and a list of declarations"""
+
+    def __init__(self, selectors: List[str], declarations: List[Declaration]) -> None:
+        self.selectors: List[str] = selectors
+        self.declarations: List[Declaration] = declarations
+        # rules with '!important' declarations are left as they are
+        self.mergeable: bool = not any('!important' in value for _, value in declarations)
+
+    def get_families(self) -> List[str]:
+        """Returns the property families of all declarations, e.g. 'border' for 'border-top-left-radius'"""
+        return [get_property_family(name) for name, _ in self.declarations]
+
+    def to_qss(self) -> str:
+        """Returns the rule as minified QSS"""
+        return '%s{%s}' % (','.join(self.selectors), ';'.join('%s:%s' % d for d in self.declarations))
+
+
+def get_property_family(name: str) -> str:
+    """Returns the family of a property, i.e. the shorthand property which may override it"""
+    return name.split('-')[0]
+
+
+def get_subject(selector: str) -> Tuple[Optional[str], Optional[str]]:
+    """Returns the widget type (None if any type may match) and sub-control which a selector styles"""
+    match = COMPOUND_SELECTOR_RE.search(selector)
+    compound = match.group(0) if match else selector
+    type_match = TYPE_SELECTOR_RE.match(compound)
+    sub_control = SUB_CONTROL_RE.search(compound)
+    return (type_match.group(1) if type_match else None), (sub_control.group(1) if sub_control else None)
+
+
+def could_match_same(selector_a: str, selector_b: str) -> bool:
+    """Returns False if two selectors can't style the same widget or sub-control, True if they might"""
+    type_a, sub_control_a = get_subject(selector_a)
+    type_b, sub_control_b = get_subject(selector_b)
+    if sub_control_a != sub_control_b:
+        return False
+    if type_a is None or type_b is None or type_a == type_b:
+        return True
+    from PySide2 import QtWidgets  # pylint: disable=import-outside-toplevel
+    class_a = getattr(QtWidgets, type_a, None)
+    class_b = getattr(QtWidgets, type_b, None)
+    if not isinstance(class_a, type) or not isinstance(class_b, type):
+        return True  # unknown widget class, e.g. a custom widget
+    return issubclass(class_a, class_b) or issubclass(class_b, class_a)  # type selectors match subclasses too
+
+
+def conflicts(rule_a: Rule, rule_b: Rule) -> bool:
+    """Returns True if the order of two rules may matter"""
+    if not set(rule_a.get_families()).intersection(rule_b.get_families()):
+        return False
+    return any(could_match_same(a, b) for a in rule_a.selectors for b in rule_b.selectors)
+
+
+def parse(qss: str) -> List[Rule]:
+    """Parses a style-sheet into rules with normalized selectors and values. Duplicate properties are dropped"""
+    rules: List[Rule] = []
+    for selector_text, declaration_text in parse_rules(qss):
+        selectors: List[str] = []
+        for selector in selector_text.split(','):
+            selector = CHILD_COMBINATOR_RE.sub('>', WHITESPACE_RE.sub(' ', selector.strip()))
+            if selector not in selectors:
+                selectors.append(selector)
+        declarations: List[Declaration] = []
+        for declaration in declaration_text.split(';'):
+            name, _, value = declaration.partition(':')
+            name = name.strip()
+            if name:
+                declarations = [d for d in declarations if d[0] != name]  # the last declaration wins
+                declarations.append((name, WHITESPACE_RE.sub(' ', value.strip())))
+        rules.append(Rule(selectors, declarations))
+    return rules
+
+
+def is_overridden(name: str, rule: Rule, later_rules: List[Rule]) -> bool:
+    """Returns True if a later rule declares the property again, for each of the rule's selectors"""
+    return all(any(selector in other.selectors and name in [n for n, _ in other.declarations] for other in later_rules)
+               for selector in rule.selectors)
+
+
+def drop_overridden(rules: List[Rule]) -> List[Rule]:
+    """Drops declarations which a later rule with the same selector declares again"""
+    for index, rule in enumerate(rules):
+        if rule.mergeable:
+            rule.declarations = [d for d in rule.declarations if not is_overridden(d[0], rule, rules[index + 1:])]
+    return [rule for rule in rules if rule.declarations]
+
+
+def merge(rules: List[Rule]) -> List[Rule]:
+    """Merges rules with identical declaration blocks or identical selectors into the earlier rule"""
+    merged: List[Rule] = []
+    for rule in rules:
+        for index in range(len(merged) - 1 if rule.mergeable else -1, -1, -1):
+            target = merged[index]
+            if not target.mergeable:
+                continue
+            if target.declarations == rule.declarations:
+                if not any(conflicts(rule, other) for other in merged[index + 1:]):
+                    target.selectors += [s for s in rule.selectors if s not in target.selectors]
+                    break
+            elif target.selectors == rule.selectors:
+                if not any(conflicts(rule, other) for other in merged[index + 1:]):
+                    names = [name for name, _ in rule.declarations]
+                    target.declarations = [d for d in target.declarations if d[0] not in names] + rule.declarations
+                    break
+        else:
+            merged.append(rule)
+    return merged
+
+
+@lru_cache(maxsize=MINIFY_CACHE_SIZE)
+def minify(qss: str) -> str:
+    """Returns the minified style-sheet. Results are cached"""
+    return ''.join(rule.to_qss() for rule in merge(drop_overridden(parse(qss))))
@@ -0,0 +1,40 @@
+import re
+from typing import List, Tuple
+
+
+__author__ = "Robert Kist"
+
+
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def parse_rules(qss: str) -> List[Tuple[str, str]]:
+    """
+    Splits a QSS style-sheet into a list of (selectors, declarations) tuples.
+    Comments are removed. QSS has no nested blocks, so each rule ends at the first closing brace.
+    """
+    qss = COMMENT_RE.sub('', qss)
+    rules: List[Tuple[str, str]] = []
+    pos: int = 0
+    while True:
+        start = qss.find('{', pos)
+        if start == -1:
+            break
+        end = qss.find('}', start)
+        assert end != -1, "ERROR: unterminated QSS rule: %s" % qss[pos:start].strip()
+        rules.append((qss[pos:start].strip(), qss[start + 1:end].strip()))
+        pos = end + 1
+    return rules
+
+
+def scope_stylesheet(qss: str, scope: str) -> str:
+    """
+    Prefixes every selector of a style-sheet with the given scope selector, e.g. '#btnClose' becomes
+    '.ModernWindow #btnClose' for scope '.ModernWindow'. This allows window specific rules to live in the
+    application style-sheet without affecting other widgets.
+    """
+    scoped: List[str] = []
+    for selectors, declarations in parse_rules(qss):
+        selector = ', '.join('%s %s' % (scope, s.strip()) for s in selectors.split(','))
+        scoped.append('%s {\n    %s\n}\n' % (selector, declarations))
+    return '\n'.join(scoped)
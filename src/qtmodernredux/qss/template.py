@@ -0,0 +1,85 @@
+import re
+import hashlib
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from qtmodernredux.qss.minifier import minify as minify_stylesheet
+
+
+__author__ = "Robert Kist"
+
+
+PLACEHOLDER_RE = re.compile(r'{([A-Z][A-Z0-9_]*)}')  # matches '{CONSTANT_NAME}' but not QSS blocks
+
+
+def get_constants(constants: Any) -> Dict[str, Any]:
+    """Returns all annotated constants of a style's Constants class as a {name: value} dictionary"""
+    values: Dict[str, Any] = {}
+    for cls in reversed(type.mro(constants)):  # annotations of subclasses override those of base classes
+        for var in vars(cls).get('__annotations__', {}):
+            values[var] = getattr(constants, var)
+    return values
+
+
+class QssTemplate:
+    """
+    A QSS style-sheet template with '{CONSTANT_NAME}' placeholders.
+    The template is parsed once into a list of literal and placeholder segments. Rendered style-sheets are memoized
+    by the values of the placeholders they use, so rendering the same template with the same constants again only
+    costs a dictionary lookup.
+    Placeholders without a value are left in the output unchanged.
+    If minify is True, rendered style-sheets are minified (see minifier.py). Only use this for templates which are
+    rendered with all placeholders filled in.
+    """
+
+    def __init__(self, qss: str, minify: bool = False) -> None:
+        """Constructor: compiles the template"""
+        self.__minify: bool = minify
+        self.__segments: List[Tuple[str, bool]] = []  # (text, is_placeholder)
+        pos: int = 0
+        for match in PLACEHOLDER_RE.finditer(qss):
+            if match.start() > pos:
+                self.__segments.append((qss[pos:match.start()], False))
+            self.__segments.append((match.group(1), True))
+            pos = match.end()
+        if pos < len(qss):
+            self.__segments.append((qss[pos:], False))
+        self.__placeholders: Tuple[str, ...] = tuple(sorted({text for text, is_var in self.__segments if is_var}))
+        self.__cache: Dict[Tuple[Optional[str], ...], str] = {}
+        self.__source_hash: str = hashlib.sha1(('%s%s' % (minify, qss)).encode('utf-8')).hexdigest()
+
+    @property
+    def placeholders(self) -> Tuple[str, ...]:
+        """Returns the names of all placeholders used in the template"""
+        return self.__placeholders
+
+    @property
+    def source_hash(self) -> str:
+        """Returns a hash of the template source, used to match pre-rendered style-sheets to their template"""
+        return self.__source_hash
+
+    def __get_key(self, values: Mapping[str, Any]) -> Tuple[Optional[str], ...]:
+        """Returns the memoization key for the given placeholder values"""
+        return tuple(str(values[var]) if var in values else None for var in self.__placeholders)
+
+    def get_values(self, values: Mapping[str, Any]) -> Dict[str, str]:
+        """Returns the subset of values which is used by this template's placeholders, converted to strings"""
+        return {var: str(values[var]) for var in self.__placeholders if var in values}
+
+    def prime(self, values: Mapping[str, Any], qss: str) -> None:
+        """Adds a pre-rendered style-sheet to the memoization cache"""
+        self.__cache[self.__get_key(values)] = qss
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Returns the style-sheet with all placeholders replaced by their values"""
+        key = self.__get_key(values)
+        qss = self.__cache.get(key)
+        if qss is None:
+            qss = ''.join(('{%s}' % text if text not in values else str(values[text])) if is_var else text
+                          for text, is_var in self.__segments)
+            if self.__minify:
+                qss = minify_stylesheet(qss)
+            self.__cache[key] = qss
+        return qss
+
+    def clear_cache(self) -> None:
+        """Discards all memoized style-sheets"""
+        self.__cache.clear()
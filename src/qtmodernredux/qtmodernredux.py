@@ -1,17 +1,32 @@
 import sys
-from typing import Any, Sequence, Optional, Union
+import time
+import shiboken2
+from typing import TYPE_CHECKING, Any, Sequence, Optional, Union
 from PySide2.QtWidgets import QApplication, QTabWidget, QWidget
-from PySide2.QtGui import Qt, QFontDatabase, QColor
-import qtmodernredux.resources.qt_resources  # pylint: disable=unused-import
-from qtmodernredux.windowstyle.modernwindow import ModernWindow, WINDOW_BUTTONS_LEFT, WINDOW_BUTTONS_RIGHT
-from .apl_style import Style
+from PySide2.QtGui import Qt, QFont, QColor
+from qtmodernredux import IMPORT_STARTED
+from qtmodernredux.resources import Resources
+from qtmodernredux import windowstyle  # window classes are imported on first use
+from qtmodernredux.windowstyle import WINDOW_BUTTONS_LEFT, WINDOW_BUTTONS_RIGHT, QSS_CLASS
+from .styles import StyleRegistry, BUILTIN_STYLES
+from .theme import get_theme
+from .fonts import FontLoader, FONTS_MINIMAL, FONTS_IDLE, FONTS_ALL
+from .qss import LazyStyleSheetStyle, minify, scope_stylesheet
+from .qss.bundle import get_bundle_path, load_bundle
+from .profiler import StartupProfiler
+
+if TYPE_CHECKING:
+    from qtmodernredux.windowstyle.modernwindow import ModernWindow
 
 
 __author__ = "Robert Kist"
 
 
-STYLES_LIST = ['APL']  # list of built-in style
+STYLES_LIST = list(BUILTIN_STYLES.keys())  # list of built-in styles
 DEFAULT_STYLE = 'APL'
+IMPORT_FINISHED: float = time.perf_counter()  # end of 'import qtmodernredux' and this module, for the profiler
+ENGINE_QSS: str = 'qss'  # widgets are styled with Qt style-sheets
+ENGINE_NATIVE: str = 'native'  # widgets are painted by the style's QProxyStyle, without style-sheets
 
 
 class QtModernRedux:
@@ -20,8 +35,15 @@ class QtModernRedux:
     """
     WINDOW_BUTTONS_RIGHT = WINDOW_BUTTONS_RIGHT
     WINDOW_BUTTONS_LEFT = WINDOW_BUTTONS_LEFT
+    ENGINE_QSS = ENGINE_QSS
+    ENGINE_NATIVE = ENGINE_NATIVE
+    FONTS_MINIMAL = FONTS_MINIMAL
+    FONTS_IDLE = FONTS_IDLE
+    FONTS_ALL = FONTS_ALL
     __style: str = DEFAULT_STYLE
     __style_object: Optional[Any] = None
+    __engine: str = ENGINE_QSS
+    __lazy_style: Optional[LazyStyleSheetStyle] = None
 
     @classmethod
     def wrap(cls,
@@ -35,57 +57,85 @@ class QtModernRedux:
              titlebar_text_color: Optional[QColor] = None,
              titlebar_widget: Optional[Union[QWidget, QTabWidget]] = None,
              window_buttons_position: Optional[str] = None,
-             native_window: bool = False) -> Union[ModernWindow, Any]:
-        """Wraps the given widget into a styled window frame"""
+             native_window: bool = False,
+             system_move_resize: bool = False) -> Union['ModernWindow', Any]:
+        """
+        Wraps the given widget into a styled window frame.
+        With system_move_resize, the window manager moves and resizes the window when the title-bar or the window
+        frame is dragged, where the platform supports it.
+        """
         assert cls.__style_object is not None, "ERROR: must create a QModernRedux qApplication object first"
         if native_window:  # use window chrome provided by OS
-            window.setStyleSheet(cls.__style_object.get_window_stylesheet())
             return window
-        return ModernWindow(window=window,
-                            parent=parent,
-                            style=cls.__style_object,
-                            title_bar=title_bar,
-                            transparent_window=transparent_window,
-                            titlebar_height=titlebar_height,
-                            titlebar_color=titlebar_color,
-                            titlebar_nofocus_color=titlebar_nofocus_color,
-                            titlebar_text_color=titlebar_text_color,
-                            titlebar_widget=titlebar_widget,
-                            window_buttons_position=window_buttons_position)
+        name = StartupProfiler.get_numbered_name(type(window).__name__)
+        with StartupProfiler.phase('wrap: %s' % name):
+            modern_window = windowstyle.ModernWindow(window=window,
+                                                     parent=parent,
+                                                     style=cls.__style_object,
+                                                     title_bar=title_bar,
+                                                     transparent_window=transparent_window,
+                                                     titlebar_height=titlebar_height,
+                                                     titlebar_color=titlebar_color,
+                                                     titlebar_nofocus_color=titlebar_nofocus_color,
+                                                     titlebar_text_color=titlebar_text_color,
+                                                     titlebar_widget=titlebar_widget,
+                                                     window_buttons_position=window_buttons_position,
+                                                     system_move_resize=system_move_resize)
+        StartupProfiler.watch_window(modern_window, name)
+        return modern_window
+
+    @classmethod
+    def enable_dialog_pool(cls, size: int = 2, window_buttons_position: Optional[str] = None) -> None:
+        """
+        Keeps up to size wrapped message boxes ready for message_box(). They are built when the event loop is idle
+        and recycled once they are closed. A size of 0 disables the pool.
+        """
+        assert cls.__style_object is not None, "ERROR: must create a QModernRedux qApplication object first"
+        windowstyle.DialogPool.enable(size, cls.__style_object, window_buttons_position)
 
     @classmethod
-    def __load_custom_fonts(cls) -> None:
-        """Loads custom fonts - must be called after the QApplication object has been constructed"""
-        font_list = [
-            ':/third_party/fonts/Roboto/Roboto-Black.ttf',
-            ':/third_party/fonts/Roboto/Roboto-BlackItalic.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Bold.ttf',
-            ':/third_party/fonts/Roboto/Roboto-BoldItalic.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Italic.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Light.ttf',
-            ':/third_party/fonts/Roboto/Roboto-LightItalic.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Medium.ttf',
-            ':/third_party/fonts/Roboto/Roboto-MediumItalic.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Regular.ttf',
-            ':/third_party/fonts/Roboto/Roboto-Thin.ttf',
-            ':/third_party/fonts/Roboto/Roboto-ThinItalic.ttf',
-        ]
-        for font in font_list:
-            assert QFontDatabase.addApplicationFont(font) != -1, "ERROR: could not load font: %s" % font
+    def message_box(cls, parent: Optional[QWidget] = None,
+                    window_buttons_position: Optional[str] = None) -> 'ModernWindow':
+        """
+        Returns a wrapped, empty QMessageBox, taken from the dialog pool (see enable_dialog_pool()) if possible.
+        Set it up like a wrapped QMessageBox, e.g. with setIcon(), setText() and setStandardButtons(), and show it with
+        exec_(), which returns the clicked standard button.
+        The message box is recycled once it is closed and must not be used after that.
+        """
+        assert cls.__style_object is not None, "ERROR: must create a QModernRedux qApplication object first"
+        return windowstyle.DialogPool.acquire(cls.__style_object, parent, window_buttons_position)
+
+    @classmethod
+    def load_font(cls, weight: int = QFont.Normal, italic: bool = False) -> None:
+        """
+        Loads the bundled Roboto font closest to the given QFont weight, e.g. QFont.Light, unless it was loaded
+        already. Only needed with FONTS_MINIMAL, for fonts other than Roboto Regular and Bold.
+        """
+        FontLoader.require(weight, italic)
 
     @classmethod
     def get_style(cls, style_name: str) -> Optional[Any]:
         """
-        Returns a style object from the built-in styles. Returns None if style not found
+        Returns a style object from the built-in, registered or installed styles. Returns None if style not found
         """
-        if style_name == 'APL':
-            return Style
-        return None
+        return StyleRegistry.load(style_name)
+
+    @classmethod
+    def register_style(cls, style_name: str, style: Any) -> None:
+        """
+        Registers a style under the given name, so that it can be selected by name in QApplication() and
+        set_style(). The style can also be given as a 'module:attribute' string, which is imported on first use.
+        """
+        StyleRegistry.register(style_name, style)
 
     @classmethod
     def QApplication(cls, argv: Optional[Sequence[Any]] = None,
                      style_name: Optional[str] = None,
-                     style: Any = None) -> QApplication:  # pylint: disable=dangerous-default-value
+                     style: Any = None,
+                     engine: str = ENGINE_QSS,
+                     lazy_stylesheet: bool = False,
+                     fonts: str = FONTS_IDLE,
+                     profile: bool = False) -> QApplication:  # pylint: disable=dangerous-default-value
         """
         This method returns a QApplication object with all the settings applied to make this theme
         work flawlessly across different platforms and screens with different DPI settings.
@@ -93,18 +143,108 @@ class QtModernRedux:
             * argv: pass sys.argv contents
             * style_name: name of the application style
             * style: an object which carries the appropriate arguments and methods to act as a style
+            * engine: ENGINE_QSS (default) styles widgets with Qt style-sheets. ENGINE_NATIVE paints widgets with
+              the style's QProxyStyle instead, which is faster but requires the style to implement
+              apply_native_theme()
+            * lazy_stylesheet: opt-in, e.g. for small tools which only use a few widget classes. Only adds the QSS
+              of a widget class to the application style-sheet once the first widget of that class is polished
+              (ENGINE_QSS only, requires the style to implement apply_lazy_theme()). The QSS is added when the event
+              loop is next idle, so a widget of a new class may briefly be shown unstyled, and every batch of new
+              classes re-applies the application style-sheet, which re-polishes all existing widgets
+            * fonts: the bundled Roboto Regular and Bold fonts are always loaded at startup. FONTS_IDLE (default) loads
+              the other weights when the event loop is idle, FONTS_MINIMAL only when requested with load_font() and
+              FONTS_ALL right away
+            * profile: print the time each start-up phase takes, up to the first frame of the first wrapped window.
+              Can also be enabled with the QTMODERNREDUX_PROFILE environment variable, see profiler.py
         """
         argv = [] if argv is None else argv
-        style_name = 'APL' if style_name is None else style_name
-        assert style_name in STYLES_LIST, "ERROR: unknown style %s" % style
+        style_name = DEFAULT_STYLE if style_name is None else style_name
+        assert engine in [ENGINE_QSS, ENGINE_NATIVE], "ERROR: unknown engine %s" % engine
+        assert fonts in [FONTS_MINIMAL, FONTS_IDLE, FONTS_ALL], "ERROR: unknown font mode %s" % fonts
+        if profile:
+            StartupProfiler.enable()
+        StartupProfiler.record('import qtmodernredux', IMPORT_STARTED, IMPORT_FINISHED)
         cls.__style = style_name
+        cls.__engine = engine
+        with StartupProfiler.phase('load style'):
+            cls.__style_object = cls.get_style(style_name) if style is None else style
+        assert cls.__style_object is not None, "ERROR: unknown style %s" % style_name
         if sys.platform == "darwin":
             QApplication.setDesktopSettingsAware(False)
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        app = QApplication(argv)
-        cls.__load_custom_fonts()
+        with StartupProfiler.phase('create QApplication'):
+            app = QApplication(argv)
+        with StartupProfiler.phase('register resources'):
+            Resources.register()
+        with StartupProfiler.phase('load fonts'):
+            FontLoader.load_startup_fonts(fonts)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-        cls.__style_object = cls.get_style(style_name) if style is None else style
-        assert cls.__style_object is not None, "ERROR: cannot load default style"
-        cls.__style_object.apply_theme(app)
+        with StartupProfiler.phase('apply theme'):
+            if engine == ENGINE_NATIVE:
+                assert hasattr(cls.__style_object, 'apply_native_theme'), "ERROR: style doesn't support native engine"
+                cls.__style_object.apply_native_theme(app)
+                return app
+            if style is None and style_name in STYLES_LIST:  # built-in styles ship with pre-rendered style-sheets
+                load_bundle(cls.__style_object, get_bundle_path(style_name))
+            if lazy_stylesheet and hasattr(cls.__style_object, 'apply_lazy_theme'):
+                cls.__lazy_style = cls.__style_object.apply_lazy_theme(app)
+            else:
+                cls.__style_object.apply_theme(app)
+            cls.__apply_window_stylesheet()
         return app
+
+    @classmethod
+    def set_style(cls, style: Any) -> None:
+        """
+        Switches the running application to another style, given as a style object or the name of a
+        built-in, registered or installed style.
+        The new style-sheet and palette are compared with the current ones and only applied if they differ, as
+        applying either re-polishes or updates every widget. All ModernWindows are updated in place.
+        Styles which don't implement get_palette() and get_widget_stylesheet() are applied in full.
+        """
+        assert cls.__style_object is not None, "ERROR: must create a QModernRedux qApplication object first"
+        if isinstance(style, str):
+            style_name = style
+            style = cls.get_style(style_name)
+            assert style is not None, "ERROR: unknown style %s" % style_name
+            cls.__style = style_name
+        app = QApplication.instance()
+        cls.__style_object = style
+        if cls.__engine == ENGINE_NATIVE:
+            assert hasattr(style, 'apply_native_theme'), "ERROR: style doesn't support native engine"
+            style.apply_native_theme(app)
+        elif not (hasattr(style, 'get_palette') and hasattr(style, 'get_widget_stylesheet')):
+            cls.__lazy_style = None
+            style.apply_theme(app)
+            cls.__apply_window_stylesheet()
+        else:
+            if cls.__lazy_style is not None and not shiboken2.isValid(cls.__lazy_style):
+                cls.__lazy_style = None  # the application's QStyle was replaced
+            if cls.__lazy_style is not None and hasattr(style, 'get_widget_stylesheet_fragments'):
+                widget_qss = cls.__lazy_style.set_fragments(style.get_widget_stylesheet_fragments())
+            else:
+                widget_qss = style.get_widget_stylesheet()
+            palette = get_theme(style).palette
+            if palette != app.palette():
+                app.setPalette(palette)
+            stylesheet = '%s\n%s' % (widget_qss, cls.__get_window_stylesheet())
+            if stylesheet != app.styleSheet():
+                app.setStyleSheet(stylesheet)
+        for window in app.topLevelWidgets():
+            if isinstance(window, windowstyle.ModernWindow):
+                window.set_style(style)
+
+    @classmethod
+    def __get_window_stylesheet(cls) -> str:
+        """Returns the window-chrome QSS of the current style, scoped to ModernWindow instances"""
+        assert cls.__style_object is not None
+        return minify(scope_stylesheet(cls.__style_object.get_window_stylesheet(), '.%s' % QSS_CLASS))
+
+    @classmethod
+    def __apply_window_stylesheet(cls) -> None:
+        """
+        Adds the window-chrome QSS to the application style-sheet, scoped to ModernWindow instances.
+        Must be called after the style's apply_theme() method, as apply_theme() replaces the application style-sheet.
+        """
+        app = QApplication.instance()
+        app.setStyleSheet('%s\n%s' % (app.styleSheet(), cls.__get_window_stylesheet()))
@@ -0,0 +1,37 @@
+import os
+import importlib
+from PySide2.QtCore import QResource
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Qt resources (fonts, icons).
+'make resources' compiles them into a binary resource file, qtmodernredux.rcc, which Qt memory-maps when it is
+registered - the resource data is never copied into Python objects. The generated qt_resources.py module, which
+holds the same data as Python byte literals, is only imported if the binary resource file is missing or can't be
+registered.
+"""
+
+
+RESOURCES_RCC: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qtmodernredux.rcc')
+RESOURCES_MODULE: str = 'qtmodernredux.resources.qt_resources'
+REGISTERED_RCC: str = 'rcc'
+REGISTERED_MODULE: str = 'module'
+
+
+class Resources:
+    """Registers the package's Qt resources once"""
+    __registered: str = ''  # REGISTERED_RCC or REGISTERED_MODULE once registered
+
+    @classmethod
+    def register(cls) -> str:
+        """Registers the Qt resources, if not registered yet. Returns REGISTERED_RCC or REGISTERED_MODULE"""
+        if not cls.__registered:
+            if os.path.isfile(RESOURCES_RCC) and QResource.registerResource(RESOURCES_RCC):
+                cls.__registered = REGISTERED_RCC
+            else:
+                importlib.import_module(RESOURCES_MODULE)  # registers its resources when imported
+                cls.__registered = REGISTERED_MODULE
+        return cls.__registered
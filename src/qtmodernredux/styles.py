@@ -0,0 +1,73 @@
+import sys
+import importlib
+from typing import Any, Dict, List, Optional
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Style registry.
+Styles are registered by name and only imported when they are loaded. Besides the built-in styles, installed
+packages can provide styles through the 'qtmodernredux.styles' entry point group, e.g. in setup.cfg:
+    [options.entry_points]
+    qtmodernredux.styles =
+        WOW = wow_style:Style
+"""
+
+
+ENTRY_POINT_GROUP: str = 'qtmodernredux.styles'
+BUILTIN_STYLES: Dict[str, str] = {  # name -> 'module:attribute' of the style object
+    'APL': 'qtmodernredux.apl_style:Style',
+}
+
+
+class StyleRegistry:
+    """Maps style names to style objects, which are imported on first use"""
+    __styles: Dict[str, Any] = dict(BUILTIN_STYLES)  # name -> 'module:attribute', entry point or style object
+    __loaded: Dict[str, Any] = {}  # name -> style object
+    __entry_points_discovered: bool = False
+
+    @classmethod
+    def register(cls, name: str, style: Any) -> None:
+        """Registers a style object, or a 'module:attribute' string which is imported when the style is loaded"""
+        cls.__styles[name] = style
+        cls.__loaded.pop(name, None)
+
+    @classmethod
+    def get_names(cls) -> List[str]:
+        """Returns the names of all registered and installed styles"""
+        cls.__discover_entry_points()
+        return list(cls.__styles.keys())
+
+    @classmethod
+    def load(cls, name: str) -> Optional[Any]:
+        """Returns the style object registered under the given name, importing it if needed. None if not found"""
+        if name in cls.__loaded:
+            return cls.__loaded[name]
+        if name not in cls.__styles:
+            cls.__discover_entry_points()
+        if name not in cls.__styles:
+            return None
+        style = cls.__styles[name]
+        if isinstance(style, str):
+            module_name, _, attribute = style.partition(':')
+            style = getattr(importlib.import_module(module_name), attribute)
+        elif hasattr(style, 'load') and hasattr(style, 'group'):  # entry point
+            style = style.load()
+        cls.__loaded[name] = style
+        return style
+
+    @classmethod
+    def __discover_entry_points(cls) -> None:
+        """Adds the styles of installed packages; registered and built-in styles take precedence"""
+        if cls.__entry_points_discovered:
+            return
+        cls.__entry_points_discovered = True
+        from importlib.metadata import entry_points  # pylint: disable=import-outside-toplevel  # slow to import
+        if sys.version_info >= (3, 10):
+            styles = entry_points(group=ENTRY_POINT_GROUP)  # pylint: disable=unexpected-keyword-arg
+        else:
+            styles = entry_points().get(ENTRY_POINT_GROUP, [])
+        for entry_point in styles:
+            cls.__styles.setdefault(entry_point.name, entry_point)
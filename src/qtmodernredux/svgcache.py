@@ -0,0 +1,151 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Set, Tuple
+from PySide2.QtCore import QSize
+from PySide2.QtGui import Qt, QGuiApplication, QPainter, QPixmap, QScreen
+from PySide2.QtSvg import QSvgRenderer
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Process-wide cache of SVG files rendered to pixmaps, e.g. the message box icons of a style.
+Rendering a SVG parses the file and rasterizes it into a new pixmap; the cache does this once per (file, size,
+device pixel ratio). Least recently used pixmaps are evicted when the cache exceeds its memory limit.
+Files registered with prepopulate() are rendered for the device pixel ratios of all screens, and again when a screen
+is added or its device pixel ratio changes. Pixmaps for ratios which no screen uses anymore are dropped.
+Custom styles can use the cache for their own SVG files:
+    pixmap = SvgPixmapCache.get_pixmap(':/icons/my-icon.svg', QSize(16, 16), widget.devicePixelRatioF())
+"""
+
+
+DEFAULT_MAX_BYTES: int = 4 * 1024 * 1024  # memory limit of the cached pixmaps
+# (SVG file, size in device-independent pixels (None: the SVG's default size), device pixel ratio)
+CacheKey = Tuple[str, Optional[Tuple[int, int]], float]
+
+
+class SvgPixmapCache:
+    """Renders SVG files to pixmaps, keeps the most recently used pixmaps up to a memory limit"""
+    __pixmaps: 'OrderedDict[CacheKey, QPixmap]' = OrderedDict()
+    __bytes: int = 0
+    __max_bytes: int = DEFAULT_MAX_BYTES
+    __prepopulated: List[Tuple[str, Optional[Tuple[int, int]]]] = []  # (SVG file, size), see prepopulate()
+    __screens_watched: bool = False
+
+    @classmethod
+    def get_pixmap(cls, svg_file: str, size: Optional[QSize] = None, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """
+        Returns the SVG file rendered at the size in device-independent pixels (default: the SVG's default size),
+        for a screen with the device pixel ratio, e.g. a widget's devicePixelRatioF()
+        """
+        cls.__watch_screens()
+        key: CacheKey = (svg_file, None if size is None else (size.width(), size.height()), device_pixel_ratio)
+        pixmap = cls.__pixmaps.get(key)
+        if pixmap is not None:
+            cls.__pixmaps.move_to_end(key)
+            return pixmap
+        pixmap = cls.__render(svg_file, size, device_pixel_ratio)
+        cls.__add(key, pixmap)
+        return pixmap
+
+    @classmethod
+    def prepopulate(cls, svg_files: List[str], size: Optional[QSize] = None) -> None:
+        """
+        Renders the SVG files for the device pixel ratios of all screens, now and whenever screens are added or their
+        device pixel ratio changes
+        """
+        for svg_file in svg_files:
+            entry = (svg_file, None if size is None else (size.width(), size.height()))
+            if entry not in cls.__prepopulated:
+                cls.__prepopulated.append(entry)
+        for device_pixel_ratio in cls.__get_screen_ratios():
+            for svg_file in svg_files:
+                cls.get_pixmap(svg_file, size, device_pixel_ratio)
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes: int) -> None:
+        """Sets the memory limit of the cached pixmaps in bytes and evicts pixmaps if the cache exceeds it"""
+        assert max_bytes >= 0, "ERROR: the memory limit must not be negative"
+        cls.__max_bytes = max_bytes
+        cls.__evict()
+
+    @classmethod
+    def get_memory_usage(cls) -> int:
+        """Returns the memory used by the cached pixmaps in bytes"""
+        return cls.__bytes
+
+    @classmethod
+    def get_count(cls) -> int:
+        """Returns the number of cached pixmaps"""
+        return len(cls.__pixmaps)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Removes all pixmaps from the cache. Files registered with prepopulate() are rendered again on request"""
+        cls.__pixmaps.clear()
+        cls.__bytes = 0
+
+    @staticmethod
+    def __render(svg_file: str, size: Optional[QSize], device_pixel_ratio: float) -> QPixmap:
+        """Renders a SVG file and scales it correctly for High-DPI screens"""
+        svg_renderer = QSvgRenderer(svg_file)
+        pixmap = QPixmap((svg_renderer.defaultSize() if size is None else size) * device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter()
+        painter.begin(pixmap)
+        svg_renderer.render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    @staticmethod
+    def __get_bytes(pixmap: QPixmap) -> int:
+        """Returns the memory used by a pixmap in bytes"""
+        return int(pixmap.width() * pixmap.height() * pixmap.depth() // 8)
+
+    @classmethod
+    def __add(cls, key: CacheKey, pixmap: QPixmap) -> None:
+        """Adds a pixmap and evicts the least recently used pixmaps if the cache exceeds its memory limit"""
+        cls.__pixmaps[key] = pixmap
+        cls.__bytes += cls.__get_bytes(pixmap)
+        cls.__evict()
+
+    @classmethod
+    def __evict(cls) -> None:
+        """Removes the least recently used pixmaps until the cache is within its memory limit"""
+        while cls.__pixmaps and cls.__bytes > cls.__max_bytes:
+            _, pixmap = cls.__pixmaps.popitem(last=False)
+            cls.__bytes -= cls.__get_bytes(pixmap)
+
+    @staticmethod
+    def __get_screen_ratios() -> Set[float]:
+        """Returns the device pixel ratios of all screens"""
+        return {screen.devicePixelRatio() for screen in QGuiApplication.screens()}
+
+    @classmethod
+    def __watch_screens(cls) -> None:
+        """Updates the cache when screens are added or removed, or their device pixel ratio changes"""
+        app = QGuiApplication.instance()
+        if cls.__screens_watched or app is None:
+            return
+        cls.__screens_watched = True
+        app.screenAdded.connect(cls.__on_screen_added)  # pylint: disable=no-member
+        app.screenRemoved.connect(cls.__on_screens_changed)  # pylint: disable=no-member
+        for screen in QGuiApplication.screens():
+            screen.logicalDotsPerInchChanged.connect(cls.__on_screens_changed)
+
+    @classmethod
+    def __on_screen_added(cls, screen: QScreen) -> None:
+        """A screen was added: watches its device pixel ratio and updates the cache"""
+        screen.logicalDotsPerInchChanged.connect(cls.__on_screens_changed)
+        cls.__on_screens_changed()
+
+    @classmethod
+    def __on_screens_changed(cls, *_: Any) -> None:
+        """Drops pixmaps for device pixel ratios which no screen uses anymore and renders the prepopulated files"""
+        ratios = cls.__get_screen_ratios()
+        for key in [key for key in cls.__pixmaps if key[2] not in ratios]:
+            cls.__bytes -= cls.__get_bytes(cls.__pixmaps.pop(key))
+        for svg_file, size in cls.__prepopulated:
+            for device_pixel_ratio in ratios:
+                cls.get_pixmap(svg_file, None if size is None else QSize(*size), device_pixel_ratio)
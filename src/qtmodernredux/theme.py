@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+from PySide2.QtGui import QColor, QPen, QBrush, QFont, QPalette
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Precompiled themes.
+A Theme holds ready-made QColor, QPen, QBrush, QFont and QPalette objects for a style. It is created once per style
+(see get_theme()) and shared by all windows, so painting and applying a style doesn't have to create Qt objects from
+the style's color strings again. The Qt objects are shared: treat them as read-only.
+"""
+
+
+@dataclass(frozen=True)
+class Theme:  # pylint: disable=too-many-instance-attributes
+    """The Qt objects of a style. Use get_theme() to get the theme of a style"""
+    titlebar_color: QColor
+    titlebar_nofocus_color: QColor
+    titlebar_text_color: QColor
+    window_background_color: QColor
+    shadow_color: QColor  # includes the shadow's opacity
+    titlebar_brush: QBrush
+    titlebar_nofocus_brush: QBrush
+    titlebar_text_pen: QPen
+    window_background_pen: QPen
+    window_background_brush: QBrush
+    palette: Optional[QPalette]  # None if the style doesn't implement get_palette()
+    font: Optional[QFont]  # None if the style doesn't define FONT_FAMILY and FONT_SIZE_PX widget constants
+
+
+@lru_cache(maxsize=None)
+def get_theme(style: Any) -> Theme:
+    """
+    Returns the theme of a style. Themes are cached: if the constants of a style are changed after its theme was
+    created, call get_theme.cache_clear().
+    """
+    window = style.window
+    shadow_color = QColor(window.SHADOW_COLOR_RGB)
+    shadow_color.setAlpha(window.SHADOW_OPACITY_HEX)
+    widget: Any = getattr(style, 'widget', None)  # custom styles may only define window constants
+    font: Optional[QFont] = None
+    if hasattr(widget, 'FONT_FAMILY') and hasattr(widget, 'FONT_SIZE_PX'):
+        font = QFont(widget.FONT_FAMILY)
+        font.setPixelSize(widget.FONT_SIZE_PX)
+    return Theme(titlebar_color=QColor(window.TITLE_BAR_COLOR_RGB),
+                 titlebar_nofocus_color=QColor(window.TITLE_BAR_NOFOCUS_COLOR_RGB),
+                 titlebar_text_color=QColor(window.TITLE_BAR_FONT_COLOR_RGB),
+                 window_background_color=QColor(window.WINDOW_BACKGROUND_RGB),
+                 shadow_color=shadow_color,
+                 titlebar_brush=QBrush(QColor(window.TITLE_BAR_COLOR_RGB)),
+                 titlebar_nofocus_brush=QBrush(QColor(window.TITLE_BAR_NOFOCUS_COLOR_RGB)),
+                 titlebar_text_pen=QPen(QColor(window.TITLE_BAR_FONT_COLOR_RGB)),
+                 window_background_pen=QPen(QColor(window.WINDOW_BACKGROUND_RGB)),
+                 window_background_brush=QBrush(QColor(window.WINDOW_BACKGROUND_RGB)),
+                 palette=style.get_palette() if hasattr(style, 'get_palette') else None,
+                 font=font)
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, Any, Dict, List
+from qtmodernredux.lazyimport import get_lazy_attribute, get_lazy_dir
+from qtmodernredux.windowstyle.constants import WINDOW_BUTTONS_RIGHT, WINDOW_BUTTONS_LEFT, QSS_CLASS, \
+    DEFAULT_WINDOW_BUTTONS_POSITION
+
+if TYPE_CHECKING:
+    from qtmodernredux.windowstyle.modernwindow import ModernWindow
+    from qtmodernredux.windowstyle.windowresizer import WindowResizer
+    from qtmodernredux.windowstyle.windowtitlelabel import WindowTitleLabel
+    from qtmodernredux.windowstyle.windowframe import WindowFrame
+    from qtmodernredux.windowstyle.windowshadow import WindowShadow
+    from qtmodernredux.windowstyle.tabfilter import TabFilter
+    from qtmodernredux.windowstyle.dialogpool import DialogPool
+
+
+# window classes, imported on first access (see lazyimport.py)
+LAZY_ATTRIBUTES: Dict[str, str] = {
+    'ModernWindow': 'qtmodernredux.windowstyle.modernwindow',
+    'WindowResizer': 'qtmodernredux.windowstyle.windowresizer',
+    'WindowTitleLabel': 'qtmodernredux.windowstyle.windowtitlelabel',
+    'WindowFrame': 'qtmodernredux.windowstyle.windowframe',
+    'WindowShadow': 'qtmodernredux.windowstyle.windowshadow',
+    'TabFilter': 'qtmodernredux.windowstyle.tabfilter',
+    'DialogPool': 'qtmodernredux.windowstyle.dialogpool',
+}
+
+__all__ = ['ModernWindow', 'WindowResizer', 'WindowTitleLabel', 'WindowFrame', 'WindowShadow', 'TabFilter', 'DialogPool',
+           'WINDOW_BUTTONS_RIGHT', 'WINDOW_BUTTONS_LEFT', 'DEFAULT_WINDOW_BUTTONS_POSITION', 'QSS_CLASS']
+
+
+def __getattr__(name: str) -> Any:
+    """Imports window classes on first access"""
+    return get_lazy_attribute(__name__, LAZY_ATTRIBUTES, name)
+
+
+def __dir__() -> List[str]:
+    """Lists window classes which haven't been imported yet, too"""
+    return get_lazy_dir(__name__, LAZY_ATTRIBUTES)
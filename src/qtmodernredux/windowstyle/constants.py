@@ -0,0 +1,13 @@
+import sys
+
+
+__author__ = "Robert Kist"
+
+
+WINDOW_BUTTONS_RIGHT: str = 'window_buttons_right'
+WINDOW_BUTTONS_LEFT: str = 'window_buttons_left'
+# used when a window is wrapped without a window_buttons_position
+DEFAULT_WINDOW_BUTTONS_POSITION: str = WINDOW_BUTTONS_LEFT if sys.platform == 'darwin' else WINDOW_BUTTONS_RIGHT
+# value of the 'class' property of every ModernWindow. The window-chrome QSS is part of the application style-sheet
+# and scoped to this class, so wrapping a window doesn't require parsing a per-window style-sheet.
+QSS_CLASS: str = 'ModernWindow'
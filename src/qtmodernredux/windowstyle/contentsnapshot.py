@@ -0,0 +1,41 @@
+from typing import Any
+from PySide2.QtWidgets import QWidget
+from PySide2.QtGui import Qt, QPainter, QPaintEvent, QPixmap
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Stand-in for a window's content while the window is interactively resized (see ModernWindow.set_interaction_mode()).
+The snapshot is opaque, so Qt doesn't paint the content underneath it.
+"""
+
+
+class ContentSnapshot(QWidget):
+    """Shows a pixmap of a widget instead of the widget itself"""
+
+    def __init__(self, parent: Any) -> None:
+        """Constructor: the snapshot is hidden until show_snapshot() is called"""
+        super().__init__(parent)
+        self.__pixmap: QPixmap = QPixmap()
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.hide()
+
+    def show_snapshot(self, widget: QWidget) -> None:
+        """Covers the widget with a snapshot of it"""
+        self.__pixmap = widget.grab()
+        self.setGeometry(widget.geometry())
+        self.raise_()
+        self.show()
+
+    def hide_snapshot(self) -> None:
+        """Hides the snapshot and releases its pixmap"""
+        self.hide()
+        self.__pixmap = QPixmap()
+
+    def paintEvent(self, _: QPaintEvent) -> None:
+        """Qt Paint Event: draws the snapshot"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.__pixmap)
@@ -0,0 +1,161 @@
+from functools import partial
+from typing import Any, List, Optional, Tuple
+import shiboken2
+from PySide2.QtCore import QTimer
+from PySide2.QtWidgets import QMessageBox, QWidget
+from PySide2.QtGui import Qt
+from qtmodernredux.windowstyle.modernwindow import ModernWindow, get_msgbox_icons
+from qtmodernredux.windowstyle.constants import DEFAULT_WINDOW_BUTTONS_POSITION
+from qtmodernredux.svgcache import SvgPixmapCache
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Pool of pre-built message box windows.
+Building a wrapped QMessageBox creates a window, a frame, a title-bar and window buttons, and polishes all of them.
+The pool builds message boxes while the event loop is idle and recycles them once they are closed, so showing a
+message box only resets its title, icon, texts and buttons. The style's message box icons are rendered into the
+SVG pixmap cache while the event loop is idle, too.
+"""
+
+
+# (window buttons position, wrapper window, message box)
+PoolEntry = Tuple[str, ModernWindow, QMessageBox]
+
+
+class DialogPool:
+    """Builds, hands out and recycles wrapped QMessageBox objects"""
+    __size: int = 0
+    __style: Optional[Any] = None
+    __window_buttons_position: str = DEFAULT_WINDOW_BUTTONS_POSITION
+    __free: List[PoolEntry] = []
+    __in_use: List[PoolEntry] = []
+    __fill_scheduled: bool = False
+
+    @classmethod
+    def enable(cls, size: int, style: Any, window_buttons_position: Optional[str] = None) -> None:
+        """
+        Keeps up to size message boxes, including the ones which are shown. Missing message boxes are built one at a
+        time when the event loop is idle. A size of 0 disables the pool and releases the message boxes built so far.
+        """
+        assert size >= 0, "ERROR: pool size must not be negative"
+        cls.__size = size
+        cls.__style = style
+        if window_buttons_position is not None:
+            cls.__window_buttons_position = window_buttons_position
+        cls.__remove_deleted()
+        while cls.__free and cls.__get_count() > size:
+            cls.__free.pop()[1].deleteLater()
+        if size > 0:
+            QTimer.singleShot(0, partial(SvgPixmapCache.prepopulate, list(get_msgbox_icons(style).values())))
+        cls.__schedule_fill()
+
+    @classmethod
+    def get_size(cls) -> int:
+        """Returns the number of message boxes the pool keeps, including the ones which are shown"""
+        return cls.__size
+
+    @classmethod
+    def get_free_count(cls) -> int:
+        """Returns the number of message boxes which are ready to be shown"""
+        cls.__remove_deleted()
+        return len(cls.__free)
+
+    @classmethod
+    def acquire(cls, style: Any, parent: Optional[QWidget] = None,
+                window_buttons_position: Optional[str] = None) -> ModernWindow:
+        """
+        Returns an empty message box window: without title, icon, texts or buttons. Uses a pre-built window if there
+        is one, otherwise builds a new one. The window returns to the pool when it is closed, so don't use it anymore
+        once it was closed and another message box was requested.
+        """
+        position = DEFAULT_WINDOW_BUTTONS_POSITION if window_buttons_position is None else window_buttons_position
+        cls.__remove_deleted()
+        entry: Optional[PoolEntry] = None
+        for i, free_entry in enumerate(cls.__free):
+            if free_entry[0] == position:
+                entry = cls.__free.pop(i)
+                break
+        if entry is None:
+            entry = cls.__build(style, position)
+        _, window, message_box = entry
+        window.set_style(style)
+        window.prepare_reuse(parent)
+        cls.__reset(window, message_box)
+        cls.__in_use.append(entry)
+        return window
+
+    @classmethod
+    def __release(cls, entry: PoolEntry, _: int) -> None:
+        """Returns a closed message box to the pool, or deletes it if the pool is full"""
+        if entry in cls.__in_use:
+            cls.__in_use.remove(entry)
+        if cls.__get_count() < cls.__size:
+            cls.__free.append(entry)
+        else:
+            entry[1].deleteLater()
+
+    @classmethod
+    def __build(cls, style: Any, window_buttons_position: str) -> PoolEntry:
+        """Builds and polishes a wrapped message box"""
+        message_box = QMessageBox()
+        window = ModernWindow(window=message_box,
+                              parent=None,
+                              style=style,
+                              title_bar=True,
+                              transparent_window=True,
+                              titlebar_height=None,
+                              titlebar_color=None,
+                              titlebar_nofocus_color=None,
+                              titlebar_text_color=None,
+                              titlebar_widget=None,
+                              window_buttons_position=window_buttons_position,
+                              recyclable=True)
+        window.ensurePolished()  # also polishes all child widgets, which is the bulk of the work
+        entry = (window_buttons_position, window, message_box)
+        window.finished.connect(partial(cls.__release, entry))  # pylint: disable=no-member
+        return entry
+
+    @staticmethod
+    def __reset(window: ModernWindow, message_box: QMessageBox) -> None:
+        """Removes the title, icon, texts and buttons of a message box which was shown before"""
+        window.setWindowTitle('')
+        message_box.setIcon(QMessageBox.NoIcon)
+        message_box.setTextFormat(Qt.AutoText)
+        message_box.setText('')
+        message_box.setInformativeText('')
+        message_box.setDetailedText('')
+        message_box.setCheckBox(None)  # type: ignore
+        message_box.setStandardButtons(QMessageBox.NoButton)
+        for button in message_box.buttons():  # custom buttons
+            message_box.removeButton(button)
+            button.deleteLater()
+
+    @classmethod
+    def __get_count(cls) -> int:
+        """Returns the number of message boxes built by the pool which are ready or shown"""
+        return len(cls.__free) + len(cls.__in_use)
+
+    @classmethod
+    def __remove_deleted(cls) -> None:
+        """Removes message boxes which were deleted together with their parent window"""
+        cls.__free = [entry for entry in cls.__free if shiboken2.isValid(entry[1])]
+        cls.__in_use = [entry for entry in cls.__in_use if shiboken2.isValid(entry[1])]
+
+    @classmethod
+    def __schedule_fill(cls) -> None:
+        """Builds the next missing message box when the event loop is idle"""
+        if not cls.__fill_scheduled and cls.__style is not None and cls.__get_count() < cls.__size:
+            cls.__fill_scheduled = True
+            QTimer.singleShot(0, cls.__fill)
+
+    @classmethod
+    def __fill(cls) -> None:
+        """Builds one message box, then yields to the event loop before building the next one"""
+        cls.__fill_scheduled = False
+        cls.__remove_deleted()
+        if cls.__style is not None and cls.__get_count() < cls.__size:
+            cls.__free.append(cls.__build(cls.__style, cls.__window_buttons_position))
+            cls.__schedule_fill()
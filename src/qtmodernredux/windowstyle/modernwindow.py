@@ -1,15 +1,21 @@
 import sys
-from typing import Any, Optional, Union
-from PySide2.QtSvg import QSvgRenderer
-from PySide2.QtCore import Slot, Signal, QEvent, QObject, QPoint, QRectF, QRect
+from typing import Any, Dict, Optional, Tuple, Union
+from PySide2.QtCore import Slot, Signal, QEvent, QObject, QPoint, QRect, QSize
 from PySide2.QtWidgets import QWidget, QSizePolicy, QVBoxLayout, QToolButton, QGridLayout, QMessageBox, \
-    QGraphicsDropShadowEffect, QDialog, QInputDialog, QApplication, QTabWidget, QTabBar, QLayout
-from PySide2.QtGui import Qt, QCloseEvent, QRegion, QPainterPath, QMouseEvent, QColor, QResizeEvent, QPixmap, QPainter, \
-    QShowEvent, QIcon, QKeyEvent
-from qtmodernredux.windowstyle.windowresizer import Resizer
+    QDialog, QInputDialog, QApplication, QTabWidget, QTabBar, QLayout
+from PySide2.QtGui import Qt, QCloseEvent, QMouseEvent, QColor, QResizeEvent, QPixmap, QPainter, \
+    QShowEvent, QHideEvent, QIcon, QKeyEvent, QPen, QBrush, QPaintEvent
+from qtmodernredux.windowstyle.windowresizer import WindowResizer
+from qtmodernredux.windowstyle.refreshthrottle import RefreshThrottle
 from qtmodernredux.windowstyle.windowtitlelabel import WindowTitleLabel
-from qtmodernredux.windowstyle.windowframe import WindowFrame
+from qtmodernredux.windowstyle.windowframe import WindowFrame, get_rounded_mask
+from qtmodernredux.windowstyle.windowshadow import WindowShadow
 from qtmodernredux.windowstyle.tabfilter import TabFilter
+from qtmodernredux.windowstyle.contentsnapshot import ContentSnapshot
+from qtmodernredux.windowstyle.constants import WINDOW_BUTTONS_RIGHT, WINDOW_BUTTONS_LEFT, QSS_CLASS, \
+    DEFAULT_WINDOW_BUTTONS_POSITION
+from qtmodernredux.theme import Theme, get_theme
+from qtmodernredux.svgcache import SvgPixmapCache
 
 
 __author__ = "Robert Kist; Gerard Marull-Paretas (window maximize/minimize code)"
@@ -23,8 +29,14 @@ CENTER_MAINWINDOW: bool = True
 ALIGN_CHILD_WINDOWS: bool = True
 
 
-WINDOW_BUTTONS_RIGHT: str = 'window_buttons_right'
-WINDOW_BUTTONS_LEFT: str = 'window_buttons_left'
+def get_msgbox_icons(style: Any) -> Dict[Any, str]:
+    """Returns the style's SVG files for the QMessageBox icons"""
+    return {
+        QMessageBox.Information: style.window.MSGBOX_ICON_INFORMATION,
+        QMessageBox.Question: style.window.MSGBOX_ICON_QUESTION,
+        QMessageBox.Warning: style.window.MSGBOX_ICON_WARNING,
+        QMessageBox.Critical: style.window.MSGBOX_ICON_CRITICAL,
+    }
 
 
 class ModernWindow(QDialog):
@@ -32,7 +44,7 @@ class ModernWindow(QDialog):
     Implements a modern window-frame.
     Notes:
         * Except for macOS, the OS will not add a shadow to the window. On Windows and Linux this
-          class will add QGraphicsDropShadowEffect to the entire window.
+          class paints a drop-shadow around the window (see windowshadow.py).
     """
     __double_clicked = Signal()
 
@@ -47,7 +59,9 @@ class ModernWindow(QDialog):
                  titlebar_nofocus_color: Optional[QColor],
                  titlebar_text_color: Optional[QColor],
                  titlebar_widget: Optional[Union[QWidget, QTabWidget]],
-                 window_buttons_position: Optional[str]) -> None:
+                 window_buttons_position: Optional[str],
+                 recyclable: bool = False,
+                 system_move_resize: bool = False) -> None:
         """
         Constructor.
         Parameters:
@@ -63,6 +77,11 @@ class ModernWindow(QDialog):
          * transparent_window: turns off window transparency. This ensures compatibility with certain widgets and draw
            modes, such as QMediaWidget on Windows. Drawbacks: when transparent_window is False, window drop shadow
            effects will be disabled, except for operating systems that automatically add a drop shadow to all windows.
+         * recyclable: only for dialogs. Closing the dialog hides the window instead of deleting the dialog, so that
+           both can be shown again (see dialogpool.py)
+         * system_move_resize: hands moving (title-bar) and resizing (window frame) over to the window manager with
+           QWindow.startSystemMove() / startSystemResize(), instead of moving and resizing the window on every mouse
+           event. Falls back to the latter if the platform doesn't support it
         """
 
         def expose_msgbox_methods() -> None:
@@ -71,6 +90,14 @@ class ModernWindow(QDialog):
             self.setText = self.__window.setText
             self.setInformativeText = self.__window.setInformativeText
             self.setDetailedText = self.__window.setDetailedText
+            self.setTextFormat = self.__window.setTextFormat
+            self.setStandardButtons = self.__window.setStandardButtons
+            self.setDefaultButton = self.__window.setDefaultButton
+            self.setEscapeButton = self.__window.setEscapeButton
+            self.addButton = self.__window.addButton
+            self.button = self.__window.button
+            self.clickedButton = self.__window.clickedButton
+            self.setCheckBox = self.__window.setCheckBox
 
         def add_window_buttons() -> None:
             """create window widget buttons"""
@@ -92,12 +119,16 @@ class ModernWindow(QDialog):
             self._close_button.setObjectName('btnClose')
             self._close_button.setSizePolicy(button_size_policy)
             self._close_button.clicked.connect(self.__on_close_button_clicked)  # pylint: disable=no-member
+            diameter: int = self.__style.window.TITLE_BAR_BUTTON_DIAMETER_PX  # also set by QSS; not with native engine
+            for button in [self._close_button] if isinstance(self.__window, QDIALOG_TYPES) else \
+                    [self._close_button, self._minimize_button, self._restore_button, self._maximize_button]:
+                button.setFixedSize(diameter, diameter)
             self.__move_window_buttons()  # place buttons
 
         def set_window_properties(titlebar_height: int) -> None:
             """Sets Qt Properties for the wrapper window"""
             assert self.__window is not None
-            self.setStyleSheet(self.__style.get_window_stylesheet())
+            self.setProperty('class', QSS_CLASS)  # type: ignore
             self.setWindowFlags(Qt.Window |
                                 Qt.FramelessWindowHint |
                                 Qt.WindowSystemMenuHint |
@@ -119,46 +150,38 @@ class ModernWindow(QDialog):
             self.setMinimumHeight(self.__window.minimumSizeHint().height() + height)
             self.setMinimumWidth(self.__window.minimumSizeHint().width())
 
-        def add_window_drop_shadow() -> None:
-            """Adds a drop-shadow behind the window"""
-            if self.__use_shadow:
-                self.layout().setMargin(self.__style.window.SHADOW_RADIUS_PX)
-                drop_shadow_effect = QGraphicsDropShadowEffect(self)
-                drop_shadow_effect.setEnabled(True)
-                drop_shadow_effect.setBlurRadius(self.__style.window.SHADOW_RADIUS_PX)
-                color = QColor(self.__style.window.SHADOW_COLOR_RGB)
-                color.setAlpha(self.__style.window.SHADOW_OPACITY_HEX)
-                drop_shadow_effect.setColor(color)
-                drop_shadow_effect.setOffset(0)
-                self.setGraphicsEffect(drop_shadow_effect)
+        def add_window_drop_shadow() -> Optional[WindowShadow]:
+            """Returns the drop-shadow behind the window, which is painted in the window's margin"""
+            if not self.__use_shadow:
+                return None
+            self.layout().setMargin(self.__style.window.SHADOW_RADIUS_PX)
+            return WindowShadow(radius=self.__style.window.SHADOW_RADIUS_PX,
+                                corner_radius=self.__style.window.WINDOW_CORNER_RADIUS_PX,
+                                color=self.__theme.shadow_color)
 
         def adjust_wrapped_window_object() -> None:
             """Adding attribute to clean up the parent window when the child is closed"""
             assert self.__window is not None
             self.__window.wrapper = self
-            self.__window.setAttribute(Qt.WA_DeleteOnClose, True)
+            if self.__recyclable:
+                self.__window.finished.connect(self.done)  # pylint: disable=no-member
+            else:
+                self.__window.setAttribute(Qt.WA_DeleteOnClose, True)
             self.__window.destroyed.connect(self.__child_was_closed)
 
-        def add_resizers() -> None:
-            """Adds resizer widgets, which act as resize handles, to the window wrapper"""
+        def add_resizer() -> Optional[WindowResizer]:
+            """Returns the resize handling of the window frame. Dialogs are sized by their content instead"""
             if isinstance(window, QDIALOG_TYPES):
                 assert self.__window is not None
                 self.__window.installEventFilter(self)
-            else:
-                self.resizer_top = Resizer(self, Resizer.TOP, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_bot = Resizer(self, Resizer.BOTTOM, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_lef = Resizer(self, Resizer.LEFT, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_rig = Resizer(self, Resizer.RIGHT, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_tl = Resizer(self, Resizer.TOP_LEFT, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_tr = Resizer(self, Resizer.TOP_RIGHT, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_br = Resizer(self, Resizer.BOTTOM_RIGHT, self.__style.window.SHADOW_RADIUS_PX)
-                self.resizer_bl = Resizer(self, Resizer.BOTTOM_LEFT, self.__style.window.SHADOW_RADIUS_PX)
+                return None
+            return WindowResizer(self, self.__style.window.SHADOW_RADIUS_PX, system_resize=system_move_resize)
 
         def get_window_frame_widget(window_buttons_position: str) -> WindowFrame:
             """Returns a widget which acts as Qt 'windowFrame' element"""
             window_frame_widget = WindowFrame(titlebar_height=self.__titlebar_height,
-                                              titlebar_color=self.__titlebar_color,
-                                              background_color=self.__style.window.WINDOW_BACKGROUND_RGB,
+                                              titlebar_brush=self.__titlebar_brush,
+                                              theme=self.__theme,
                                               corner_radius=self.__style.window.WINDOW_CORNER_RADIUS_PX,
                                               parent=self)
             if not isinstance(window, QDIALOG_TYPES):
@@ -168,12 +191,9 @@ class ModernWindow(QDialog):
             self.__vbox_frame_layout.setContentsMargins(0, 0, 0, 0)
             self.__vbox_frame_layout.setSpacing(0)
             if self.__title_bar:  # add optional titlebar
-                tcolor = QColor(self.__style.window.TITLE_BAR_FONT_COLOR_RGB)
-                if titlebar_text_color is not None:
-                    tcolor = titlebar_text_color
                 self.__title_widget = WindowTitleLabel(text='',
                                                        height=self.__titlebar_height,
-                                                       color=tcolor,
+                                                       pen=self.__titlebar_text_pen,
                                                        window_buttons_position=window_buttons_position,
                                                        margin=self.__style.window.TITLE_BAR_TITLE_TEXT_RIGHT_MARGIN_PX,
                                                        button_bar_width=self.window_buttons_width + self.window_buttons_margin,
@@ -192,12 +212,16 @@ class ModernWindow(QDialog):
 
         QDialog.__init__(self, parent)
         self.__style: Any = style
+        self.__theme: Theme = get_theme(style)
         if titlebar_height is None:
             titlebar_height = self.__style.window.TITLE_BAR_HEIGHT_PX
         assert window_buttons_position in [None, WINDOW_BUTTONS_LEFT, WINDOW_BUTTONS_RIGHT]
         if window_buttons_position is None:
-            window_buttons_position = WINDOW_BUTTONS_LEFT if sys.platform == 'darwin' else WINDOW_BUTTONS_RIGHT
+            window_buttons_position = DEFAULT_WINDOW_BUTTONS_POSITION
+        assert not recyclable or isinstance(window, QDIALOG_TYPES), "ERROR: only dialogs can be recycled"
         self.__window: Optional[QWidget] = window
+        self.__recyclable: bool = recyclable
+        self.__system_move_resize: bool = system_move_resize
         self.__title_bar: bool = True if isinstance(self.__window, QDIALOG_TYPES) else title_bar
         self.__titlebar_height: int = titlebar_height
         self.__transparent_window: bool = transparent_window  # True if window uses WA_TranslucentBackground
@@ -207,33 +231,46 @@ class ModernWindow(QDialog):
         self.__mouse_pressed: bool = False
         self.__mouse_pos: Optional[QPoint] = None
         self.__window_pos: Optional[QPoint] = None
+        self.__titlebar_hit_rect: QRect = QRect()  # area in which a mouse press starts dragging the window
+        self.__mask_size: QSize = QSize()  # window size of the rounded-corner mask of windows without transparency
+        self.__move_throttle = RefreshThrottle(self, self.move)  # moves the window at most once per screen refresh
+        # rendering quality during interactive resizing, see set_interaction_mode()
+        self.__interaction_suspend_shadow: bool = False
+        self.__interaction_draft_frame: bool = False
+        self.__interaction_freeze_content: bool = False
+        self.__interacting: bool = False  # the window is being moved or resized with the mouse
+        self.__interaction_reduced: bool = False  # the quality is reduced for the current gesture
+        self.__interaction_frame_count: int = 0
+        self.__content_snapshot: Optional[ContentSnapshot] = None
         self.__window_buttons_width: int = 0
         self.__window_buttons_position: str = window_buttons_position
         self.__center_window_first_time: bool = True  # makes sure the window is only centered on 1st show event
         # create main contaner layout
         self.__vbox_master_layout = QGridLayout(self)
         self.__vbox_master_layout.setContentsMargins(0, 0, 0, 0)
-        if titlebar_color is None:
-            self.__titlebar_color: QColor = QColor(self.__style.window.TITLE_BAR_COLOR_RGB)
-        else:
-            self.__titlebar_color = titlebar_color
-        if titlebar_nofocus_color is None:
-            self.__titlebar_nofocus_color: QColor = QColor(self.__style.window.TITLE_BAR_NOFOCUS_COLOR_RGB)
-        else:
-            self.__titlebar_nofocus_color = titlebar_nofocus_color
+        # colors passed by the caller take precedence over the style's colors, also when the style changes
+        self.__custom_colors: Tuple[Optional[QColor], Optional[QColor], Optional[QColor]] = \
+            (titlebar_color, titlebar_nofocus_color, titlebar_text_color)
+        self.__titlebar_color: QColor = self.__theme.titlebar_color
+        self.__titlebar_nofocus_color: QColor = self.__theme.titlebar_nofocus_color
+        self.__titlebar_brush: QBrush = self.__theme.titlebar_brush
+        self.__titlebar_nofocus_brush: QBrush = self.__theme.titlebar_nofocus_brush
+        self.__titlebar_text_pen: QPen = self.__theme.titlebar_text_pen
+        self.__apply_custom_colors()
         self.__window_frame_widget: WindowFrame = get_window_frame_widget(window_buttons_position=self.__window_buttons_position)
         self.__vbox_master_layout.addWidget(self.__window_frame_widget, 0, 0)
         # run window initialization methods
-        add_resizers()
+        self.__window_resizer: Optional[WindowResizer] = add_resizer()
         if isinstance(self.__window, QMessageBox):
             expose_msgbox_methods()
         adjust_wrapped_window_object()
-        add_window_drop_shadow()
+        self.__window_shadow: Optional[WindowShadow] = add_window_drop_shadow()
         add_window_buttons()
         set_window_properties(self.__titlebar_height)
         # connect slot to detect if window/app loses focus
         app = QApplication.instance()
         app.focusChanged.connect(self.__app_focus_changed_slot)
+        self.__focus_changed_connected: bool = True  # disconnected while hidden, so closed windows don't leak
         self.setFocus()
         self.layout().setSizeConstraint(QLayout.SetMinimumSize)  # ensure widgets cannot be resized below their min size
         # attributes for title-bar tab widget
@@ -285,6 +322,89 @@ class ModernWindow(QDialog):
         """returns the class (static) which holds all the style's properties"""
         return self.__style
 
+    def set_style(self, style: Any) -> None:
+        """
+        Switches the window to another style. Updates the frame, title-bar and shadow colors and the title-bar
+        tab widget's QSS in a single repaint. Sizes, e.g. the title-bar height, are kept.
+        """
+        if style is self.__style:
+            return
+        self.__style = style
+        self.__theme = get_theme(style)
+        self.__update_mask(True)  # the corner radius may have changed
+        self.__titlebar_color = self.__theme.titlebar_color
+        self.__titlebar_nofocus_color = self.__theme.titlebar_nofocus_color
+        self.__titlebar_brush = self.__theme.titlebar_brush
+        self.__titlebar_nofocus_brush = self.__theme.titlebar_nofocus_brush
+        self.__titlebar_text_pen = self.__theme.titlebar_text_pen
+        self.__apply_custom_colors()
+        self.setUpdatesEnabled(False)
+        self.__window_frame_widget.set_theme(self.__theme)
+        if isinstance(self.__title_widget, WindowTitleLabel):
+            self.__title_widget.set_pen(self.__titlebar_text_pen)
+        if self.__window_shadow is not None:
+            self.__window_shadow.set_color(self.__theme.shadow_color)
+        self.__app_focus_changed_slot()  # applies the title-bar colors to the frame and the tab widget
+        self.__update_titlebar_hit_rect()
+        self.setUpdatesEnabled(True)
+
+    def prepare_reuse(self, parent: Optional[QWidget]) -> None:
+        """Prepares a recyclable window which was closed for being shown again, as a child of the given parent"""
+        assert self.__recyclable and self.__window is not None
+        if self.parent() is not parent:  # re-parenting re-creates the native window, so only do it if needed
+            self.setParent(parent, self.windowFlags())  # type: ignore
+        self.__center_window_first_time = True
+        self.setResult(0)
+        self.__window.setVisible(True)  # the dialog hid itself when it was closed
+
+    def set_interaction_mode(self, suspend_shadow: bool = True, draft_frame: bool = True,
+                             freeze_content: bool = False) -> None:
+        """
+        Reduces the rendering quality while the window is resized by dragging its frame. The full quality is restored
+        when the mouse button is released. By default windows are resized in full quality.
+        suspend_shadow: the drop-shadow isn't painted
+        draft_frame: the frame is painted without rounded corners
+        freeze_content: the window's content isn't laid out or painted; a snapshot of it is shown instead
+        """
+        self.__interaction_suspend_shadow = suspend_shadow
+        self.__interaction_draft_frame = draft_frame
+        self.__interaction_freeze_content = freeze_content
+
+    def get_interaction_frame_count(self) -> int:
+        """Returns the number of frames the window painted during the current or last move or resize gesture"""
+        return self.__interaction_frame_count
+
+    def begin_interaction(self, resize: bool) -> None:
+        """
+        Called when the user starts moving (resize False) or resizing the window with the mouse. Reduces the
+        rendering quality of resize gestures as configured by set_interaction_mode()
+        """
+        self.__interacting = True
+        self.__interaction_frame_count = 0
+        if not resize:
+            return
+        self.__interaction_reduced = True
+        if self.__interaction_draft_frame:
+            self.__window_frame_widget.set_draft(True)
+        if self.__interaction_freeze_content and self.__window is not None:
+            if self.__content_snapshot is None:
+                self.__content_snapshot = ContentSnapshot(self.__window_frame_widget)
+            self.__content_snapshot.show_snapshot(self.__window)
+            self.__vbox_frame_layout.setEnabled(False)
+
+    def end_interaction(self) -> None:
+        """Called when the user stops moving or resizing the window. Restores the full rendering quality"""
+        self.__interacting = False
+        if not self.__interaction_reduced:
+            return
+        self.__interaction_reduced = False
+        self.__window_frame_widget.set_draft(False)
+        if self.__content_snapshot is not None and self.__content_snapshot.isVisible():
+            self.__vbox_frame_layout.setEnabled(True)
+            self.__vbox_frame_layout.activate()
+            self.__content_snapshot.hide_snapshot()
+        self.update()
+
     @property
     def use_shadow(self) -> bool:
         """returns true if the window features a drop-shadow not generated by the OS or window manager"""
@@ -329,22 +449,14 @@ class ModernWindow(QDialog):
         """
         Qt Resize Event - does two things:
         1) applies rounded corners if window transparency has been disabled
-        2) ensures resizer widgets and titlebar buttons stay in place
+        2) ensures titlebar buttons stay in place
         TODO: the 'rounded_corner_px' value is harcoded. It relates to in '.TitleTabBar::tab' in
               widgetstyle/tabwidget_titlebar.py (border-width and border-image QSS attribute).
               Action: investigate a way so that this value doesn't have to be hard-coded.
         """
-        # if transparency is turned off, set a mask for some basic rounded corners:
-        if not self.__transparent_window and self.__style.window.WINDOW_CORNER_RADIUS_PX > 0:
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(self.rect()),
-                                self.__style.window.WINDOW_CORNER_RADIUS_PX + 1,  # add 1 to avoid drawing artifacts
-                                self.__style.window.WINDOW_CORNER_RADIUS_PX + 1)
-            reg = QRegion(path.toFillPolygon().toPolygon())
-            self.setMask(reg)
+        self.__update_mask()
+        self.__update_titlebar_hit_rect()
         # adjust window button positions
-        if not isinstance(self.__window, QDIALOG_TYPES):
-            self.resizer_bl.adjust_resizers(self.geometry())  # adjusting one resizer adjusts all other resizers too
         if self.__window_buttons_position == WINDOW_BUTTONS_RIGHT:
             self.__move_window_buttons()
         # if a titlebar tab widget is set, mask it so that the empty area can be used to drag the window
@@ -358,14 +470,31 @@ class ModernWindow(QDialog):
             r = QRect(0, 0, width + rounder_corner_px, self.__titlebar_height)
             self.__tab_widget.tabBar().setMask(r)
 
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Qt Paint Event: paints the drop-shadow, unless only the window's content is updated"""
+        if self.__interacting:
+            self.__interaction_frame_count += 1
+            if self.__interaction_reduced and self.__interaction_suspend_shadow:
+                return
+        if self.__window_shadow is not None and not self.__maximized and \
+                self.__window_shadow.needs_paint(event.rect()):
+            painter = QPainter(self)
+            self.__window_shadow.paint(painter, self.size(), self.devicePixelRatioF())
+
     def showEvent(self, _: QShowEvent) -> None:
         """
         Qt Show Event:
-        * ensures resizers stay in place
+        * lets the resizer filter the mouse events of the (possibly re-created) native window
         * ensures window is centered on screen or relative to their parent window
+        * resumes tracking the application focus (see hideEvent)
         """
-        if not isinstance(self.__window, QDIALOG_TYPES):
-            self.resizer_bl.adjust_resizers(self.geometry())  # adjusting one resizer adjusts all other resizers too
+        if self.__window_resizer is not None:
+            self.__window_resizer.install()
+
+        if not self.__focus_changed_connected:
+            QApplication.instance().focusChanged.connect(self.__app_focus_changed_slot)
+            self.__focus_changed_connected = True
+            self.__app_focus_changed_slot()
 
         if(self.__maximized and not self.windowState() == Qt.WindowMaximized):
             self.setWindowState(Qt.WindowMaximized)  # restore from Win taskbar somestimes doesn't re-maximize the window
@@ -390,6 +519,12 @@ class ModernWindow(QDialog):
             y = pos.y() + (height / 2 - self.height() / 2)
             self.move(x, y)
 
+    def hideEvent(self, _: QHideEvent) -> None:
+        """Qt Hide Event: stops tracking the application focus"""
+        if self.__focus_changed_connected:
+            QApplication.instance().focusChanged.disconnect(self.__app_focus_changed_slot)
+            self.__focus_changed_connected = False
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """Qt Close Event: Window close & cleanup"""
         if not self.__window:
@@ -416,13 +551,8 @@ class ModernWindow(QDialog):
     def setIcon(self, icon: Any) -> None:
         """Qt setIcon: sets custom icons from the theme for QMessageBox"""
         if isinstance(self.__window, QMessageBox) and icon != QMessageBox.NoIcon:
-            icons = {
-                QMessageBox.Information: self.__style.window.MSGBOX_ICON_INFORMATION,
-                QMessageBox.Question: self.__style.window.MSGBOX_ICON_QUESTION,
-                QMessageBox.Warning: self.__style.window.MSGBOX_ICON_WARNING,
-                QMessageBox.Critical: self.__style.window.MSGBOX_ICON_CRITICAL,
-            }
-            self.__window.setIconPixmap(self.__load_svg(icons[icon]))
+            self.__window.setIconPixmap(SvgPixmapCache.get_pixmap(get_msgbox_icons(self.__style)[icon],
+                                                                  device_pixel_ratio=self.devicePixelRatioF()))
 
     def setWindowTitle(self, title: str) -> None:
         """Qt setWindowTitle: ensures the titlebar displays the window title"""
@@ -457,15 +587,15 @@ class ModernWindow(QDialog):
         """Qt Mouse-Press Event: Window dragging"""
         if not self.__drag_move_enabled:
             return
-        radius = self.__style.window.SHADOW_RADIUS_PX if self.__use_shadow else 0
-        ep = event.pos()
-        if radius <= ep.y() <= self.__titlebar_height + radius + 1:
-            epx = ep.x()
-            if radius < epx < self.width() - radius:
-                self.__mouse_pressed = True
-                self.__mouse_pos = event.globalPos()
-                self.__window_pos = self.pos()
-                # self.__os = self.size()  # use when dragging between screens with different scale factors
+        if self.__titlebar_hit_rect.contains(event.pos()):
+            if self.__system_move_resize and event.button() == Qt.LeftButton and \
+                    self.windowHandle().startSystemMove():
+                return  # the window manager moves the window until the mouse button is released
+            self.__mouse_pressed = True
+            self.__mouse_pos = event.globalPos()
+            self.__window_pos = self.pos()
+            self.begin_interaction(resize=False)
+            # self.__os = self.size()  # use when dragging between screens with different scale factors
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Qt Mouse-Move Event: Window dragging"""
@@ -475,10 +605,14 @@ class ModernWindow(QDialog):
             # if display != self.__old_display:
             #     print('DISPLAY CHANGED TO %s' % display, self.__old_size)
             #     self.__old_display = display
-            self.move(self.__window_pos + (event.globalPos() - self.__mouse_pos))
+            self.__move_throttle.submit(self.__window_pos + (event.globalPos() - self.__mouse_pos))
 
-    def mouseReleaseEvent(self, _: QMouseEvent) -> None:
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Qt Mouse-Release Event: Window dragging"""
+        if self.__mouse_pressed and self.__drag_move_enabled:
+            self.__move_throttle.finish(self.__window_pos + (event.globalPos() - self.__mouse_pos))
+        if self.__mouse_pressed:
+            self.end_interaction()
         self.__mouse_pressed = False
         # self.resize(self.__os)  # use when dragging between screens with different scale factors
 
@@ -526,28 +660,29 @@ class ModernWindow(QDialog):
             self._restore_button.move(margin_x + ofs_max, margin_y + radius)
             self._maximize_button.move(margin_x + ofs_max, margin_y + radius)
 
-    def __load_svg(self, svg_file: str) -> QPixmap:
-        """Loads a SVG file and scales it correctly for High-DPI screens"""
-        svg_renderer = QSvgRenderer(svg_file)
-        pixmap = QPixmap(svg_renderer.defaultSize() * self.devicePixelRatio())
-        pixmap.fill(Qt.transparent)
-        painter = QPainter()
-        painter.begin(pixmap)
-        svg_renderer.render(painter)
-        painter.end()
-        pixmap.setDevicePixelRatio(self.devicePixelRatio())
-        return pixmap
-
-    def __show_resizers(self, show: bool) -> None:
-        """Shows / hides the resizer widgets"""
-        self.resizer_top.setVisible(show)
-        self.resizer_bot.setVisible(show)
-        self.resizer_lef.setVisible(show)
-        self.resizer_rig.setVisible(show)
-        self.resizer_tl.setVisible(show)
-        self.resizer_tr.setVisible(show)
-        self.resizer_bl.setVisible(show)
-        self.resizer_br.setVisible(show)
+    def __update_mask(self, force: bool = False) -> None:
+        """
+        If transparency is turned off, sets a mask for some basic rounded corners. The mask is only rebuilt when the
+        window size changed, unless force is True, e.g. when the style changed
+        """
+        if self.__transparent_window or (not force and self.size() == self.__mask_size):
+            return
+        radius: int = self.__style.window.WINDOW_CORNER_RADIUS_PX
+        if radius > 0:
+            self.setMask(get_rounded_mask(self.width(), self.height(), radius + 1))  # +1 avoids artifacts
+        else:
+            self.clearMask()
+        self.__mask_size = self.size()
+
+    def __update_titlebar_hit_rect(self) -> None:
+        """Updates the area in which a mouse press starts dragging the window: the title-bar inside the drop-shadow"""
+        radius: int = self.__style.window.SHADOW_RADIUS_PX if self.__use_shadow else 0
+        self.__titlebar_hit_rect = QRect(radius + 1, radius, self.width() - radius * 2 - 1, self.__titlebar_height + 2)
+
+    def __enable_resizer(self, enable: bool) -> None:
+        """Enables / disables resizing the window by dragging its frame"""
+        if self.__window_resizer is not None:
+            self.__window_resizer.set_enabled(enable)
 
     def __child_was_closed(self) -> None:
         """Wrapped window was closed"""
@@ -629,7 +764,7 @@ class ModernWindow(QDialog):
         self.__maximized = False
 
         if self.__use_shadow:
-            self.__show_resizers(True)
+            self.__enable_resizer(True)
             self.__drag_move_enabled = True
             self.setWindowState(Qt.WindowNoState)
             self.layout().setMargin(self.__style.window.SHADOW_RADIUS_PX)  # adjust window for drop-shadow margin
@@ -657,11 +792,13 @@ class ModernWindow(QDialog):
             self._maximize_button.setVisible(False)
             self._maximize_button.setEnabled(False)
         self.__maximized = True
+        self.__move_throttle.cancel()
+        self.end_interaction()
 
         if self.__use_shadow:
             self.setWindowState(Qt.WindowMaximized)  # adjust window for drop-shadow margin
             self.layout().setMargin(0)
-            self.__show_resizers(False)
+            self.__enable_resizer(False)
             self.__drag_move_enabled = False
         else:
             self.setWindowState(Qt.WindowMaximized)  # adjust window for drop-shadow margin
@@ -683,6 +820,18 @@ class ModernWindow(QDialog):
         else:
             self.__on_restore_button_clicked()
 
+    def __apply_custom_colors(self) -> None:
+        """Replaces the theme's title-bar colors, pens and brushes with the custom colors passed to the constructor"""
+        titlebar_color, titlebar_nofocus_color, titlebar_text_color = self.__custom_colors
+        if titlebar_color is not None:
+            self.__titlebar_color = titlebar_color
+            self.__titlebar_brush = QBrush(titlebar_color)
+        if titlebar_nofocus_color is not None:
+            self.__titlebar_nofocus_color = titlebar_nofocus_color
+            self.__titlebar_nofocus_brush = QBrush(titlebar_nofocus_color)
+        if titlebar_text_color is not None:
+            self.__titlebar_text_pen = QPen(titlebar_text_color)
+
     def __get_title_tabwidget_style(self, background: QColor) -> str:
         """Gets the QSS for the TabBar widget and adjusts margins"""
         margin_top_px = self.__style.window.TITLE_BAR_TOP_MARGIN_PX
@@ -707,16 +856,18 @@ class ModernWindow(QDialog):
     def __app_focus_changed_slot(self) -> None:
         """Changes the titlebar's background color when the window acquires/loses focus"""
         if self.isActiveWindow():
-            self.__window_frame_widget.set_background_color(self.__titlebar_color)
+            self.__window_frame_widget.set_titlebar_brush(self.__titlebar_brush)
         else:
-            self.__window_frame_widget.set_background_color(self.__titlebar_nofocus_color)
+            self.__window_frame_widget.set_titlebar_brush(self.__titlebar_nofocus_brush)
         self.__window_frame_widget.update()
 
         if self.__tab_widget is not None:
             if self.isActiveWindow():
-                self.__tab_widget.setStyleSheet(self.__get_title_tabwidget_style(self.__titlebar_color))
+                style = self.__get_title_tabwidget_style(self.__titlebar_color)
             else:
-                self.__tab_widget.setStyleSheet(self.__get_title_tabwidget_style(self.__titlebar_nofocus_color))
+                style = self.__get_title_tabwidget_style(self.__titlebar_nofocus_color)
+            if style != self.__tab_widget.styleSheet():  # setting a style-sheet re-polishes the tab widget
+                self.__tab_widget.setStyleSheet(style)
 
     def __adjust_title_tabwidget(self, tab_widget: QTabWidget) -> None:
         """
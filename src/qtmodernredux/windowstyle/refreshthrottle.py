@@ -0,0 +1,67 @@
+from typing import Any, Callable, Optional
+from PySide2.QtCore import QObject, QTimer
+from PySide2.QtWidgets import QWidget
+from PySide2.QtGui import Qt
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Throttles interactive window updates, e.g. the geometry while a window is dragged, to the screen's refresh rate.
+Mice deliver up to 1000 move events per second, but the window can't be shown faster than the screen refreshes.
+"""
+
+
+DEFAULT_REFRESH_RATE_HZ: float = 60.0  # used if the screen doesn't report its refresh rate
+
+
+class RefreshThrottle(QObject):
+    """
+    Calls a function with the latest submitted value at most once per screen refresh. The first value after a pause
+    is applied right away; values submitted before the refresh interval has passed replace each other and only the
+    last one is applied when it has.
+    """
+
+    def __init__(self, widget: QWidget, apply: Callable[[Any], None]) -> None:
+        """Constructor: the refresh rate is the one of the widget's screen, apply is called with each value"""
+        super().__init__(widget)
+        self.__widget: QWidget = widget
+        self.__apply: Callable[[Any], None] = apply
+        self.__pending: Optional[Any] = None
+        self.__timer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.setTimerType(Qt.PreciseTimer)
+        self.__timer.timeout.connect(self.__apply_pending)  # pylint: disable=no-member
+
+    def submit(self, value: Any) -> None:
+        """Applies the value now, or with the next screen refresh if a value was applied during the current one"""
+        if self.__timer.isActive():
+            self.__pending = value
+        else:
+            self.__apply(value)
+            self.__timer.start(self.get_refresh_interval_ms())
+
+    def finish(self, value: Any) -> None:
+        """Applies the final value right away and drops the pending one"""
+        self.cancel()
+        self.__apply(value)
+
+    def cancel(self) -> None:
+        """Drops the pending value"""
+        self.__timer.stop()
+        self.__pending = None
+
+    def get_refresh_interval_ms(self) -> int:
+        """Returns the refresh interval of the widget's screen in milliseconds"""
+        screen = self.__widget.screen()
+        refresh_rate: float = screen.refreshRate() if screen is not None else 0.0
+        return max(1, int(1000.0 / (refresh_rate if refresh_rate > 0 else DEFAULT_REFRESH_RATE_HZ)))
+
+    def __apply_pending(self) -> None:
+        """Applies the latest value which was submitted since the last screen refresh"""
+        if self.__pending is not None:
+            value = self.__pending
+            self.__pending = None
+            self.__apply(value)
+            self.__timer.start(self.get_refresh_interval_ms())
@@ -1,28 +1,138 @@
-from typing import Any
-from PySide2.QtCore import QRect, Signal
+import math
+from functools import lru_cache
+from typing import Any, List, Tuple
+from PySide2.QtCore import QRect, QRectF, Signal
 from PySide2.QtWidgets import QWidget
-from PySide2.QtGui import Qt, QColor, QPainter, QPen, QBrush, QPaintEvent, QMouseEvent
+from PySide2.QtGui import Qt, QColor, QPainter, QPen, QBrush, QPaintEvent, QMouseEvent, QPixmap, QResizeEvent, \
+    QPainterPath, QRegion
+from qtmodernredux.theme import Theme
 
 
 __author__ = "Robert Kist"
 
 
+"""
+The window frame paints the window background and the title-bar.
+The frame is rendered once per (title-bar height, corner radius, colors, device pixel ratio) into a small nine-slice
+pixmap, which is shared by all windows. Paint events only draw the pixmap's corners and stretch its edges; the
+large center slices are solid, so they are filled instead of scaled. A focus change swaps the pixmap for the one with
+the other title-bar color.
+While a window is interactively resized, the frame can be drawn in draft quality: two rectangles without rounded
+corners (see ModernWindow.set_interaction_mode()).
+Windows without transparency get rounded corners from a window mask instead. The mask's 4 corner regions are computed
+once per radius; the mask of a window of any size is a rectangle with the corners cut out and replaced by them.
+"""
+
+
+TRANSPARENT_PEN: QPen = QPen(Qt.transparent)
+NINE_SLICE_MARGIN_PX: int = 2  # added to the corner radius, so that the corner slices include the pen
+FRAME_CACHE_SIZE: int = 32  # nine-slice pixmaps, e.g. 2 per style, title-bar height and screen (focused, unfocused)
+MASK_CACHE_SIZE: int = 8  # corner regions of window masks, 1 per corner radius
+
+
+def paint_frame(painter: QPainter, width: int, height: int, titlebar_height: int, corner_radius: int,
+                background_pen: QPen, background_brush: QBrush, titlebar_brush: QBrush) -> None:
+    """Paints the window background and the title-bar"""
+    painter.setPen(background_pen)
+    painter.setBrush(background_brush)
+    painter.drawRoundedRect(QRect(0, 0, width, height), corner_radius, corner_radius)
+    painter.setPen(TRANSPARENT_PEN)
+    painter.setBrush(titlebar_brush)
+    painter.drawRoundedRect(QRect(0, 0, width, titlebar_height), corner_radius, corner_radius)
+    painter.drawRect(QRect(0, corner_radius, width, titlebar_height - corner_radius))
+
+
+def get_nine_slice_size(titlebar_height: int, corner_radius: int) -> QRect:
+    """
+    Returns the size of the nine-slice pixmap. Its center column, and the row below the title-bar, are stretched
+    """
+    corner: int = corner_radius + NINE_SLICE_MARGIN_PX
+    return QRect(0, 0, corner * 2 + 1, titlebar_height + corner + 1)
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def get_nine_slice_pixmap(titlebar_height: int, corner_radius: int, background_rgba: int, titlebar_rgba: int,
+                          device_pixel_ratio: float) -> QPixmap:
+    """Returns the frame rendered at the smallest size from which any larger frame can be drawn (see WindowFrame)"""
+    size = get_nine_slice_size(titlebar_height, corner_radius)
+    pixmap = QPixmap(math.ceil(size.width() * device_pixel_ratio), math.ceil(size.height() * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    background_color = QColor.fromRgba(background_rgba)
+    painter = QPainter(pixmap)
+    paint_frame(painter, size.width(), size.height(), titlebar_height, corner_radius, QPen(background_color),
+                QBrush(background_color), QBrush(QColor.fromRgba(titlebar_rgba)))
+    painter.end()
+    return pixmap
+
+
+def get_rounded_region(width: int, height: int, radius: int) -> QRegion:
+    """Returns a region with rounded corners, flattened from a rounded rectangle path"""
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
+    return QRegion(path.toFillPolygon().toPolygon())
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def get_mask_corners(radius: int) -> Tuple[QRegion, QRegion, QRegion, QRegion]:
+    """
+    Returns the top-left, top-right, bottom-left and bottom-right corners of a rounded region, each relative to its
+    corner square of get_mask_corner_size() pixels
+    """
+    size: int = get_mask_corner_size(radius)
+    region = get_rounded_region(size * 2, size * 2, radius)
+    return (region.intersected(QRect(0, 0, size, size)),
+            region.intersected(QRect(size, 0, size, size)).translated(-size, 0),
+            region.intersected(QRect(0, size, size, size)).translated(0, -size),
+            region.intersected(QRect(size, size, size, size)).translated(-size, -size))
+
+
+def get_mask_corner_size(radius: int) -> int:
+    """Returns the size of the corner squares which contain the rounded corners of a region"""
+    return radius + 1
+
+
+def get_rounded_mask(width: int, height: int, radius: int) -> QRegion:
+    """Returns a window mask with rounded corners, made of the cached corner regions and rectangles"""
+    size: int = get_mask_corner_size(radius)
+    if width < size * 2 or height < size * 2:
+        return get_rounded_region(width, height, radius)
+    top_left, top_right, bottom_left, bottom_right = get_mask_corners(radius)
+    right: int = width - size
+    bottom: int = height - size
+    mask = QRegion(0, size, width, height - size * 2)
+    mask += QRegion(size, 0, width - size * 2, size)
+    mask += QRegion(size, bottom, width - size * 2, size)
+    mask += top_left
+    mask += top_right.translated(right, 0)
+    mask += bottom_left.translated(0, bottom)
+    mask += bottom_right.translated(right, bottom)
+    return mask
+
+
 class WindowFrame(QWidget):
     """Implements a Qt 'windowFrame' widget"""
     double_clicked = Signal()
 
     def __init__(self,
                  titlebar_height: int,
-                 titlebar_color: QColor,
-                 background_color: QColor,
+                 titlebar_brush: QBrush,
+                 theme: Theme,
                  corner_radius: int,
                  parent: Any) -> None:
-        """Constructor"""
+        """Constructor: the theme's pens and brushes are shared, not copied"""
         super().__init__(parent)
         self.__titlebar_height: int = titlebar_height
-        self.__background_color: QColor = QColor(background_color)
-        self.__titlebar_color: QColor = QColor(titlebar_color)
+        self.__background_pen: QPen = theme.window_background_pen
+        self.__background_brush: QBrush = theme.window_background_brush
+        self.__titlebar_brush: QBrush = titlebar_brush
         self.__corner_radius: int = corner_radius
+        # nine-slice layout for the current size and device pixel ratio, see __update_slices()
+        self.__slices: List[Tuple[QRectF, QRectF]] = []  # (target, source) of the pixmap slices
+        self.__center: QRect = QRect()  # window background below the title-bar, filled
+        self.__titlebar_center: QRect = QRect()  # title-bar between the corners, filled
+        self.__slices_ratio: float = 0.0
+        self.__draft: bool = False
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Qt Mouse-Double-Click Event: Window dragging"""
@@ -31,17 +141,75 @@ class WindowFrame(QWidget):
 
     def set_background_color(self, color: QColor) -> None:
         """Sets the titlebar's background color"""
-        self.__titlebar_color = color
+        self.__titlebar_brush = QBrush(color)
+
+    def set_titlebar_brush(self, brush: QBrush) -> None:
+        """Sets the titlebar's background brush"""
+        self.__titlebar_brush = brush
+
+    def set_theme(self, theme: Theme) -> None:
+        """Sets the background of the window below the titlebar to the theme's"""
+        self.__background_pen = theme.window_background_pen
+        self.__background_brush = theme.window_background_brush
+
+    def set_draft(self, draft: bool) -> None:
+        """Draws the frame without rounded corners, e.g. while the window is resized"""
+        if draft != self.__draft:
+            self.__draft = draft
+            self.update()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Qt Resize Event: the nine-slice layout is updated on the next paint"""
+        super().resizeEvent(event)
+        self.__slices_ratio = 0.0
 
     def paintEvent(self, _: QPaintEvent) -> None:
-        """Qt Paint Event"""
+        """Qt Paint Event: draws the cached nine-slice pixmap, or paints the frame if it can't be cached"""
+        painter: QPainter = QPainter(self)
+        if self.__draft:
+            painter.fillRect(self.rect(), self.__background_brush)
+            painter.fillRect(0, 0, self.width(), self.__titlebar_height, self.__titlebar_brush)
+            return
+        size = get_nine_slice_size(self.__titlebar_height, self.__corner_radius)
+        if self.width() < size.width() or self.height() < size.height() or \
+                self.__titlebar_height < self.__corner_radius or \
+                self.__titlebar_brush.style() != Qt.SolidPattern or \
+                self.__background_brush.style() != Qt.SolidPattern or \
+                self.__background_pen.color() != self.__background_brush.color():
+            paint_frame(painter, self.width(), self.height(), self.__titlebar_height, self.__corner_radius,
+                        self.__background_pen, self.__background_brush, self.__titlebar_brush)
+            return
+        ratio: float = self.devicePixelRatioF()
+        if ratio != self.__slices_ratio:
+            self.__update_slices(ratio)
+        pixmap = get_nine_slice_pixmap(self.__titlebar_height, self.__corner_radius,
+                                       self.__background_brush.color().rgba(), self.__titlebar_brush.color().rgba(),
+                                       ratio)
+        for target, source in self.__slices:
+            painter.drawPixmap(target, pixmap, source)
+        painter.fillRect(self.__center, self.__background_brush)
+        painter.fillRect(self.__titlebar_center, self.__background_brush)  # the title-bar color may be translucent
+        painter.fillRect(self.__titlebar_center, self.__titlebar_brush)
+
+    def __update_slices(self, ratio: float) -> None:
+        """
+        Lays out the nine-slice pixmap for the current size: the corners are drawn as they are, the edges are
+        stretched. The centers of the title-bar and of the window are solid, so they are filled instead of stretched.
+        """
         w: int = self.width()
-        h: int = self.__titlebar_height
-        p: QPainter = QPainter(self)
-        p.setPen(QPen(self.__background_color))
-        p.setBrush(QBrush(self.__background_color))
-        p.drawRoundedRect(QRect(0, 0, w, self.height()), self.__corner_radius, self.__corner_radius)
-        p.setPen(QPen(Qt.transparent))
-        p.setBrush(QBrush(self.__titlebar_color))
-        p.drawRoundedRect(QRect(0, 0, w, h), self.__corner_radius, self.__corner_radius)
-        p.drawRect(QRect(0, self.__corner_radius, w, h - self.__corner_radius))
+        h: int = self.height()
+        corner: int = self.__corner_radius + NINE_SLICE_MARGIN_PX
+        titlebar_height: int = self.__titlebar_height
+        # (target position, target size, source position, source size) in device-independent pixels
+        columns = ((0, corner, 0, corner), (corner, w - corner * 2, corner, 1), (w - corner, corner, corner + 1, corner))
+        rows = ((0, titlebar_height, 0, titlebar_height),
+                (titlebar_height, h - titlebar_height - corner, titlebar_height, 1),
+                (h - corner, corner, titlebar_height + 1, corner))
+        self.__slices = [(QRectF(x, y, width, height),
+                          QRectF(source_x * ratio, source_y * ratio, source_width * ratio, source_height * ratio))
+                         for x, width, source_x, source_width in columns
+                         for y, height, source_y, source_height in rows
+                         if x != corner or y == h - corner]
+        self.__titlebar_center = QRect(corner, 0, w - corner * 2, titlebar_height)
+        self.__center = QRect(corner, titlebar_height, w - corner * 2, h - titlebar_height - corner)
+        self.__slices_ratio = ratio
@@ -1,19 +1,34 @@
-from typing import Optional, Any, Tuple, Dict
-from PySide2.QtCore import Signal, QPoint, QRect
-from PySide2.QtWidgets import QLabel
-from PySide2.QtGui import Qt, QMouseEvent, QCursor
+from typing import Optional, Any, Dict, Tuple
+import shiboken2
+from PySide2.QtCore import QObject, QEvent, QPoint, QRect, Signal
+from PySide2.QtGui import Qt, QMouseEvent, QWindow
+from qtmodernredux.windowstyle.refreshthrottle import RefreshThrottle
 
 
 __author__ = "Robert Kist"
 
 
-DEBUG = False  # makes the resize handles opaque and colors them red and green
+"""
+Resize handling for frameless windows.
+A single event filter on the window's QWindow sees every mouse event of the window before it is delivered to a
+widget. The cursor position is classified into the window's edge and corner zones arithmetically, so the window
+needs no resize handle widgets which would have to be moved on every resize.
+With system_resize, dragging a zone hands the resize over to the window manager (QWindow.startSystemResize()), so
+the window isn't resized from Python on every mouse event. Platforms which don't support it use the Python path.
+The Python path applies at most one geometry per screen refresh (see refreshthrottle.py). Releasing the mouse button
+applies the exact geometry of the release position. The window may reduce its rendering quality during the gesture
+(see ModernWindow.set_interaction_mode()).
+"""
 
 
-class Resizer(QLabel):
+EDGE_WIDTH_PX: int = 4  # width of the zones along the top, left, right and bottom window edges
+CORNER_SIZE_PX: int = 8  # width and height of the zones in the window corners
+
+
+class WindowResizer(QObject):
     """
-    This class implements a Resize Handle. Resize handles can be placed at 8 cardinal dimensions
-    of each Window.
+    Sets the resize cursor and resizes the window when the mouse is pressed in one of the 8 zones along the window
+    frame, which is inset by the drop-shadow radius:
     * at the sides: North, South, East, West
     * at the corners: North-East, South-East, South-West, North-West
     """
@@ -25,160 +40,171 @@ class Resizer(QLabel):
     TOP_RIGHT = 'tr'
     BOTTOM_LEFT = 'bl'
     BOTTOM_RIGHT = 'br'
-    move_signal = Signal(object)
+    CURSORS: Dict[str, Any] = {
+        LEFT: Qt.SizeHorCursor,
+        TOP: Qt.SizeVerCursor,
+        RIGHT: Qt.SizeHorCursor,
+        BOTTOM: Qt.SizeVerCursor,
+        TOP_LEFT: Qt.SizeFDiagCursor,
+        TOP_RIGHT: Qt.SizeBDiagCursor,
+        BOTTOM_LEFT: Qt.SizeBDiagCursor,
+        BOTTOM_RIGHT: Qt.SizeFDiagCursor,
+    }
+    EDGES: Dict[str, Any] = {
+        LEFT: Qt.LeftEdge,
+        TOP: Qt.TopEdge,
+        RIGHT: Qt.RightEdge,
+        BOTTOM: Qt.BottomEdge,
+        TOP_LEFT: Qt.TopEdge | Qt.LeftEdge,
+        TOP_RIGHT: Qt.TopEdge | Qt.RightEdge,
+        BOTTOM_LEFT: Qt.BottomEdge | Qt.LeftEdge,
+        BOTTOM_RIGHT: Qt.BottomEdge | Qt.RightEdge,
+    }
+    # emitted when a resize gesture ends: (mouse-move events, geometry updates, i.e. layout passes)
+    resize_finished = Signal(int, int)
+    MOUSE_EVENTS = (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.MouseMove, QEvent.MouseButtonRelease)
 
-    def __init__(self, parent: Any, type_: str, radius: int) -> None:
-        """Constructor"""
+    def __init__(self, parent: Any, radius: int, system_resize: bool = False) -> None:
+        """
+        Constructor: parent is the ModernWindow, radius its drop-shadow radius. system_resize lets the window manager
+        resize the window where supported
+        """
         super().__init__(parent)
         self.__parent = parent
-        self.setMouseTracking(True)
         self.__radius: int = radius
-        if DEBUG:
-            if type_ in [self.LEFT, self.RIGHT, self.TOP, self.BOTTOM]:
-                self.setStyleSheet('background: #ff0000;')
-            else:
-                self.setStyleSheet('background: #00ff00;')
-        self.__old_cursor: QCursor = self.cursor()
-        self.__in: bool = False
-        if not DEBUG:
-            self.setAttribute(Qt.WA_TranslucentBackground)
-        cursors: Dict[str, Any] = {
-            self.LEFT: Qt.SizeHorCursor,
-            self.TOP: Qt.SizeVerCursor,
-            self.RIGHT: Qt.SizeHorCursor,
-            self.BOTTOM: Qt.SizeVerCursor,
-            self.TOP_LEFT: Qt.SizeFDiagCursor,
-            self.TOP_RIGHT: Qt.SizeBDiagCursor,
-            self.BOTTOM_LEFT: Qt.SizeBDiagCursor,
-            self.BOTTOM_RIGHT: Qt.SizeFDiagCursor,
-        }
-        self.__type: str = type_
-        self.setCursor(cursors[type_])
+        self.__system_resize: bool = system_resize
+        self.__enabled: bool = True
+        self.__handle: Optional[QWindow] = None
+        self.__zone: Optional[str] = None  # zone under the cursor, or being dragged
         self.__mouse_pressed: bool = False
-        self.__mouse_pos: Optional[QPoint] = None
-        self.__window_width: Optional[QPoint] = None
-        self.__window_height: Optional[QPoint] = None
-        self.__window_pos: Optional[QPoint] = None
-        self.__window_geometry_x: int = 0
-        self.__window_geometry_y: int = 0
-        self.__window_pos_x: int = 0
-        self.__window_pos_y: int = 0
-        self.__window_geometry_width: int = 0
-        self.__window_geometry_height: int = 0
-
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-        """Qt Mouse-Press Event"""
-        self.__mouse_pressed = True
-        self.__mouse_pos = event.globalPos()
-        if self.__type == self.TOP:
-            self.__window_pos_y = self.__parent.pos().y()
-            self.__window_geometry_x = self.__parent.geometry().x()
-        elif self.__type in [self.BOTTOM, self.RIGHT, self.BOTTOM_RIGHT]:
-            self.__window_geometry_x = self.__parent.geometry().x()
-            self.__window_geometry_y = self.__parent.geometry().y()
-        elif self.__type == self.LEFT:
-            self.__window_pos_x = self.__parent.pos().x()
-            self.__window_geometry_y = self.__parent.geometry().y()
-        elif self.__type in [self.TOP_LEFT, self.TOP_RIGHT, self.BOTTOM_LEFT]:
-            self.__window_pos_x = self.__parent.pos().x()
-            self.__window_pos_y = self.__parent.pos().y()
-        self.__window_geometry_width = self.__parent.geometry().width()
-        self.__window_geometry_height = self.__parent.geometry().height()
-
-    def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        """Qt Mouse-Move Event"""
-
-        def get_top_resize_values() -> Tuple[int, int]:
-            """calculates vertial position and height"""
-            py: int = (event.globalPos() - self.__mouse_pos).y()
-            if self.__window_geometry_height - py < self.__parent.minimumSize().height():
-                height: int = self.__parent.minimumSize().height()
-                pos_y: int = self.__window_pos_y + self.__window_geometry_height - height
-            else:
-                height = self.__window_geometry_height - py
-                pos_y = self.__window_pos_y + py
-            return pos_y, height
-
-        def get_left_resize_values() -> Tuple[int, int]:
-            """calculates horizontal position and width"""
-            px: int = (event.globalPos() - self.__mouse_pos).x()
-            if self.__window_geometry_width - px < self.__parent.minimumSize().width():
-                width: int = self.__parent.minimumSize().width()
-                pos_x: int = self.__window_pos_x + self.__window_geometry_width - width
-            else:
-                width = self.__window_geometry_width - px
-                pos_x = self.__window_pos_x + px
-            return pos_x, width
+        self.__mouse_pos: QPoint = QPoint()
+        self.__window_geometry: QRect = QRect()
+        self.__event_count: int = 0  # mouse-move events of the current or last resize gesture
+        self.__update_count: int = 0  # geometry updates of the current or last resize gesture
+        self.__throttle = RefreshThrottle(parent, self.__apply_geometry)
+
+    def install(self) -> None:
+        """Filters the mouse events of the window's QWindow. Call when the window is shown, as Qt may re-create it"""
+        handle = self.__parent.windowHandle()
+        if handle is self.__handle or handle is None:
+            return
+        if self.__handle is not None and shiboken2.isValid(self.__handle):
+            self.__handle.removeEventFilter(self)
+        self.__handle = handle
+        handle.installEventFilter(self)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enables or disables resizing, e.g. while the window is maximized"""
+        self.__enabled = enabled
+        if not enabled:
+            if self.__mouse_pressed:
+                self.__parent.end_interaction()
+            self.__mouse_pressed = False
+            self.__throttle.cancel()
+            self.__set_zone(None, None)
+
+    def get_gesture_stats(self) -> Tuple[int, int]:
+        """Returns the mouse-move events and the geometry updates (layout passes) of the last resize gesture"""
+        return self.__event_count, self.__update_count
 
+    def get_zone(self, pos: QPoint) -> Optional[str]:
+        """Returns the zone at the given position in window coordinates, or None"""
+        radius: int = self.__radius if self.__parent.use_shadow else 0
+        x: int = pos.x() - radius
+        y: int = pos.y() - radius
+        width: int = self.__parent.width() - radius * 2
+        height: int = self.__parent.height() - radius * 2
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        right: int = width - 1 - x
+        bottom: int = height - 1 - y
+        if min(x, right) < CORNER_SIZE_PX and min(y, bottom) < CORNER_SIZE_PX:
+            return (self.TOP if y < bottom else self.BOTTOM) + (self.LEFT if x < right else self.RIGHT)
+        if y < EDGE_WIDTH_PX:
+            return self.TOP
+        if bottom < EDGE_WIDTH_PX:
+            return self.BOTTOM
+        if x < EDGE_WIDTH_PX:
+            return self.LEFT
+        if right < EDGE_WIDTH_PX:
+            return self.RIGHT
+        return None
+
+    def eventFilter(self, target: QObject, event: QEvent) -> bool:  # pylint: disable=invalid-name
+        """Handles the mouse events in the resize zones. Events outside the zones are delivered as usual"""
+        event_type = event.type()
+        if not self.__enabled:
+            return False
+        if event_type == QEvent.Leave and not self.__mouse_pressed:
+            self.__set_zone(None, None)
+            return False
+        if event_type not in self.MOUSE_EVENTS:
+            return False
+        assert isinstance(event, QMouseEvent)
         if self.__mouse_pressed:
-            if self.__type == self.BOTTOM:
-                py = (event.globalPos() - self.__mouse_pos).y()
-                geometry = QRect(self.__window_geometry_x,
-                                 self.__window_geometry_y,
-                                 self.__window_geometry_width,
-                                 self.__window_geometry_height + py)
-            elif self.__type == self.RIGHT:
-                px = (event.globalPos() - self.__mouse_pos).x()
-                geometry = QRect(self.__window_geometry_x,
-                                 self.__window_geometry_y,
-                                 self.__window_geometry_width + px,
-                                 self.__window_geometry_height)
-            elif self.__type == self.TOP:
-                pos_y, height = get_top_resize_values()
-                geometry = QRect(self.__window_geometry_x, pos_y, self.__window_geometry_width, height)
-            elif self.__type == self.LEFT:
-                pos_x, width = get_left_resize_values()
-                geometry = QRect(pos_x, self.__window_geometry_y, width, self.__window_geometry_height)
-            elif self.__type == self.TOP_LEFT:
-                pos_x, width = get_left_resize_values()
-                pos_y, height = get_top_resize_values()
-                geometry = QRect(pos_x, pos_y, width, height)
-            elif self.__type == self.TOP_RIGHT:
-                px = (event.globalPos() - self.__mouse_pos).x()
-                pos_y, height = get_top_resize_values()
-                geometry = QRect(self.__window_pos_x, pos_y, self.__window_geometry_width + px, height)
-            elif self.__type == self.BOTTOM_LEFT:
-                pos_x, width = get_left_resize_values()
-                py = (event.globalPos() - self.__mouse_pos).y()
-                geometry = QRect(pos_x, self.__window_pos_y, width, self.__window_geometry_height + py)
-            elif self.__type == self.BOTTOM_RIGHT:
-                px = (event.globalPos() - self.__mouse_pos).x()
-                py = (event.globalPos() - self.__mouse_pos).y()
-                geometry = QRect(self.__window_geometry_x,
-                                 self.__window_geometry_y,
-                                 self.__window_geometry_width + px,
-                                 self.__window_geometry_height + py)
-            if geometry.width() < self.__parent.minimumSize().width():
-                geometry.setWidth(self.__parent.minimumSize().width())
-            if geometry.height() < self.__parent.minimumSize().height():
-                geometry.setHeight(self.__parent.minimumSize().height())
+            if event_type == QEvent.MouseMove:
+                self.__event_count += 1
+                self.__throttle.submit(self.__get_geometry(event.globalPos()))
+            elif event_type == QEvent.MouseButtonRelease:
+                self.__mouse_pressed = False
+                self.__throttle.finish(self.__get_geometry(event.globalPos()))
+                self.__parent.end_interaction()
+                self.__set_zone(self.get_zone(event.pos()), event.pos())
+                self.resize_finished.emit(self.__event_count, self.__update_count)  # type: ignore
+            return True
+        zone = self.get_zone(event.pos())
+        self.__set_zone(zone, event.pos())
+        if zone is None:
+            return False
+        if event_type == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            if self.__system_resize and self.__handle is not None and self.__handle.startSystemResize(self.EDGES[zone]):
+                return True  # the window manager resizes the window until the mouse button is released
+            self.__mouse_pressed = True
+            self.__mouse_pos = event.globalPos()
+            self.__window_geometry = self.__parent.geometry()
+            self.__event_count = 0
+            self.__update_count = 0
+            self.__parent.begin_interaction(resize=True)
+        return True  # widgets underneath the zones don't see the mouse, like with resize handles on top of them
+
+    def __set_zone(self, zone: Optional[str], pos: Optional[QPoint]) -> None:
+        """Shows the resize cursor of the zone, or restores the cursor of the widget under the mouse"""
+        if zone == self.__zone or self.__handle is None or not shiboken2.isValid(self.__handle):
+            self.__zone = zone
+            return
+        self.__zone = zone
+        if zone is not None:
+            self.__handle.setCursor(self.CURSORS[zone])
+        else:
+            widget = self.__parent.childAt(pos) if pos is not None else None
+            self.__handle.setCursor((widget if widget is not None else self.__parent).cursor())
+
+    def __get_geometry(self, global_pos: QPoint) -> QRect:
+        """Returns the window geometry for a mouse position, keeping the edges opposite the dragged zone in place"""
+        assert self.__zone is not None
+        delta: QPoint = global_pos - self.__mouse_pos
+        start: QRect = self.__window_geometry
+        minimum_width: int = self.__parent.minimumSize().width()
+        minimum_height: int = self.__parent.minimumSize().height()
+        geometry = QRect(start)
+        if self.RIGHT in self.__zone:
+            geometry.setWidth(start.width() + delta.x())
+        elif self.LEFT in self.__zone:
+            width = max(start.width() - delta.x(), minimum_width)
+            geometry.setRect(start.x() + start.width() - width, start.y(), width, start.height())
+        if self.BOTTOM in self.__zone:
+            geometry.setHeight(start.height() + delta.y())
+        elif self.TOP in self.__zone:
+            height = max(start.height() - delta.y(), minimum_height)
+            geometry.setRect(geometry.x(), start.y() + start.height() - height, geometry.width(), height)
+        if geometry.width() < minimum_width:
+            geometry.setWidth(minimum_width)
+        if geometry.height() < minimum_height:
+            geometry.setHeight(minimum_height)
+        return geometry
+
+    def __apply_geometry(self, geometry: QRect) -> None:
+        """Resizes the window, unless it already has the geometry"""
+        if geometry != self.__parent.geometry():
             self.__parent.setGeometry(geometry)
-            self.adjust_resizers(geometry)
-
-    def adjust_resizers(self, geometry: QRect) -> None:
-        """Top, Left, Right, Bottom resizers are 4 px wide, corner resizers are 8x8 pixels"""
-        radius: int = self.__radius if self.__parent.use_shadow and not self.__parent.maximized else 0
-        cr = QRect(0 + radius,
-                   0 + radius,
-                   geometry.width() - radius * 2,
-                   geometry.height() - radius * 2)
-        r_width: int = 4  # resizer width/height
-        c_width: int = 8  # corner width/height
-        crx: int = cr.x()
-        cry: int = cr.y()
-        crw: int = cr.width()
-        crw_sr: int = crw + radius - r_width
-        crh: int = cr.height()
-        crh_sr: int = crh + radius - r_width
-        self.__parent.resizer_top.setGeometry(crx + c_width, cry, crw - c_width * 2, r_width)
-        self.__parent.resizer_bot.setGeometry(crx + c_width, crh_sr, crw - c_width * 2, r_width)
-        self.__parent.resizer_lef.setGeometry(crx, cry + c_width, r_width, crh - c_width * 2)
-        self.__parent.resizer_rig.setGeometry(crw_sr, cry + c_width, r_width, crh - c_width * 2)
-        self.__parent.resizer_tr.setGeometry(crw - c_width + radius, cry, c_width, c_width)
-        self.__parent.resizer_br.setGeometry(crw - c_width + radius, crh - c_width + radius, c_width, c_width)
-        self.__parent.resizer_bl.setGeometry(crx, crh - c_width + radius, c_width, c_width)
-        self.__parent.resizer_tl.setGeometry(crx, cry, c_width, c_width)
-
-    def mouseReleaseEvent(self, _: QMouseEvent) -> None:
-        """Qt Mouse-Release Event"""
-        self.__mouse_pressed = False
+            self.__update_count += 1
@@ -0,0 +1,126 @@
+import math
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from PySide2.QtCore import QRect, QRectF, QSize
+from PySide2.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
+from PySide2.QtGui import Qt, QColor, QImage, QPainter, QPen, QBrush, QPixmap
+from qtmodernredux.windowstyle.windowframe import NINE_SLICE_MARGIN_PX
+
+
+__author__ = "Robert Kist"
+
+
+"""
+Drop-shadow for windows on platforms where the window manager doesn't add one.
+A QGraphicsDropShadowEffect on the window renders the whole window into an offscreen pixmap and blurs it on every
+update, e.g. for every key press in a line edit. Instead, the shadow of the smallest window frame is blurred once per
+(blur radius, corner radius, color, device pixel ratio) into a nine-slice pixmap, which is shared by all windows.
+Windows draw its corners and stretch its edges into the margin around their frame, so updates of the window's
+content never blur anything.
+"""
+
+
+SHADOW_CACHE_SIZE: int = 16  # shadow pixmaps, e.g. 1 per style and screen
+BLACK: QColor = QColor(Qt.black)
+
+
+def get_shadow_corner_size(radius: int, corner_radius: int) -> int:
+    """
+    Returns the size of the corner slices of the shadow pixmap: the margin plus the frame's rounded corner, plus the
+    blur radius, so that the edge slices in between are the same as the edges of the shadow of any larger frame
+    """
+    return radius + corner_radius + NINE_SLICE_MARGIN_PX + radius
+
+
+@lru_cache(maxsize=SHADOW_CACHE_SIZE)
+def get_shadow_pixmap(radius: int, corner_radius: int, rgba: int, device_pixel_ratio: float) -> QPixmap:
+    """
+    Returns the drop-shadow of the smallest window frame from which the shadow of any larger frame can be drawn,
+    including the margin of radius pixels around the frame. The shadow is blurred by a QGraphicsDropShadowEffect,
+    exactly like the effect would blur the window, but only the shadow is kept, not the frame on top of it.
+    """
+    size: int = get_shadow_corner_size(radius, corner_radius) * 2 + 1
+    frame_size: int = size - radius * 2
+    # the frame's shape, as WindowFrame paints it. QGraphicsDropShadowEffect blurs in device pixels
+    frame: QImage = QImage(math.ceil(frame_size * device_pixel_ratio), math.ceil(frame_size * device_pixel_ratio),
+                           QImage.Format_ARGB32_Premultiplied)
+    frame.setDevicePixelRatio(device_pixel_ratio)
+    frame.fill(Qt.transparent)
+    painter = QPainter(frame)
+    painter.setPen(QPen(BLACK))
+    painter.setBrush(QBrush(BLACK))
+    painter.drawRoundedRect(QRect(0, 0, frame_size, frame_size), corner_radius, corner_radius)
+    painter.end()
+    frame.setDevicePixelRatio(1.0)
+    # the effect draws the frame on top of the shadow, so the shadow is moved next to the frame and copied alone
+    margin: int = math.ceil(radius * device_pixel_ratio)
+    offset: int = frame.width() + margin
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(radius)
+    effect.setColor(QColor.fromRgba(rgba))
+    effect.setOffset(offset, 0)
+    item = QGraphicsPixmapItem(QPixmap.fromImage(frame))
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+    scene_image: QImage = QImage(offset + frame.width() + margin * 2, frame.height() + margin * 2,
+                                 QImage.Format_ARGB32_Premultiplied)
+    scene_image.fill(Qt.transparent)
+    painter = QPainter(scene_image)
+    scene.render(painter, QRectF(scene_image.rect()), QRectF(scene_image.rect()).translated(-margin, -margin))
+    painter.end()
+    pixmap = QPixmap.fromImage(scene_image.copy(offset, 0, frame.width() + margin * 2, frame.height() + margin * 2))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+class WindowShadow:
+    """Paints the drop-shadow of a window from the shared nine-slice pixmap"""
+
+    def __init__(self, radius: int, corner_radius: int, color: QColor) -> None:
+        """Constructor: radius is the blur radius and margin around the window frame, color includes the opacity"""
+        self.__radius: int = radius
+        self.__corner_radius: int = corner_radius
+        self.__rgba: int = color.rgba()
+        # nine-slice layout: (size, device pixel ratio) it was made for, (target, source) of the slices
+        self.__layout_key: Optional[Tuple[QSize, float]] = None
+        self.__slices: List[Tuple[QRectF, QRectF]] = []
+        self.__center: QRect = QRect()  # area covered by the window frame which has no shadow slices
+
+    def set_color(self, color: QColor) -> None:
+        """Sets the shadow color, which includes the opacity"""
+        self.__rgba = color.rgba()
+
+    def needs_paint(self, rect: QRect) -> bool:
+        """Returns true if the shadow is visible in the rectangle, e.g. the rectangle of a paint event"""
+        return not self.__center.contains(rect)
+
+    def paint(self, painter: QPainter, size: QSize, device_pixel_ratio: float) -> None:
+        """Paints the shadow of a window of the given size, including the margin, with the shadow's corners"""
+        if (size, device_pixel_ratio) != self.__layout_key:
+            self.__update_slices(size, device_pixel_ratio)
+        pixmap = get_shadow_pixmap(self.__radius, self.__corner_radius, self.__rgba, device_pixel_ratio)
+        for target, source in self.__slices:
+            painter.drawPixmap(target, pixmap, source)
+
+    def __update_slices(self, size: QSize, ratio: float) -> None:
+        """
+        Lays out the nine-slice pixmap for the window size: the corners are drawn as they are, the edges are
+        stretched. The center is covered by the window frame, so it isn't drawn.
+        """
+        w: int = size.width()
+        h: int = size.height()
+        corner: int = min(get_shadow_corner_size(self.__radius, self.__corner_radius), (w - 1) // 2, (h - 1) // 2)
+        source_corner: int = get_shadow_corner_size(self.__radius, self.__corner_radius)
+        # (target position, target size, source position, source size) in device-independent pixels
+        columns = ((0, corner, 0, corner), (corner, w - corner * 2, source_corner, 1),
+                   (w - corner, corner, source_corner * 2 + 1 - corner, corner))
+        rows = ((0, corner, 0, corner), (corner, h - corner * 2, source_corner, 1),
+                (h - corner, corner, source_corner * 2 + 1 - corner, corner))
+        self.__slices = [(QRectF(x, y, width, height),
+                          QRectF(source_x * ratio, source_y * ratio, source_width * ratio, source_height * ratio))
+                         for x, width, source_x, source_width in columns
+                         for y, height, source_y, source_height in rows
+                         if x != corner or y != corner]
+        self.__center = QRect(corner, corner, w - corner * 2, h - corner * 2)
+        self.__layout_key = (QSize(size), ratio)
@@ -1,13 +1,19 @@
 import sys
-from typing import Any
-from PySide2.QtCore import QRectF, QRect
+from typing import Any, Optional, Tuple
+from PySide2.QtCore import QRectF, QRect, QEvent
 from PySide2.QtWidgets import QMessageBox, QLabel
-from PySide2.QtGui import Qt, QColor, QPainter, QPen, QPaintEvent, QFontMetrics, QBrush
+from PySide2.QtGui import Qt, QColor, QPainter, QPen, QPaintEvent, QFont, QFontMetrics, QBrush, QStaticText, QTransform
 
 
 __author__ = "Robert Kist"
 
 
+"""
+The window title is elided and laid out once per text, label width, font and device pixel ratio. The result is kept
+as a QStaticText, so repaints, e.g. on focus changes, only draw the prepared glyphs.
+"""
+
+
 QDIALOG_TYPES = (QMessageBox)
 WINDOW_BUTTONS_RIGHT: str = 'window_buttons_right'
 WIDTH_PADDING_PX = 3  # add 2 pixel padding to width of titlebar text
@@ -20,7 +26,7 @@ class WindowTitleLabel(QLabel):
     def __init__(self,
                  text: str,
                  height: int,
-                 color: QColor,
+                 pen: QPen,
                  parent: Any,
                  window_buttons_position: str,
                  button_bar_width: int,
@@ -30,7 +36,7 @@ class WindowTitleLabel(QLabel):
         Constructor
         test: titlebar text
         height: titlebar height in pixels
-        color: titlebar text color
+        pen: titlebar text pen, e.g. the theme's titlebar_text_pen
         parent: parent widget
         window_buttons_position: WINDOW_BUTTONS_RIGHT or WINDOW_BUTTONS_RIGHT
         button_bar_width: combined width of all buttons in pixels
@@ -40,8 +46,15 @@ class WindowTitleLabel(QLabel):
         super().__init__(parent)
         self.__original_text: str = text
         self.__ofs_y: float = height / 2.0
-        self.__font_pen: QPen = QPen(color)
+        self.__font_pen: QPen = pen
+        self.__font: Optional[QFont] = None  # title font, derived from the widget's font on first paint
+        self.__font_metrics: Optional[QFontMetrics] = None
         self.__br_height: int = 0
+        # laid-out title: (text, label width, device pixel ratio), title text, text rectangle
+        self.__layout_key: Optional[Tuple[str, int, float]] = None
+        self.__static_text: QStaticText = QStaticText()
+        self.__static_text.setTextFormat(Qt.PlainText)
+        self.__text_rect: QRectF = QRectF()
         self.__window_buttons_position: str = window_buttons_position
         self.__margin: int = margin
         self.__button_bar_width: int = button_bar_width + margin
@@ -50,16 +63,30 @@ class WindowTitleLabel(QLabel):
         self.setMinimumWidth(minimum_width)
 
     def paintEvent(self, _: QPaintEvent) -> None:
-        """Qt Paint Event: ensures the title-bar text is elided properly and stays centered"""
+        """Qt Paint Event: draws the title, which is laid out again only if text, width, font or DPR have changed"""
+        layout_key = (self.__original_text, self.width(), self.devicePixelRatioF())
+        if layout_key != self.__layout_key:
+            self.__layout_title()
+            self.__layout_key = layout_key
+        assert self.__font is not None
         painter = QPainter()
         painter.begin(self)
         painter.setPen(self.__font_pen)
+        painter.setFont(self.__font)
+        if DEBUG:
+            painter.setBrush(QBrush(QColor('#ff0000')))
+            painter.drawRect(self.__text_rect)
+        painter.drawStaticText(self.__text_rect.topLeft(), self.__static_text)
 
+    def __layout_title(self) -> None:
+        """Ensures the title-bar text is elided properly and stays centered"""
         # bold font for macOS window titles
-        font = self.font()
-        if sys.platform in ["darwin", "linux"]:
-            font.setBold(True)
-        font_metrics = QFontMetrics(font)
+        if self.__font is None or self.__font_metrics is None:
+            self.__font = self.font()
+            if sys.platform in ["darwin", "linux"]:
+                self.__font.setBold(True)
+            self.__font_metrics = QFontMetrics(self.__font)
+        font_metrics = self.__font_metrics
 
         # calculate text properties
         text_width: int = self.width() - self.__button_bar_width - self.__margin
@@ -83,13 +110,23 @@ class WindowTitleLabel(QLabel):
             else:
                 px = self.__button_bar_width
 
-        # draw title
-        rect = QRectF(px, py, br_width + WIDTH_PADDING_PX, self.__br_height)
-        painter.setFont(font)
-        if DEBUG:
-            painter.setBrush(QBrush(QColor('#ff0000')))
-            painter.drawRect(rect)
-        painter.drawText(rect, Qt.AlignLeft, text)
+        self.__text_rect = QRectF(px, py, br_width + WIDTH_PADDING_PX, self.__br_height)
+        self.__static_text.setText(text)
+        self.__static_text.prepare(QTransform.fromScale(self.devicePixelRatioF(), self.devicePixelRatioF()),
+                                   self.__font)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Qt Change Event: the title font is derived again if the widget's font changes"""
+        if event.type() == QEvent.FontChange:
+            self.__font = None
+            self.__font_metrics = None
+            self.__layout_key = None
+        super().changeEvent(event)
+
+    def set_pen(self, pen: QPen) -> None:
+        """Sets the title text pen"""
+        self.__font_pen = pen
+        self.update()
 
     def setWindowTitle(self, title: str) -> None:
         """Sets the Window title string"""